@@ -0,0 +1,236 @@
+"""Frame-time benchmarks for a fixed set of representative scenes.
+
+Each scene is rendered at low quality in a fresh process with manim's caching
+off and no movie written (frames are still captured, then discarded), and its
+timings are compared against stored baselines:
+
+* ``construct_time``: seconds of ``render()`` spent outside frame rendering
+  (building mobjects, LaTeX, setup between animations)
+* ``mean_frame_time`` / ``p95_frame_time``: seconds per rendered frame, from the
+  animation step (``update_to_time``) to the end of the camera capture
+* ``peak_rss_mb``: peak resident memory of the render process
+
+Results go to ``media/benchmarks/results.json``. A metric regresses when it
+exceeds its baseline by more than ``--threshold`` (a fraction), and the run
+then exits with status 1. Scenes without a baseline are listed; when none of
+them has one nothing was compared, and the run exits with status 2.
+
+The timings only mean something on the machine that recorded them, so no
+baselines are committed: ``benchmarks/baselines.json`` doesn't exist in a
+fresh checkout, and the first run on a machine must record it (on a
+known-good commit) before later runs can compare against it:
+
+    python benchmark.py --save-baseline       # first run: record benchmarks/baselines.json
+    python benchmark.py                       # compare against it
+    python benchmark.py PCAIntro --threshold 0.25 --repeat 3
+"""
+
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from render_all import QUALITIES, ROOT, discover_scenes, load_scene_module, scene_id, select_scenes
+
+BENCHMARK_SCENES = [
+    "BigStrawBox",
+    "PCAIntro",
+    "SuperpositionAnimation",
+    "MLPZoomNetwork",
+    "WhatIsAFeature",
+    "NetworkCompressionVisualization",
+]
+METRICS = ["construct_time", "mean_frame_time", "p95_frame_time", "peak_rss_mb"]
+DEFAULT_RESULTS = ROOT / "media" / "benchmarks" / "results.json"
+DEFAULT_BASELINES = ROOT / "benchmarks" / "baselines.json"
+
+
+def benchmark_scene(path, scene_name, options):
+    """Render one scene without writing a movie and return its metrics."""
+    from manim import Scene, config
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    module = load_scene_module(path)
+    config.quality = QUALITIES[options["quality"]]
+    config.input_file = str(path)
+    config.media_dir = options["media_dir"]
+    config.write_to_movie = False
+    config.save_last_frame = False
+    config.disable_caching = True
+    config.preview = False
+    config.progress_bar = "none"
+    config.verbosity = "WARNING"
+
+    # A frame starts with the animation step and ends once the camera has
+    # captured it: play_internal calls update_to_time then renderer.render
+    frame_times = []
+    frame_start = [None]
+    update_to_time = Scene.update_to_time
+    render = CairoRenderer.render
+
+    def timed_update_to_time(scene, t):
+        frame_start[0] = time.perf_counter()
+        return update_to_time(scene, t)
+
+    def timed_render(renderer, *args, **kwargs):
+        result = render(renderer, *args, **kwargs)
+        if frame_start[0] is not None:
+            frame_times.append(time.perf_counter() - frame_start[0])
+            frame_start[0] = None
+        return result
+
+    Scene.update_to_time = timed_update_to_time
+    CairoRenderer.render = timed_render
+    start = time.perf_counter()
+    try:
+        getattr(module, scene_name)().render()
+    finally:
+        Scene.update_to_time = update_to_time
+        CairoRenderer.render = render
+    wall_time = time.perf_counter() - start
+
+    frame_times = np.array(frame_times)
+    return {
+        "scene": scene_id(path, scene_name),
+        "frames": len(frame_times),
+        "wall_time": round(wall_time, 4),
+        "construct_time": round(wall_time - frame_times.sum(), 4),
+        "mean_frame_time": round(float(frame_times.mean()), 6) if len(frame_times) else 0.0,
+        "p95_frame_time": round(float(np.percentile(frame_times, 95)), 6) if len(frame_times) else 0.0,
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def run_benchmarks(scenes, options, repeat=1, workers=1):
+    """Metrics per scene id; with ``repeat`` > 1 each metric is the best of the runs."""
+    runs = {}
+    # One fresh process per render, so memory and module state never carry over
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        futures = [pool.submit(benchmark_scene, path, name, options) for _ in range(repeat) for path, name in scenes]
+        for future in futures:
+            result = future.result()
+            runs.setdefault(result["scene"], []).append(result)
+    results = {}
+    for key, entries in runs.items():
+        best = dict(entries[0])
+        for metric in METRICS + ["wall_time"]:
+            best[metric] = min(entry[metric] for entry in entries)
+        results[key] = best
+    return results
+
+
+def compare(results, baselines, threshold):
+    """Regressions and the scenes without a baseline.
+
+    Regressions are (scene, metric, baseline, current) for every metric more
+    than ``threshold`` above baseline.
+    """
+    regressions = []
+    unmatched = []
+    for key, result in results.items():
+        baseline = baselines.get(key)
+        if baseline is None:
+            unmatched.append(key)
+            continue
+        for metric in METRICS:
+            if metric in baseline and result[metric] > baseline[metric] * (1 + threshold):
+                regressions.append((key, metric, baseline[metric], result[metric]))
+    return regressions, unmatched
+
+
+def load_json(path, default):
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return default
+
+
+def write_json(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
+
+
+def print_table(results, baselines):
+    print(f"{'scene':<58} {'frames':>6} {'construct':>10} {'mean ms':>8} {'p95 ms':>8} {'MB':>7}")
+    for key, r in sorted(results.items()):
+        line = (
+            f"{key:<58} {r['frames']:6d} {r['construct_time']:9.2f}s "
+            f"{r['mean_frame_time'] * 1000:8.1f} {r['p95_frame_time'] * 1000:8.1f} {r['peak_rss_mb']:7.1f}"
+        )
+        if key not in baselines:
+            line += "  (no baseline)"
+        print(line)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("patterns", nargs="*", help="SceneName or path:SceneName globs (default: the benchmark set)")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l", help="render quality (like manim -q)")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="parallel renders (1 keeps timings stable)")
+    parser.add_argument("--repeat", type=int, default=1, help="render each scene this many times, keep the best")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown over baseline, as a fraction")
+    parser.add_argument("--media-dir", default=str(ROOT / "media"), help="manim media directory")
+    parser.add_argument("--results", default=str(DEFAULT_RESULTS), help="where to write the JSON results")
+    parser.add_argument("--baselines", default=str(DEFAULT_BASELINES), help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baselines")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scenes = select_scenes(discover_scenes(), args.patterns or BENCHMARK_SCENES)
+    if not scenes:
+        print("No scenes matched.", file=sys.stderr)
+        return 1
+
+    options = {"quality": args.quality, "media_dir": args.media_dir}
+    results = run_benchmarks(scenes, options, args.repeat, args.workers)
+    write_json(
+        args.results,
+        {
+            "quality": QUALITIES[args.quality],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "scenes": results,
+        },
+    )
+
+    baselines = load_json(args.baselines, {})
+    print_table(results, baselines)
+    if args.save_baseline:
+        # Only the given scenes are replaced; the other baselines are kept
+        baselines.update({key: {metric: r[metric] for metric in METRICS} for key, r in results.items()})
+        write_json(args.baselines, baselines)
+        print(f"Saved baselines for {len(results)} scenes -> {args.baselines}")
+        return 0
+
+    regressions, unmatched = compare(results, baselines, args.threshold)
+    for key, metric, baseline, current in regressions:
+        change = f" (+{current / baseline - 1:.0%})" if baseline else ""
+        print(f"REGRESSION {key} {metric}: {baseline} -> {current}{change}")
+    if unmatched:
+        print(f"No baseline for {len(unmatched)} of {len(results)} scenes: {', '.join(sorted(unmatched))}", file=sys.stderr)
+    if len(unmatched) == len(results):
+        print(
+            f"Nothing compared: {args.baselines} is missing or has none of these scenes "
+            "(record it with --save-baseline)",
+            file=sys.stderr,
+        )
+        return 2
+    if not regressions:
+        compared = len(results) - len(unmatched)
+        print(f"No regressions over {args.threshold:.0%} in {compared} scenes -> {args.results}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
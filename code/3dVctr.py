@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+from backdrop import FeatureSpaceBackdrop
+
 
 class VectorProjection3Dto2D(ThreeDScene):
     def construct(self):
@@ -8,40 +10,8 @@ class VectorProjection3Dto2D(ThreeDScene):
         start_distance = 8.0
         self.set_camera_orientation(phi=85 * DEGREES, theta=30 * DEGREES, distance=start_distance, zoom=1.5)
 
-        grid = NumberPlane(
-            x_range=(-5, 5, 1),
-            y_range=(-5, 5, 1),
-            background_line_style={
-                "stroke_color": BLUE_E,
-                "stroke_width": 1,
-                "stroke_opacity": 0.5,
-            },
-            axis_config={"include_numbers": False},
-        )
-
-        vertical_lines = VGroup(
-            *[
-                Line(
-                    start=grid.c2p(x, y, 0),
-                    end=grid.c2p(x, y, 5),
-                    color=BLUE_E,
-                    stroke_width=1,
-                    stroke_opacity=0.5,
-                )
-                for x in range(-5, 6)
-                for y in range(-5, 6)
-            ]
-        )
-
-        axes = ThreeDAxes(
-            x_range=(-5, 5, 1),
-            y_range=(-5, 5, 1),
-            z_range=(0, 5, 1),
-            x_length=10,
-            y_length=10,
-            z_length=5,
-            axis_config={"color": WHITE, "include_tip": False, "include_numbers": False},
-        )
+        # 2-D grid on the xy-plane (z = 0), vertical helper lines for depth perception, 3-D axes
+        grid, vertical_lines, axes = FeatureSpaceBackdrop()
 
         # Add static elements to match the reference scene
         self.add(grid, vertical_lines, axes)
@@ -1,7 +1,11 @@
 from manim import *
 import numpy as np
 
-class Vectors3D(ThreeDScene):
+from cached_text import face_camera
+from depth_order import DepthOrderedScene
+from mesh_lod import LODArrow3D
+
+class Vectors3D(DepthOrderedScene, ThreeDScene):
     def construct(self):
         # Set up the 3D axes
         axes = ThreeDAxes(
@@ -51,60 +55,55 @@ class Vectors3D(ThreeDScene):
         # Compute the axes' origin in scene coordinates
         origin = axes.coords_to_point(0, 0, 0)
 
-        # Create vectors as arrows from origin
-        vector_a = Arrow3D(
+        # Create vectors as arrows from origin, with mesh resolution following the camera
+        vector_a = LODArrow3D(
             start=origin, 
             end=axes.coords_to_point(*vector_a_coords),
             color=RED,
             thickness=0.02,
             height=0.3,
-            base_radius=0.05
+            base_radius=0.05,
+            camera=self.camera,
         )
         
-        vector_b = Arrow3D(
+        vector_b = LODArrow3D(
             start=origin,
             end=axes.coords_to_point(*vector_b_coords),
             color=GREEN,
             thickness=0.02,
             height=0.3,
-            base_radius=0.05
+            base_radius=0.05,
+            camera=self.camera,
         )
         
-        vector_c = Arrow3D(
+        vector_c = LODArrow3D(
             start=origin,
             end=axes.coords_to_point(*vector_c_coords),
             color=BLUE,
             thickness=0.02,
             height=0.3,
-            base_radius=0.05
+            base_radius=0.05,
+            camera=self.camera,
         )
         
-        # Create labels that always face the camera (billboard-style)
-        label_a = always_redraw(
-            lambda: Tex(r"$\vec{a}(2, 1, -2)$", color=RED)
-            .scale(0.8)
-            .move_to(axes.coords_to_point(*vector_a_coords) + np.array([0.25, 0.15, 0.2]))
-            .rotate(-self.camera.get_phi(), axis=RIGHT)
-            .rotate(self.camera.get_theta(), axis=UP)
-            .rotate(PI, axis=OUT)
+        # Labels that always face the camera (billboard-style); each Tex is
+        # compiled once and only its cached points are re-rotated per frame
+        label_a = face_camera(
+            Tex(r"$\vec{a}(2, 1, -2)$", color=RED).scale(0.8),
+            self.camera,
+            axes.coords_to_point(*vector_a_coords) + np.array([0.25, 0.15, 0.2]),
         )
 
-        label_b = always_redraw(
-            lambda: Tex(r"$\vec{b}(1, 3, 1)$", color=GREEN)
-            .scale(0.8)
-            .move_to(axes.coords_to_point(*vector_b_coords) + np.array([0.2, 0.25, 0.2]))
-            .rotate(-self.camera.get_phi(), axis=RIGHT)
-            .rotate(self.camera.get_theta(), axis=UP)
-            .rotate(PI, axis=OUT)
+        label_b = face_camera(
+            Tex(r"$\vec{b}(1, 3, 1)$", color=GREEN).scale(0.8),
+            self.camera,
+            axes.coords_to_point(*vector_b_coords) + np.array([0.2, 0.25, 0.2]),
         )
 
-        label_c = always_redraw(
-            lambda: Tex(r"$\vec{c}(-1, 2, 3)$", color=BLUE)
-            .scale(0.8)
-            .move_to(axes.coords_to_point(*vector_c_coords) + np.array([-0.25, 0.2, 0.2]))
-            .rotate(-self.camera.get_phi(), axis=RIGHT)
-            .rotate(self.camera.get_theta(), axis=UP)
-            .rotate(PI, axis=OUT)
+        label_c = face_camera(
+            Tex(r"$\vec{c}(-1, 2, 3)$", color=BLUE).scale(0.8),
+            self.camera,
+            axes.coords_to_point(*vector_c_coords) + np.array([-0.25, 0.2, 0.2]),
         )
         
         # Set camera orientation for better 3D view
@@ -1,8 +1,9 @@
 from manim import *
 import numpy as np
-import random
 
-class NetworkCompressionVisualization(Scene):
+from seeding import SeededScene
+
+class NetworkCompressionVisualization(SeededScene, Scene):
     def construct(self):
         # Create the large virtual network (right side)
         large_network = self.create_large_sparse_network()
@@ -69,10 +70,9 @@ class NetworkCompressionVisualization(Scene):
         for i in range(len(layers) - 1):
             for node1 in layers[i]:
                 # Only connect to some nodes in the next layer (sparse)
-                connected_nodes = random.sample(layers[i + 1], 
-                                              min(3, len(layers[i + 1])))
-                for node2 in connected_nodes:
-                    if np.random.random() > 0.7:  # Make it even sparser
+                picks = self.rng.choice(len(layers[i + 1]), min(3, len(layers[i + 1])), replace=False)
+                for node2 in (layers[i + 1][k] for k in picks):
+                    if self.rng.random() > 0.7:  # Make it even sparser
                         line = Line(node1.get_center(), node2.get_center(), 
                                   color=BLUE, stroke_width=1, stroke_opacity=0.3)
                         group.add(line)
@@ -107,7 +107,7 @@ class NetworkCompressionVisualization(Scene):
             for node1 in layers[i]:
                 for node2 in layers[i + 1]:
                     # Dense connections (most nodes connected)
-                    if np.random.random() > 0.2:
+                    if self.rng.random() > 0.2:
                         line = Line(node1.get_center(), node2.get_center(), 
                                   color=GREEN, stroke_width=1.5, stroke_opacity=0.7)
                         group.add(line)
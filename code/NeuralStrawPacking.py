@@ -12,10 +12,15 @@ from manim import (
     FadeOut,
     Write,
     Tex,
+    VGroup,
 )
 import numpy as np
 
-class NeuralStrawPacking(Scene):
+from group_fade import FadeOutGroup
+from seeding import SeededScene
+from straw_packing import pack_straws
+
+class NeuralStrawPacking(SeededScene, Scene):
     def construct(self):
         
         # Create the box for straws (left side)
@@ -32,6 +37,28 @@ class NeuralStrawPacking(Scene):
         features = []
         feature_labels = []
         num_straws = 12
+        straw_length = 1.5
+        angles = np.arange(num_straws) * PI / num_straws
+
+        # Non-overlapping straw positions inside the box (lines keep clear of
+        # each other by their stroke width plus a small gap)
+        packing = pack_straws(
+            num_straws,
+            size=[3.8, 2.8],
+            length=straw_length,
+            radius=0.03,
+            gap=0.04,
+            directions=np.stack([np.cos(angles), np.sin(angles)], axis=1),
+            center=[-3.2, 0],
+            rng=self.rng,
+            max_attempts=500,
+            # About one packing in seven places all 12; 100 restarts never ran out
+            # over 400 seeds
+            restarts=100,
+            batch_size=64,
+            complete=True,
+        )
+        straw_centers = dict(zip(packing.indices.tolist(), packing.centers))
         
         # Show containers and labels
         self.play(
@@ -47,15 +74,10 @@ class NeuralStrawPacking(Scene):
         # Auto-pack straws with optimal angular distribution
         for i in range(num_straws):
             # Calculate optimal angle for this straw
-            angle = (i * PI) / num_straws
+            angle = angles[i]
             
-            # Create straw in the box
-            straw_length = 1.5
-            straw_center = np.array([-3.2, 0, 0]) + np.array([
-                (np.random.random() - 0.5) * 2,  # Random x offset
-                (np.random.random() - 0.5) * 1,  # Random y offset
-                0
-            ])
+            # Create straw in the box, at its packed position
+            straw_center = np.append(straw_centers[i], 0)
             
             # Create straw as a line
             straw_start = straw_center + 0.5 * straw_length * np.array([np.cos(angle), np.sin(angle), 0])
@@ -100,8 +122,8 @@ class NeuralStrawPacking(Scene):
             FadeOut(feature_center),
             FadeOut(box_label),
             FadeOut(angle_label),
-            *[FadeOut(straw) for straw in straws],
-            *[FadeOut(feature) for feature in features],
-            *[FadeOut(label) for label in feature_labels],
+            FadeOutGroup(VGroup(*straws)),
+            FadeOutGroup(VGroup(*features)),
+            FadeOutGroup(VGroup(*feature_labels)),
             run_time=1
         )
\ No newline at end of file
@@ -1,9 +1,12 @@
 from manim import *
 import numpy as np
 
-class StrawDirectionConstraint3D(ThreeDScene):
+from depth_order import DepthOrderedScene
+from mesh_lod import LODCylinder
+
+class StrawDirectionConstraint3D(DepthOrderedScene, ThreeDScene):
     def construct(self):
-        # Set up 3D camera
+        # Set up 3D camera (the straws pick their mesh resolution from it, see mesh_lod.py)
         self.set_camera_orientation(phi=60 * DEGREES, theta=-45 * DEGREES)
         
         
@@ -14,8 +17,9 @@ class StrawDirectionConstraint3D(ThreeDScene):
         
         # Group 1: Horizontal parallel straws
         for i in range(3):
-            straw = Cylinder(
+            straw = LODCylinder(
                 radius=0.08,
+                camera=self.camera,
                 height=3,
                 direction=RIGHT,
             )
@@ -27,8 +31,9 @@ class StrawDirectionConstraint3D(ThreeDScene):
         
         # Group 2: Diagonal parallel straws
         for i in range(2):
-            straw = Cylinder(
+            straw = LODCylinder(
                 radius=0.08,
+                camera=self.camera,
                 height=2.5,
                 direction=normalize(RIGHT + UP + OUT * 0.5),
             )
@@ -39,16 +44,18 @@ class StrawDirectionConstraint3D(ThreeDScene):
             diagonal_parallel_straws.add(straw)
         
         # Create two initial demonstration straws (blue), one from each group's orientation
-        initial_horizontal_straw = Cylinder(
+        initial_horizontal_straw = LODCylinder(
             radius=0.08,
+            camera=self.camera,
             height=3,
             direction=RIGHT,
             fill_color=None,
             fill_opacity=0.9,
             stroke_width=0,
         )
-        initial_diagonal_straw = Cylinder(
+        initial_diagonal_straw = LODCylinder(
             radius=0.08,
+            camera=self.camera,
             height=2.5,
             direction=normalize(RIGHT + UP + OUT * 0.5),
             fill_color=None,
@@ -71,8 +78,9 @@ class StrawDirectionConstraint3D(ThreeDScene):
         
         # Create straws with unique directions
         for i, direction in enumerate(directions):
-            straw = Cylinder(
+            straw = LODCylinder(
                 radius=0.08,
+                camera=self.camera,
                 height=2.5 + i * 0.2,
                 direction=direction,
                 fill_color=None,
@@ -0,0 +1,189 @@
+"""Arrows that can be re-aimed in place, one at a time or in batches.
+
+Rebuilding an ``Arrow3D`` every frame (``vector.become(Arrow3D(...))``) builds
+a new cylinder and cone surface mesh per vector per frame. The arrows here keep
+the geometry they were built with as a template and re-aim it to a new start
+and end with a few array operations: the shaft is rotated and stretched, the
+tip is rotated and moved rigidly so it keeps its size. As with ``Arrow``'s
+``max_tip_length_to_length_ratio``, an arrow too short for its tip gets a
+scaled-down tip instead, down to nothing for a zero-length arrow.
+
+    vectors = VGroup(*[AimableArrow3D(ORIGIN, 2 * d, color=c) for d, c in zip(dirs, colors)])
+    self.play(AimArrows(vectors, ORIGIN, dirs, target_dirs, length=2, run_time=4))
+
+``aim_arrows`` re-aims a whole list of arrows from (N, 3) start and end arrays
+in one vectorized pass, for scenes with hundreds of feature vectors.
+"""
+import numpy as np
+from manim import *
+
+# Longest tip, as a fraction of the arrow's length, for arrows without their own
+# max_tip_length_to_length_ratio (Arrow's default)
+MAX_TIP_TO_LENGTH = 0.25
+
+
+def _unit_rows(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 1e-12, norms, 1.0)
+
+
+def rotations_between(a, b):
+    """(N, 3, 3) rotations taking the unit vectors ``a[i]`` to ``b[i]`` (Rodrigues)."""
+    v = np.cross(a, b)
+    c = np.sum(a * b, axis=1)
+    skew = np.zeros((len(a), 3, 3))
+    skew[:, 0, 1], skew[:, 0, 2], skew[:, 1, 2] = -v[:, 2], v[:, 1], -v[:, 0]
+    skew -= skew.transpose(0, 2, 1)
+    opposite = c < -1 + 1e-9
+    scale = 1 / np.where(opposite, 1.0, 1 + c)
+    rotations = np.eye(3) + skew + (skew @ skew) * scale[:, None, None]
+    if opposite.any():
+        # Half turn about any axis perpendicular to a
+        helper = np.where(np.abs(a[opposite, :1]) < 0.9, RIGHT, UP)
+        u = _unit_rows(np.cross(a[opposite], helper))
+        rotations[opposite] = 2 * u[:, :, None] * u[:, None, :] - np.eye(3)
+    return rotations
+
+
+def interpolate_directions(start_directions, end_directions, alpha):
+    """Normalized linear interpolation between two (N, 3) arrays of directions."""
+    return _unit_rows(interpolate(np.asarray(start_directions), np.asarray(end_directions), alpha))
+
+
+class _AimableMixin:
+    def _capture_aim(self, start, end, tip, buff=0.0):
+        """Record the current geometry as the template later aims are mapped from."""
+        start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+        length = np.linalg.norm(end - start)
+        direction = (end - start) / length
+        members = self.family_members_with_points()
+        points = np.concatenate([m.points for m in members])
+        relative = points - start
+        axial = relative @ direction
+        tip_members = tip.family_members_with_points()
+        is_tip = np.concatenate([np.full(len(m.points), m in tip_members) for m in members])
+        shaft_length = np.min(axial[is_tip])
+        max_tip_ratio = getattr(self, "max_tip_length_to_length_ratio", MAX_TIP_TO_LENGTH)
+        self._aim = {
+            "direction": direction,
+            "length": length,
+            "shaft_length": shaft_length,
+            # Never shrink the tip at the length the arrow was built with
+            "max_tip_ratio": max(max_tip_ratio, (length - shaft_length) / length),
+            "buff": buff,
+            "axial": axial,
+            "radial": relative - axial[:, None] * direction,
+            "is_tip": is_tip,
+        }
+
+    def put_start_and_end_on(self, start, end):
+        if "_aim" not in self.__dict__:
+            # Arrow's constructor places its own points before the template exists
+            return super().put_start_and_end_on(start, end)
+        aim_arrows([self], [start], [end])
+        return self
+
+    def _aimed(self, start, end, tip_length):
+        """Called by ``aim_arrows`` once the points have moved."""
+
+
+class AimableArrow(_AimableMixin, Arrow):
+    """``Arrow`` whose ``put_start_and_end_on`` re-aims the existing points (see module docs)."""
+
+    def __init__(self, start=LEFT, end=RIGHT, **kwargs):
+        super().__init__(start, end, **kwargs)
+        start, end = self.get_start(), self.get_end()
+        self._capture_aim(start, end, self.tip, buff=self.buff)
+
+
+class AimableArrow3D(_AimableMixin, Arrow3D):
+    """``Arrow3D`` whose ``put_start_and_end_on`` re-aims the existing cylinder and cone."""
+
+    def __init__(self, start=LEFT, end=RIGHT, **kwargs):
+        super().__init__(start=start, end=end, **kwargs)
+        self._capture_aim(start, end, self.cone)
+
+    def _aimed(self, start, end, tip_length):
+        # Keep Line3D's bookkeeping (used by get_start/get_end) in step with the points
+        self.direction = normalize(end - start)
+        self.start = start
+        self.end = end - tip_length * self.direction
+
+
+def aim_arrows(arrows, starts, ends):
+    """Re-aim aimable ``arrows`` to (N, 3) ``starts`` and ``ends`` in one vectorized pass.
+
+    ``starts`` may also be a single point shared by all arrows. As with the
+    arrow constructors, each arrow's ``buff`` is taken off both ends. Tips are
+    scaled down on arrows too short for them (see module docs).
+    """
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    starts = np.broadcast_to(np.asarray(starts, dtype=float), ends.shape)
+    templates = [arrow._aim for arrow in arrows]
+    old_directions = np.array([t["direction"] for t in templates])
+    offsets = ends - starts
+    # A zero-length arrow has no direction of its own: keep the template's
+    degenerate = np.linalg.norm(offsets, axis=1) < 1e-12
+    directions = np.where(degenerate[:, None], old_directions, _unit_rows(offsets))
+    buffs = np.array([t["buff"] for t in templates])[:, None]
+    # As in Line, a buff longer than half the arrow is ignored
+    buffs = np.where(np.linalg.norm(offsets, axis=1, keepdims=True) < 2 * buffs, 0.0, buffs)
+    starts = starts + buffs * directions
+    ends = ends - buffs * directions
+    lengths = np.linalg.norm(ends - starts, axis=1)
+
+    old_lengths = np.array([t["length"] for t in templates])
+    shaft_lengths = np.array([t["shaft_length"] for t in templates])
+    max_tip_ratios = np.array([t["max_tip_ratio"] for t in templates])
+    tip_lengths = old_lengths - shaft_lengths
+    # Tips shrink (about their base, in every direction) once they would pass the ratio
+    tip_scale = np.minimum(1.0, max_tip_ratios * lengths / tip_lengths)
+    new_tip_lengths = tip_lengths * tip_scale
+    stretch = (lengths - new_tip_lengths) / shaft_lengths
+    rotations = rotations_between(old_directions, directions)
+
+    # Per-point arrays of all arrows, with the index of the arrow each belongs to
+    counts = [len(t["axial"]) for t in templates]
+    owner = np.repeat(np.arange(len(templates)), counts)
+    axial = np.concatenate([t["axial"] for t in templates])
+    radial = np.concatenate([t["radial"] for t in templates])
+    is_tip = np.concatenate([t["is_tip"] for t in templates])
+
+    # The shaft stretches to the new length, the tip moves with the end (scaled if need be)
+    scale = np.where(is_tip, tip_scale[owner], 1.0)
+    tip_base = (lengths - new_tip_lengths)[owner]
+    new_axial = np.where(is_tip, tip_base + (axial - shaft_lengths[owner]) * scale, axial * stretch[owner])
+    points = (
+        starts[owner]
+        + new_axial[:, None] * directions[owner]
+        + np.einsum("nij,nj->ni", rotations[owner], radial * scale[:, None])
+    )
+
+    offset = 0
+    for arrow, start, end, tip_length in zip(arrows, starts, ends, new_tip_lengths):
+        for member in arrow.family_members_with_points():
+            size = len(member.points)
+            member.points = points[offset:offset + size]
+            offset += size
+        arrow._aimed(start, end, tip_length)
+    return arrows
+
+
+class AimArrows(Animation):
+    """Swing aimable arrows from ``start_directions`` to ``end_directions``.
+
+    Both direction arrays are (N, 3); ``origins`` is one point or (N, 3), and
+    ``length`` a scalar or length-N array. Directions are interpolated with
+    ``interpolate_directions``.
+    """
+
+    def __init__(self, arrows, origins, start_directions, end_directions, length=1.0, **kwargs):
+        self.origins = np.asarray(origins, dtype=float)
+        self.start_directions = np.asarray(start_directions, dtype=float)
+        self.end_directions = np.asarray(end_directions, dtype=float)
+        self.lengths = np.broadcast_to(np.asarray(length, dtype=float), len(self.start_directions))
+        super().__init__(arrows, **kwargs)
+
+    def interpolate_mobject(self, alpha):
+        directions = interpolate_directions(self.start_directions, self.end_directions, self.rate_func(alpha))
+        aim_arrows(self.mobject.submobjects, self.origins, self.origins + self.lengths[:, None] * directions)
@@ -0,0 +1,107 @@
+"""Low-interference arrangements of n feature directions in d dimensions.
+
+The feature scenes used to hard-code five directions (the tetrahedron vertices
+plus one golden-ratio vector). ``solve_arrangement`` computes an arrangement for
+any n and d instead, so "20 features in 3-D" or "500 features in 64-D" is a
+parameter change:
+
+    directions = solve_arrangement(5, 3)                      # (5, 3) unit rows
+    directions = solve_arrangement(500, 64, objective="thomson")
+
+Objectives (both computed from the full Gram matrix ``G = X X^T``):
+
+* ``"max_cos"``: the largest |cos| between two directions, i.e. the worst-case
+  interference. It is minimized through a smooth p-norm of the off-diagonal of
+  ``G`` whose p grows during the run.
+* ``"thomson"``: the electrostatic energy sum 1 / |x_i - x_j| of unit charges on
+  the sphere.
+
+All restarts run together as one batch of (restarts, n, d) arrays, using
+projected gradient descent on the unit sphere. The best restart is cached on
+disk under the media dir, keyed by the solver parameters and
+``SOLVER_VERSION``: bump it with any change to ``_solve`` (or its defaults)
+that changes its results, so scenes framed around specific vectors don't keep
+getting the old arrangements.
+"""
+import numpy as np
+
+from disk_cache import cached_points
+
+OBJECTIVES = ("max_cos", "thomson")
+# Part of the cache key; bump when the solver's results change
+SOLVER_VERSION = 1
+
+
+def _unit_rows(x):
+    return x / np.linalg.norm(x, axis=-1, keepdims=True)
+
+
+def max_abs_cos(directions):
+    """Largest |cos| between two different rows of ``directions`` (batched over leading axes)."""
+    x = _unit_rows(np.asarray(directions, dtype=float))
+    gram = np.abs(x @ np.swapaxes(x, -1, -2))
+    n = gram.shape[-1]
+    gram[..., np.arange(n), np.arange(n)] = 0
+    return gram.max(axis=(-1, -2))
+
+
+def thomson_energy(directions):
+    """Sum over pairs of 1 / distance (batched over leading axes)."""
+    x = _unit_rows(np.asarray(directions, dtype=float))
+    gram = x @ np.swapaxes(x, -1, -2)
+    n = gram.shape[-1]
+    off = ~np.eye(n, dtype=bool)
+    distances = np.sqrt(np.maximum(2 - 2 * gram[..., off], 1e-12))
+    return (1 / distances).sum(axis=-1) / 2
+
+
+def _gram_gradient(gram, objective, p):
+    """d(objective)/dG for a batch of Gram matrices, with the diagonal zeroed."""
+    n = gram.shape[-1]
+    off = ~np.eye(n, dtype=bool)
+    if objective == "max_cos":
+        # Gradient of the p-norm of the off-diagonal entries, scaled by the
+        # largest entry so that large p neither overflows nor underflows
+        magnitude = np.abs(gram) * off
+        largest = magnitude.max(axis=(-1, -2), keepdims=True)
+        ratio = magnitude / np.maximum(largest, 1e-12)
+        total = (ratio ** p).sum(axis=(-1, -2), keepdims=True)
+        return np.sign(gram) * ratio ** (p - 1) / total ** ((p - 1) / p) * off
+    distances_sq = np.maximum(2 - 2 * gram, 1e-9)
+    return distances_sq ** -1.5 * off
+
+
+def _solve(n, d, objective, restarts, steps, learning_rate, seed):
+    rng = np.random.default_rng(seed)
+    x = _unit_rows(rng.standard_normal((restarts, n, d)))
+    # Sharpen the max |cos| surrogate as the arrangement settles
+    powers = np.geomspace(4, 256, steps)
+    rates = learning_rate * np.geomspace(1, 0.01, steps)
+    for p, rate in zip(powers, rates):
+        gram = x @ np.swapaxes(x, -1, -2)
+        grad = 2 * _gram_gradient(gram, objective, p) @ x
+        # Step along the sphere, with each restart's step normalized to ``rate``
+        grad -= np.sum(grad * x, axis=-1, keepdims=True) * x
+        scale = np.abs(grad).max(axis=(-1, -2), keepdims=True)
+        x = _unit_rows(x - rate * grad / np.maximum(scale, 1e-12))
+
+    scores = max_abs_cos(x) if objective == "max_cos" else thomson_energy(x)
+    return x[np.argmin(scores)]
+
+
+def solve_arrangement(n, d, objective="max_cos", restarts=16, steps=1500, learning_rate=0.05, seed=0, cache=True):
+    """(n, d) array of unit feature directions with low interference under ``objective``."""
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}; expected one of {OBJECTIVES}")
+    params = {
+        "n": n,
+        "d": d,
+        "objective": objective,
+        "restarts": restarts,
+        "steps": steps,
+        "learning_rate": learning_rate,
+        "seed": seed,
+    }
+    if not cache:
+        return _solve(**params)
+    return cached_points("arrangement", {**params, "solver_version": SOLVER_VERSION}, lambda: _solve(**params))
@@ -0,0 +1,91 @@
+"""Shared 3-D feature-space backdrop: xy grid, vertical helper lines and axes.
+
+The helper lines used to be one ``Line`` per grid point (121 of them for the
+default 10x10 grid). Here they are a single multi-segment VMobject, so the 3-D
+camera projects and depth-sorts one object instead of 121. The line geometry is
+cached on disk (under the media dir) keyed by a hash of the parameters.
+
+    from backdrop import FeatureSpaceBackdrop
+
+    backdrop = FeatureSpaceBackdrop(x_range=(-3, 3, 1), y_range=(-3, 3, 1), z_range=(-3, 3, 1))
+    grid, vertical_lines, axes = backdrop
+"""
+import numpy as np
+from manim import *
+
+from disk_cache import cached_points
+from segments import segments_to_points
+
+
+class FeatureSpaceBackdrop(VGroup):
+    """NumberPlane on z = 0, vertical helper lines at every grid point, and 3-D axes.
+
+    Unpacks as ``grid, vertical_lines, axes``; the three parts are also
+    available as attributes of the same names.
+
+    The scenes built their helper lines with ``grid.c2p(x, y, 5)``, which a
+    2-D NumberPlane maps to z = 0: they have zero length and draw nothing, and
+    that is the default here too. Pass ``line_z_range=(0, 5)`` (for example)
+    to draw real vertical lines.
+    """
+
+    def __init__(
+        self,
+        x_range=(-5, 5, 1),
+        y_range=(-5, 5, 1),
+        z_range=(0, 5, 1),
+        line_color=BLUE_E,
+        line_opacity=0.5,
+        line_width=1,
+        line_z_range=(0, 0),
+        axis_color=WHITE,
+        **kwargs,
+    ):
+        self.grid = NumberPlane(
+            x_range=x_range,
+            y_range=y_range,
+            background_line_style={
+                "stroke_color": line_color,
+                "stroke_width": line_width,
+                "stroke_opacity": line_opacity,
+            },
+            axis_config={"include_numbers": False},
+        )
+
+        params = {
+            "x_range": list(x_range),
+            "y_range": list(y_range),
+            "line_z_range": list(line_z_range),
+            "origin": self.grid.c2p(0, 0).tolist(),
+            "unit_x": (self.grid.c2p(1, 0) - self.grid.c2p(0, 0)).tolist(),
+            "unit_y": (self.grid.c2p(0, 1) - self.grid.c2p(0, 0)).tolist(),
+        }
+        points = cached_points("backdrop", params, lambda: self._helper_line_points(**params))
+        self.vertical_lines = VMobject(
+            stroke_color=line_color,
+            stroke_width=line_width,
+            stroke_opacity=line_opacity,
+        )
+        self.vertical_lines.set_points(points)
+
+        self.axes = ThreeDAxes(
+            x_range=x_range,
+            y_range=y_range,
+            z_range=z_range,
+            x_length=x_range[1] - x_range[0],
+            y_length=y_range[1] - y_range[0],
+            z_length=z_range[1] - z_range[0],
+            axis_config={"color": axis_color, "include_tip": False, "include_numbers": False},
+        )
+
+        super().__init__(self.grid, self.vertical_lines, self.axes, **kwargs)
+
+    @staticmethod
+    def _helper_line_points(x_range, y_range, line_z_range, origin, unit_x, unit_y):
+        xs = np.arange(x_range[0], x_range[1] + x_range[2] / 2, x_range[2])
+        ys = np.arange(y_range[0], y_range[1] + y_range[2] / 2, y_range[2])
+        x, y = (a.ravel() for a in np.meshgrid(xs, ys, indexing="ij"))
+        base = np.asarray(origin) + x[:, None] * np.asarray(unit_x) + y[:, None] * np.asarray(unit_y)
+        starts = base + line_z_range[0] * OUT
+        ends = base + line_z_range[1] * OUT
+        return segments_to_points(starts, ends)
@@ -1,37 +1,42 @@
 from manim import *
 import numpy as np
 
-class BigStrawBox(ThreeDScene):
-    def construct(self):
+from depth_order import DepthOrderedScene
+from sections import SectionedScene
+from straw_field import ShowIncreasingStraws, StrawField
+
+
+class BigStrawBox(DepthOrderedScene, SectionedScene, ThreeDScene):
+    # Straw grid size; StrawField keeps 100 x 100 at preview speed
+    ROWS = 15
+    COLS = 15
+    # The straws section resumes from a checkpoint of the built box and field (see sections.py)
+    SECTIONS = ["box", "straws"]
+
+    def box(self):
         # Set camera to face the more square side (yz face), from a high angle initially
         # Use an explicit starting distance so we can animate a smooth zoom-in later
         # High angle view; facing the square side (yz plane)
         self.set_camera_orientation(phi=85 * DEGREES, theta=0 * DEGREES, distance=6)
         # self.camera.frame.scale(0.75)
         # Parameters for straw grid
-        rows, cols = 15, 15
+        rows, cols = self.ROWS, self.COLS
         straw_radius = 0.05
         straw_height = 4.0
         # Make straws almost touching: spacing ≈ 2*radius + tiny gap
         gap = 0.01
         spacing_y = 2 * straw_radius + gap
         spacing_z = 2 * straw_radius + gap
-        # Original stacked straws centered at origin (inside the box)
-        straws = VGroup()
-        for i in range(rows):
-            for j in range(cols):
-                y = i * spacing_y - (rows - 1) * spacing_y / 2
-                z = j * spacing_z - (cols - 1) * spacing_z / 2
-                x = 0
-                straw = Cylinder(
-                    radius=straw_radius,
-                    height=straw_height,
-                    direction=RIGHT,
-                    fill_opacity=0.4,
-                    fill_color=BLUE,
-                    stroke_opacity=0.1,
-                ).move_to([x, y, z])
-                straws.add(straw)
+        # Original stacked straws centered at origin (inside the box), drawn as
+        # one batched field so the grid can grow far beyond 15x15
+        straws = StrawField.grid(
+            rows,
+            cols,
+            radius=straw_radius,
+            height=straw_height,
+            gap=gap,
+            camera=self.camera,
+        )
         # Dimensions for the box (tight rectangular fit with small padding)
         padding_x, padding_y, padding_z = 0.1, 0.06, 0.06
         # Width along x (cylinders lie along x): total length + padding on both sides
@@ -68,9 +73,14 @@ class BigStrawBox(ThreeDScene):
             box.animate.shift(left_unit * shift_amount).scale(1.05),
             run_time=1.2,
         )
+        self.straw_field = straws
+        self.straws_shift = right_unit * shift_amount
+
+    def straws(self):
+        straws = self.straw_field
         # Then create and position the straws
-        straws.shift(right_unit * shift_amount).scale(2.3)
+        straws.shift(self.straws_shift).scale(2.3)
         self.add(straws)
-        self.play(FadeIn(straws, lag_ratio=0.001), run_time=2.0)
+        self.play(ShowIncreasingStraws(straws), run_time=2.0)
         self.wait(5)
         self.play(FadeOut(straws), run_time=1.0)
\ No newline at end of file
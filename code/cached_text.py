@@ -0,0 +1,120 @@
+"""Text that changes every frame without recompiling LaTeX every frame.
+
+``Tex(f"Step: {step}")`` inside an updater goes through LaTeX (or the tex
+cache) and SVG parsing on every frame. The helpers here render their glyphs
+once and afterwards only copy cached point arrays:
+
+* GlyphCounter: a number readout such as "Step: 42" or "Loss: 1.273".
+* face_camera: keeps a pre-rendered label turned towards a ThreeDCamera,
+  replacing ``always_redraw(lambda: Tex(...).rotate(...))``.
+"""
+import numpy as np
+from manim import *
+
+# Length of the invisible anchor segment that tracks a counter's position and scale
+_ANCHOR_LENGTH = 0.01
+
+
+class GlyphCounter(VGroup):
+    """Number readout composed from glyphs rendered once.
+
+    ``label`` and the characters in ``glyphs`` are typeset together in a single
+    Tex call (so they share a baseline); ``set_value`` then only copies the
+    cached glyph points into a fixed pool of ``max_chars`` slots. The counter
+    can be moved and scaled like any mobject, and grows to the right from where
+    it was placed.
+    """
+
+    def __init__(
+        self,
+        value=0,
+        label="",
+        num_decimal_places=0,
+        max_chars=10,
+        glyphs="0123456789.-",
+        tex_class=Tex,
+        **tex_kwargs,
+    ):
+        super().__init__()
+        self.num_decimal_places = num_decimal_places
+        template = tex_class(label, glyphs, **tex_kwargs) if label else tex_class(glyphs, **tex_kwargs)
+        glyph_mobs = template[-1].submobjects
+        if len(glyph_mobs) != len(glyphs):
+            raise ValueError(f"Expected {len(glyphs)} glyphs from {glyphs!r}, LaTeX produced {len(glyph_mobs)}")
+
+        # Digits share one advance width (tabular figures); other glyphs get
+        # their own width plus the digits' average side bearing.
+        digits = [glyph_mobs[glyphs.index(d)] for d in "0123456789" if d in glyphs]
+        if len(digits) >= 2:
+            first, last = digits[0].get_center()[0], digits[-1].get_center()[0]
+            digit_advance = (last - first) / (len(digits) - 1)
+            bearing = digit_advance - np.mean([d.width for d in digits])
+        else:
+            bearing = 0.1 * glyph_mobs[0].height
+            digit_advance = None
+        baseline_y = glyph_mobs[0].get_center()[1]
+
+        self._templates = {}
+        for char, glyph in zip(glyphs, glyph_mobs):
+            advance = digit_advance if char.isdigit() and digit_advance else glyph.width + bearing
+            cell_center = np.array([glyph.get_center()[0], baseline_y, 0])
+            self._templates[char] = (glyph.points - cell_center, advance)
+
+        # The first slot starts where the first glyph's cell starts, right after the label
+        pen = glyph_mobs[0].get_center()[0] - self._templates[glyphs[0]][1] / 2
+        origin = np.array([pen, baseline_y, glyph_mobs[0].get_center()[2]])
+        self.anchor = VMobject(stroke_width=0, fill_opacity=0)
+        end = origin + _ANCHOR_LENGTH * RIGHT
+        self.anchor.set_points(np.array([origin, origin, end, end]))
+
+        self.label = template[0] if label else VGroup()
+        self.slots = VGroup(*[glyph_mobs[0].copy() for _ in range(max_chars)])
+        self.add(self.label, self.slots, self.anchor)
+        self.set_value(value)
+
+    def set_value(self, value):
+        text = f"{value:.{self.num_decimal_places}f}"
+        if len(text) > len(self.slots):
+            raise ValueError(f"{text!r} does not fit in {len(self.slots)} glyph slots")
+
+        # Position, scale and in-plane rotation all come from the anchor segment
+        origin = self.anchor.points[0]
+        unit = (self.anchor.points[-1] - origin) / _ANCHOR_LENGTH
+        perp = np.array([-unit[1], unit[0], 0])
+        pen = 0.0
+        for slot, char in zip(self.slots, text):
+            points, advance = self._templates[char]
+            local_x = points[:, 0] + pen + advance / 2
+            slot.points = origin + local_x[:, None] * unit + points[:, 1:2] * perp
+            pen += advance
+        for slot in self.slots[len(text):]:
+            slot.points = np.zeros((0, 3))
+        self.value = value
+        return self
+
+    def get_value(self):
+        return self.value
+
+
+def face_camera(mobject, camera, position):
+    """Keep a pre-rendered ``mobject`` centred on ``position`` and turned towards ``camera``.
+
+    Applies the same rotations the scenes used to apply to a freshly built Tex
+    on every frame, but to cached copies of the points.
+    """
+    mobject.move_to(ORIGIN)
+    templates = [sub.points.copy() for sub in mobject.family_members_with_points()]
+    position = np.asarray(position, dtype=float)
+
+    def update(mob):
+        matrix = (
+            rotation_matrix(PI, OUT)
+            @ rotation_matrix(camera.get_theta(), UP)
+            @ rotation_matrix(-camera.get_phi(), RIGHT)
+        )
+        for sub, points in zip(mob.family_members_with_points(), templates):
+            sub.points = points @ matrix.T + position
+
+    update(mobject)
+    mobject.add_updater(update)
+    return mobject
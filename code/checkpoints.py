@@ -0,0 +1,126 @@
+"""Compact on-disk checkpoints of scene state (mobject graphs, camera values).
+
+A checkpoint is a pickle whose NumPy arrays (mobject points, colors, ...) are
+kept out of band (pickle protocol 5) and stored back to back after it, so
+writing one is a single pass over the arrays and loading one is a single read
+with no per-array copies:
+
+    dump_checkpoint({"mobjects": scene.mobjects}, path, shared=[scene.camera])
+    state = load_checkpoint(path, shared=[scene.camera])
+
+Objects in ``shared`` (the scene, its camera and camera trackers) are stored
+by position instead of by value, and resolve to the objects passed at load
+time. A mobject whose updater keeps following ``scene.camera`` therefore
+follows the new scene's camera after a restore, rather than a stale copy.
+
+Lambdas and local functions cannot be pickled. Updaters that must survive a
+checkpoint are written as module-level functions wrapped in ``Updater``:
+
+    label.add_updater(Updater(follow_arrow, arrow))   # follow_arrow(label, arrow)
+"""
+import io
+import os
+import pickle
+import struct
+
+import numpy as np
+
+MAGIC = b"SCENECKPT1\n"
+# Buffers start on cache-line boundaries: aligned in the file, and loaded into
+# an aligned block of memory
+ALIGNMENT = 64
+
+
+class Updater:
+    """Picklable updater calling ``func(mobject, *args)``.
+
+    Like a lambda, it is shared (not copied) between a mobject and its copies.
+    Time-based (``dt``) updaters are not supported.
+    """
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __call__(self, mobject):
+        return self.func(mobject, *self.args)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return f"Updater({getattr(self.func, '__qualname__', self.func)})"
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, shared, **kwargs):
+        super().__init__(file, **kwargs)
+        self.shared = {id(obj): index for index, obj in enumerate(shared)}
+
+    def persistent_id(self, obj):
+        return self.shared.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file, shared, **kwargs):
+        super().__init__(file, **kwargs)
+        self.shared = list(shared)
+
+    def persistent_load(self, index):
+        return self.shared[index]
+
+
+def _padding(size):
+    return -size % ALIGNMENT
+
+
+def dump_checkpoint(state, path, shared=()):
+    """Write ``state`` to ``path``; raises pickle.PicklingError/TypeError/AttributeError if it can't be pickled."""
+    buffers = []
+    skeleton = io.BytesIO()
+    _Pickler(skeleton, shared, protocol=5, buffer_callback=buffers.append).dump(state)
+    skeleton = skeleton.getvalue()
+    views = [buffer.raw() for buffer in buffers]
+
+    header = MAGIC + struct.pack("<QQ", len(skeleton), len(views))
+    header += np.array([view.nbytes for view in views], dtype="<u8").tobytes()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    # Write then rename so a parallel render never reads a half-written checkpoint
+    with open(tmp_path, "wb") as file:
+        file.write(header)
+        file.write(skeleton)
+        file.write(bytes(_padding(len(header) + len(skeleton))))
+        for view in views:
+            file.write(view)
+            file.write(bytes(_padding(view.nbytes)))
+    os.replace(tmp_path, path)
+    return path
+
+
+def _aligned_bytes(size):
+    # Writable (mobjects move in place) and starting on an ALIGNMENT boundary
+    block = np.empty(size + ALIGNMENT, dtype=np.uint8)
+    start = -block.ctypes.data % ALIGNMENT
+    return memoryview(block[start : start + size])
+
+
+def load_checkpoint(path, shared=()):
+    """State written by ``dump_checkpoint``, with ``shared`` objects substituted back in."""
+    with open(path, "rb") as file:
+        data = _aligned_bytes(os.fstat(file.fileno()).st_size)
+        file.readinto(data)
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{path} is not a scene checkpoint")
+    offset = len(MAGIC)
+    skeleton_size, n_buffers = struct.unpack_from("<QQ", data, offset)
+    offset += 16
+    sizes = np.frombuffer(data, dtype="<u8", count=n_buffers, offset=offset)
+    offset += 8 * n_buffers
+    skeleton = io.BytesIO(data[offset : offset + skeleton_size])
+    offset += skeleton_size + _padding(offset + skeleton_size)
+    views = []
+    for size in sizes.tolist():
+        views.append(data[offset : offset + size])
+        offset += size + _padding(size)
+    return _Unpickler(skeleton, shared, buffers=views).load()
+
@@ -0,0 +1,34 @@
+"""Color constants that not every Manim version exports.
+
+Scenes import this after manim so the names below always exist:
+
+    from manim import *
+    from color_compat import *
+"""
+import manim
+
+try:
+    from manim.utils.color import Color  # Manim Community v0.19
+except Exception:
+    Color = None
+
+
+def _color(value: str):
+    return Color(value) if Color is not None else value
+
+
+# Prefer Manim's own constant when the installed version provides it
+def _manim_or(name: str, value: str):
+    return getattr(manim, name, None) or _color(value)
+
+
+CYAN = _manim_or("CYAN", "#00FFFF")
+MAGENTA = _manim_or("MAGENTA", "#FF00FF")
+ORANGE = _manim_or("ORANGE", "#FFA500")
+TEAL = _manim_or("TEAL", "#008080")
+LAVENDER = _manim_or("LAVENDER", "#E6E6FA")
+GREY = _manim_or("GREY", "#808080")
+WHITE = _manim_or("WHITE", "#FFFFFF")
+BLUE_E = _manim_or("BLUE_E", "#1C75E9")
+
+__all__ = ["CYAN", "MAGENTA", "ORANGE", "TEAL", "LAVENDER", "GREY", "WHITE", "BLUE_E"]
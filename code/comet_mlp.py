@@ -1,6 +1,12 @@
 from manim import *
 
-class MLPNetwork(Scene):
+from mlp_diagram import MLPDiagram
+from seeding import SeededScene
+
+class MLPNetwork(SeededScene, Scene):
+    # Seed of the published render (see seeding.py)
+    SEED = 42
+
     def construct(self):
         # Create and position the network at center
         full_network = self.create_mlp_model()
@@ -15,40 +21,19 @@ class MLPNetwork(Scene):
         # Hold the final scene
         self.wait(2)
     
-    def create_mlp_model(self, color=BLUE):        
-        network = VGroup()
-        layers = 4
-        nodes_per_layer = [3, 4, 4, 2]
-        
+    def create_mlp_model(self, color=BLUE):
+        diagram = MLPDiagram(
+            [3, 4, 4, 2],
+            layer_spacing=2,
+            node_radius=0.3,
+            color=color,
+            node_stroke_width=DEFAULT_STROKE_WIDTH,
+        )
+        network, connections = diagram
+
         # Store node positions for later reference
-        self.node_positions = []
-        
-        for i in range(layers):
-            layer = VGroup()
-            layer_positions = []
-            for j in range(nodes_per_layer[i]):
-                node = Circle(radius=0.3, color=color)
-                node.set_fill(color, opacity=0.3)
-                position = [i * 2 - 3, j - (nodes_per_layer[i] - 1) / 2, 0]
-                node.move_to(position)
-                layer.add(node)
-                layer_positions.append(position)
-            network.add(layer)
-            self.node_positions.append(layer_positions)
-        
-        connections = VGroup()
-        for i in range(layers - 1):
-            for node1 in network[i]:
-                for node2 in network[i + 1]:
-                    connection = Line(
-                        node1.get_center(),
-                        node2.get_center(),
-                        stroke_opacity=0.4,
-                        stroke_width=0.7,
-                        stroke_color=color
-                    )
-                    connections.add(connection)
-        
+        self.node_positions = [positions.tolist() for positions in diagram.node_positions]
+
         full_network = VGroup(network, connections)
         return full_network
     
@@ -143,7 +128,7 @@ class MLPNetwork(Scene):
         
         # Animate meteors flying to random positions in the network
         import random
-        random.seed(42)  # For consistent random positions
+        random.seed(self.seed)  # For consistent random positions
         
         animations = []
         for i, meteor in enumerate(meteors):
@@ -1,46 +1,24 @@
 from manim import *
 import numpy as np
 
-class CorrelatedVectorsBias(ThreeDScene):
+from backdrop import FeatureSpaceBackdrop
+from sections import SectionedScene
+
+
+class CorrelatedVectorsBias(SectionedScene, ThreeDScene):
     """Show 2 correlated vectors, evolve equation, and bias shift one to opposite position."""
 
-    def construct(self):
+    # Beats, renderable one at a time (see sections.py)
+    SECTIONS = ["show_vectors", "show_equation", "bias_shift", "show_explanation"]
+
+    def show_vectors(self):
         # ============= OBJECT CREATION =============
         
         # Create 3D space
-        grid = NumberPlane(
-            x_range=(-3, 3, 1),
-            y_range=(-3, 3, 1),
-            background_line_style={
-                "stroke_color": BLUE_E,
-                "stroke_width": 1,
-                "stroke_opacity": 0.5,
-            },
-            axis_config={"include_numbers": False},
-        )
-
-        vertical_lines = VGroup(
-            *[
-                Line(
-                    start=grid.c2p(x, y, 0),
-                    end=grid.c2p(x, y, 3),
-                    color=BLUE_E,
-                    stroke_width=1,
-                    stroke_opacity=0.5,
-                )
-                for x in range(-3, 4)
-                for y in range(-3, 4)
-            ]
-        )
-
-        axes = ThreeDAxes(
+        grid, vertical_lines, axes = FeatureSpaceBackdrop(
             x_range=(-3, 3, 1),
             y_range=(-3, 3, 1),
             z_range=(-3, 3, 1),
-            x_length=6,
-            y_length=6,
-            z_length=6,
-            axis_config={"color": WHITE, "include_tip": False, "include_numbers": False},
         )
 
         background_elements = VGroup(grid, vertical_lines, axes)
@@ -104,11 +82,23 @@ class CorrelatedVectorsBias(ThreeDScene):
         self.add_fixed_orientation_mobjects(ml_text, ai_text)
         self.play(FadeIn(ml_text), FadeIn(ai_text))
         self.wait(2)
+        self.vector_2 = vector_2
+        self.ai_text = ai_text
+        self.equation = equation
+        self.opposite_position = opposite_position
+        self.explanation = explanation
 
+    def show_equation(self):
+        equation = self.equation
         # Show initial equation (fix the whole equation's orientation so both parts stay aligned)
         self.add_fixed_orientation_mobjects(equation)
         self.wait(2)
 
+    def bias_shift(self):
+        vector_2, ai_text = self.vector_2, self.ai_text
+        opposite_position = self.opposite_position
+        bias_term = self.equation[1]
+
         # Transform equation and shift vector; simultaneously highlight bias then return to original size
         self.play(
             AnimationGroup(
@@ -132,6 +122,9 @@ class CorrelatedVectorsBias(ThreeDScene):
             ),
             run_time=2.5,
         )
+
+    def show_explanation(self):
+        explanation = self.explanation
         # Update label for shifted vector
         self.add_fixed_orientation_mobjects(explanation)
         explanation.move_to([0, -2.8, 1.2])  # Move to middle between x and z axis
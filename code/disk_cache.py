@@ -0,0 +1,48 @@
+"""On-disk cache of computed arrays under the media dir.
+
+Backdrop line geometry, solved feature arrangements and toy-model training
+runs are all pure functions of a few parameters. They are cached as ``.npy``
+files keyed by a hash of those parameters:
+
+    directions = cached_points("arrangement", {"n": 5, "d": 3}, lambda: solve(5, 3))
+
+This module doesn't import manim, so the numeric solvers can use it on their
+own. The cache lives in manim's media dir when manim is loaded (any render),
+and in ``./media``, manim's default, otherwise.
+"""
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+def media_dir():
+    manim = sys.modules.get("manim")
+    if manim is not None:
+        return Path(manim.config.media_dir)
+    return Path("media")
+
+
+def cache_path(kind, params):
+    """Cache file for ``params`` (a JSON-serializable dict) under ``media/cache/<kind>``."""
+    key = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return media_dir() / "cache" / kind / f"{key}.npy"
+
+
+def cached_points(kind, params, build):
+    """Load an array from the disk cache, building it with ``build()`` on a miss."""
+    path = cache_path(kind, params)
+    try:
+        return np.load(path)
+    except (OSError, ValueError):
+        pass
+    points = build()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so parallel renders never read a half-written file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp.npy")
+    np.save(tmp_path, points)
+    os.replace(tmp_path, path)
+    return points
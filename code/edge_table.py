@@ -0,0 +1,138 @@
+"""Edge index for layered (MLP) network diagrams.
+
+Scenes used to recover "the connections between layer i and i + 1" by scanning
+every connection for every node pair and comparing endpoint coordinates, which
+is O(edges^2) and breaks as soon as nodes move. An EdgeTable records, for each
+edge, its layer, source and target index next to the mobject that draws it:
+
+    network, dotted_connections, solid_connections, edges = self.create_mlp_model()
+    edges.layer(0)             # connections from layer 0 to layer 1
+    edges.outgoing(1, 3)       # connections leaving node 3 of layer 1
+    edges.get(2, 0, 1)         # the single connection 2:0 -> 3:1, or None
+
+Diagrams that draw a whole layer of edges as one stroke (see mlp_diagram.py)
+have no per-edge mobject; their tables record ``strokes``, one per layer, and
+``segments``, the [start, stop) range of each edge's segments within its
+layer's stroke. Lookups then return an ``EdgeSegments`` per edge, and
+``stroke(i)`` is the whole stroke of layer ``i``:
+
+    self.play(CreateLines(edges.stroke(0)))
+    edges.get(2, 0, 1).get_points()    # points of the segments drawing 2:0 -> 3:1
+"""
+from collections import namedtuple
+
+import numpy as np
+from manim import VGroup
+
+
+class EdgeSegments(namedtuple("EdgeSegments", ["stroke", "start", "stop"])):
+    """Segments ``[start, stop)`` of the LineBundle ``stroke`` that draw one edge."""
+
+    __slots__ = ()
+
+    def get_points(self):
+        # A LineBundle segment is one cubic curve of 4 points
+        return self.stroke.points[4 * self.start:4 * self.stop]
+
+
+class EdgeTable:
+    """Edges between consecutive layers, as arrays plus the mobject for each edge.
+
+    ``layers[k]``, ``sources[k]`` and ``targets[k]`` describe edge ``k``, drawn by
+    ``mobjects[k]``; an edge of layer ``i`` goes from node ``sources[k]`` of layer
+    ``i`` to node ``targets[k]`` of layer ``i + 1``. Edges are kept sorted by
+    (layer, source, target), so every lookup is a slice or a single index.
+    ``segments`` is an optional (N, 2) array of segment ranges, for edges drawn
+    as part of ``strokes[layer]`` rather than by a mobject of their own.
+    """
+
+    def __init__(self, layer_sizes, layers, sources, targets, mobjects=None, segments=None, strokes=None):
+        self.layer_sizes = list(layer_sizes)
+        layers, sources, targets = (np.asarray(a, dtype=int) for a in (layers, sources, targets))
+        segments = None if segments is None else np.asarray(segments, dtype=int).reshape(-1, 2)
+        # Diagrams usually list their edges in order already; only sort if not
+        key = (layers * max(self.layer_sizes, default=1) + sources) * max(self.layer_sizes, default=1) + targets
+        if np.any(key[1:] < key[:-1]):
+            order = np.argsort(key, kind="stable")
+            layers, sources, targets = layers[order], sources[order], targets[order]
+            mobjects = None if mobjects is None else [mobjects[k] for k in order]
+            segments = None if segments is None else segments[order]
+        self.layers = layers
+        self.sources = sources
+        self.targets = targets
+        self.mobjects = None if mobjects is None else list(mobjects)
+        self.segments = segments
+        self.strokes = None if strokes is None else list(strokes)
+        if self.mobjects is None and self.segments is None:
+            raise ValueError("EdgeTable needs either mobjects or segments")
+
+        # Start of each layer's edges, and a dense (source, target) -> edge index
+        # matrix per layer (-1 where two nodes are not connected)
+        self.layer_starts = np.searchsorted(self.layers, np.arange(len(self.layer_sizes)))
+        self._index = []
+        for i, (n_in, n_out) in enumerate(zip(self.layer_sizes[:-1], self.layer_sizes[1:])):
+            index = np.full((n_in, n_out), -1)
+            start, stop = self.layer_starts[i], self.layer_starts[i + 1]
+            index[self.sources[start:stop], self.targets[start:stop]] = np.arange(start, stop)
+            self._index.append(index)
+
+    @classmethod
+    def from_edges(cls, layer_sizes, edges):
+        """Build from an iterable of ``(layer, source, target, mobject)`` tuples."""
+        edges = list(edges)
+        if not edges:
+            return cls(layer_sizes, [], [], [], [])
+        layers, sources, targets, mobjects = zip(*edges)
+        return cls(layer_sizes, layers, sources, targets, mobjects)
+
+    def __len__(self):
+        return len(self.layers)
+
+    def __iter__(self):
+        return (self.edge(k) for k in range(len(self)))
+
+    def edge(self, k):
+        """What draws edge ``k``: its mobject, or its ``EdgeSegments``."""
+        if self.mobjects is not None:
+            return self.mobjects[k]
+        stroke = None if self.strokes is None else self.strokes[self.layers[k]]
+        start, stop = self.segments[k].tolist()
+        return EdgeSegments(stroke, start, stop)
+
+    def layer(self, i):
+        """Connections from layer ``i`` to layer ``i + 1``."""
+        return [self.edge(k) for k in self.edge_indices(i)]
+
+    def stroke(self, i):
+        """The mobject drawing all of layer ``i``'s connections (a VGroup of them without ``strokes``)."""
+        if self.strokes is not None:
+            return self.strokes[i]
+        return VGroup(*self.layer(i))
+
+    def edge_indices(self, i):
+        """Positions (into the arrays and ``mobjects``) of layer ``i``'s edges."""
+        return np.arange(self.layer_starts[i], self.layer_starts[i + 1])
+
+    def index(self, layer, source, target):
+        """Position of the edge ``layer:source -> layer + 1:target``, or -1 if there is none."""
+        return self._index[layer][source, target]
+
+    def outgoing_indices(self, layer, node):
+        row = self._index[layer][node]
+        return row[row >= 0]
+
+    def incoming_indices(self, layer, node):
+        column = self._index[layer - 1][:, node]
+        return column[column >= 0]
+
+    def get(self, layer, source, target):
+        k = self.index(layer, source, target)
+        return self.edge(k) if k >= 0 else None
+
+    def outgoing(self, layer, node):
+        """Connections leaving node ``node`` of layer ``layer``."""
+        return [self.edge(k) for k in self.outgoing_indices(layer, node)]
+
+    def incoming(self, layer, node):
+        """Connections arriving at node ``node`` of layer ``layer`` (from layer ``layer - 1``)."""
+        return [self.edge(k) for k in self.incoming_indices(layer, node)]
@@ -1,16 +1,37 @@
 from manim import *
 import numpy as np
 
+from aimable_arrows import AimableArrow, aim_arrows
+from cached_text import GlyphCounter
+from growing_curve import GrowingCurve
+from toy_model import train_toy_model
+
+
 class SuperpositionAnimation(Scene):
+    """Feature vectors of a real toy model (see toy_model.py) settling into superposition.
+
+    The loss curve and the columns of W are the logged trajectory of an actual
+    training run, played back in step with each other.
+    """
+
+    # Toy model trained for the animation: 5 equally important sparse features in 2-D.
+    # A high learning rate settles them into a pentagon within the 50 steps on the axis.
+    N_FEATURES = 5
+    N_HIDDEN = 2
+    TRAINING = {"steps": 50, "sparsity": 0.9, "importance_decay": 1.0, "learning_rate": 0.1, "snapshot_every": 1}
+
     def construct(self):
+        run = train_toy_model(self.N_FEATURES, self.N_HIDDEN, **self.TRAINING)
+        num_steps = self.TRAINING["steps"]
+
         # Set up the scene layout
         left_center = LEFT * 2.5
         right_center = RIGHT * 4
 
-        # Create axes for loss plot
+        # Create axes for loss plot (the run's losses stay between 0.02 and 0.12)
         loss_axes = Axes(
             x_range=[0, 50, 10],
-            y_range=[1.2, 1.6, 0.1],
+            y_range=[0, 0.12, 0.03],
             x_length=5,
             y_length=3,
             axis_config={"color": GRAY},
@@ -21,7 +42,7 @@ class SuperpositionAnimation(Scene):
             },
             y_axis_config={
                 "include_numbers": True,
-                "numbers_to_include": [1.2, 1.3, 1.4, 1.5, 1.6],
+                "numbers_to_include": [0, 0.03, 0.06, 0.09, 0.12],
                 "decimal_number_config": {"num_decimal_places": 2}
             }
         )
@@ -34,54 +55,34 @@ class SuperpositionAnimation(Scene):
         loss_y_label.next_to(loss_axes, LEFT).rotate(PI / 2)
 
         # Step counter
-        step_text = Tex(r"Step: 0", font_size=35)
+        step_text = GlyphCounter(0, label="Step:", font_size=35)
         step_text.move_to(np.array([right_center[0], step_text.get_y(), 0]))
         step_text.align_to(loss_x_label, DOWN)
 
         # Add static elements
         self.add(loss_axes, loss_x_label, loss_y_label)
 
-        # Generate loss data (sharper early drop, flatter & higher tail after 20)
-        steps = np.linspace(0, 50, 300)
-        # Mixture of exponentials to create a sharp initial decline and a higher, flatter tail
-        base_loss = 0.32 * np.exp(-steps / 6) + 0.05 * np.exp(-steps / 28) + 1.26
-        # Keep some sharpness after ~20 steps but with smaller magnitude so the curve stays higher
-        t_post20 = np.maximum(steps - 20.0, 0.0)
-        extra_post20_drop = 0.008 * (1.0 - np.exp(-t_post20 / 6.0))
-        base_loss = base_loss - extra_post20_drop
-        # Deterministic, decaying noise with mixed frequencies; slightly reduced jitter to avoid touching the bottom
-        rng = np.random.default_rng(0)
-        harmonic_noise = (0.035 * np.sin(1.4 * steps) + 0.02 * np.sin(0.25 * steps + 1.2)) * np.exp(-steps / 24)
-        jitter_noise = 0.006 * np.exp(-steps / 16) * rng.standard_normal(steps.shape)
-        loss_values = base_loss + harmonic_noise + jitter_noise
-        # Keep a higher floor to avoid touching the bottom axis
-        loss_values = np.clip(loss_values, 1.25, 1.6)
-        # Add mild fluctuations in the tail instead of enforcing flat behavior
-        tail_start_idx = np.searchsorted(steps, 20.0)
-        if tail_start_idx < len(loss_values):
-            # Add small random variations to maintain ups and downs
-            tail_length = len(loss_values) - tail_start_idx
-            mild_variations = 0.003 * rng.standard_normal(tail_length)
-            # Apply a smoothing to make variations gradual
-            for i in range(1, tail_length):
-                mild_variations[i] = 0.7 * mild_variations[i-1] + 0.3 * mild_variations[i]
-            loss_values[tail_start_idx:] += mild_variations
-
-        # Create initial feature vectors (random angles)
-        num_features = 5
-        initial_angles = [0.2, 1.1, 2.8, 4.5, 5.9]
-        final_angles = [i * 2 * PI / num_features for i in range(num_features)]
+        # Each feature is a column of W, scaled so the longest one ever logged reaches
+        # the circle. W is read from the run's trajectory on disk, a chunk at a time.
+        num_features = self.N_FEATURES
+        feature_radius = 2.7
+        longest = max(np.linalg.norm(chunk, axis=1).max() for chunk in run.weights.chunks())
+
+        def feature_ends(center, step):
+            """Arrow ends for W at a training step, slerped between the logged snapshots."""
+            columns = run.weights.at_step(step, interpolation="slerp").T * feature_radius / longest
+            return center + np.pad(columns, ((0, 0), (0, 1)))
 
         # Create circle for feature vectors
-        feature_circle = Circle(radius=2.7, color=GRAY)
+        feature_circle = Circle(radius=feature_radius, color=GRAY)
         feature_circle.move_to(right_center)
 
         # Create feature vectors
         feature_vectors = VGroup()
-        for i in range(num_features):
-            vector = Arrow(
+        for i, end in enumerate(feature_ends(feature_circle.get_center(), 0)):
+            vector = AimableArrow(
                 start=feature_circle.get_center(),
-                end=feature_circle.get_center() + 2.7 * np.array([np.cos(initial_angles[i]), np.sin(initial_angles[i]), 0]),
+                end=end,
                 color=interpolate_color(RED, BLUE, i / num_features),
                 stroke_width=4,
                 max_tip_length_to_length_ratio=0.1
@@ -90,52 +91,25 @@ class SuperpositionAnimation(Scene):
 
         self.add(feature_vectors, step_text)
 
-        # Create loss curve with a valid initial segment (avoid empty points)
-        loss_curve = VMobject(color=RED, stroke_width=4)
-        initial_curve_points = [
-            loss_axes.coords_to_point(steps[0], loss_values[0]),
-            loss_axes.coords_to_point(steps[1], loss_values[1]),
-        ]
-        loss_curve.set_points_as_corners(initial_curve_points)
+        # Create loss curve; every (step, loss) pair is mapped to the screen once, up front.
+        # It starts with a valid initial segment (avoid empty points).
+        loss_curve = GrowingCurve(loss_axes, run.steps, run.losses, color=RED, stroke_width=4)
         self.add(loss_curve)
 
         # Animation update functions
         def update_line(mob, alpha):
-            points = [loss_axes.coords_to_point(steps[i], loss_values[i]) for i in range(len(steps))]
             accelerated_alpha = alpha ** 0.5
-            num_points = int(accelerated_alpha * len(points))
-
-            if num_points < 2:
-                return
-
-            current_points = points[:num_points]
-            mob.set_points_as_corners(current_points)
-            mob.set_stroke(RED, width=4)
+            mob.set_progress(accelerated_alpha)
 
             # Update step text in sync with curve progress
-            current_step = int(accelerated_alpha * 50)
-            step_text.become(Tex(f"Step: {current_step}", font_size=35))
-            step_text.move_to(np.array([right_center[0], loss_x_label.get_y(), 0]))
-            step_text.align_to(loss_x_label, DOWN)
+            current_step = int(accelerated_alpha * num_steps)
+            step_text.set_value(current_step)
+            step_text.set_x(right_center[0])
 
         def update_feature_vectors(mob, alpha):
-            accelerated_alpha = alpha ** 0.5
-
-            for i, vector in enumerate(mob):
-                current_angle = interpolate(initial_angles[i], final_angles[i], alpha)
-                new_end = feature_circle.get_center() + 2.7 * np.array([
-                    np.cos(current_angle),
-                    np.sin(current_angle),
-                    0
-                ])
-                new_vector = Arrow(
-                    start=feature_circle.get_center(),
-                    end=new_end,
-                    color=interpolate_color(RED, BLUE, i / num_features),
-                    stroke_width=4,
-                    max_tip_length_to_length_ratio=0.1
-                )
-                vector.become(new_vector)
+            # Same training step as the loss curve
+            center = feature_circle.get_center()
+            aim_arrows(mob, center, feature_ends(center, alpha ** 0.5 * num_steps))
 
         # Run the animation
         self.play(
@@ -0,0 +1,85 @@
+"""View-frustum culling for 3-D scenes.
+
+``ThreeDCamera`` projects, depth-sorts and draws every family member of every
+mobject in the scene on every frame. In a close-up such as WhatIsAFeature's
+``move_camera(frame_center=..., distance=0.5)`` most of them (grid lines,
+axis ticks, the faces of the other arrows) land outside the frame.
+``CullingThreeDCamera`` drops those before the depth sort (the cached one of
+depth_order.py), so a close-up costs about as much as what it actually shows:
+
+    class WhatIsAFeature(FrustumCulledScene, SectionedScene, ThreeDScene):
+        ...
+
+A family member is culled when the projection of its bounding box lies
+entirely outside the frame, padded by its stroke width. A box crossing the
+plane of the camera's eye projects without bound and is always kept, as are
+fixed-in-frame and fixed-orientation mobjects.
+
+Bounding boxes come from the camera's per-mobject geometry cache, and are
+only recomputed when a mobject's points change.
+"""
+import numpy as np
+from manim import *
+
+from depth_order import DepthOrderedThreeDCamera
+
+# Which corners of a bounding box take the upper bound, per axis
+_CORNERS = np.array([[i & 1, i & 2, i & 4] for i in range(8)], dtype=bool)
+
+
+class CullingThreeDCamera(DepthOrderedThreeDCamera):
+    """3-D camera that skips family members outside the view (see module docs)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Family members skipped in the last captured frame
+        self.culled = 0
+
+    def get_mobjects_to_display(self, mobjects, include_submobjects=True, excluded_mobjects=None):
+        members = Camera.get_mobjects_to_display(self, mobjects, include_submobjects, excluded_mobjects)
+        visible = self.cull(members)
+        self.culled = len(members) - len(visible)
+        return self.depth_sort(visible)
+
+    def cull(self, mobjects):
+        """The ``mobjects`` whose bounding boxes project into the frame, in order."""
+        fixed = set(self.fixed_in_frame_mobjects) | set(self.fixed_orientation_mobjects)
+        candidates = [i for i, mobject in enumerate(mobjects) if mobject not in fixed and len(mobject.points)]
+        if not candidates:
+            return list(mobjects)
+        bounds = [self.get_bounds(mobjects[i]) for i in candidates]
+        lower = np.array([low for low, _ in bounds])
+        upper = np.array([high for _, high in bounds])
+        corners = np.where(_CORNERS, upper[:, None], lower[:, None]).reshape(-1, 3)
+
+        projected = self.project_points(corners)[:, :2].reshape(len(candidates), 8, 2)
+        # ThreeDCamera draws projected points relative to the frame center
+        center = self.frame_center[:2]
+        half = np.array([self.frame_width, self.frame_height]) / 2
+        widths = np.array([
+            max(getattr(mobjects[i], "stroke_width", 0), getattr(mobjects[i], "background_stroke_width", 0))
+            for i in candidates
+        ])
+        pad = (2 * self.cairo_line_width_multiple * widths)[:, None]
+        outside = np.any(
+            (projected.min(axis=1) > center + half + pad) | (projected.max(axis=1) < center - half - pad), axis=1
+        )
+        if not self.exponential_projection:
+            depths = (corners - self.frame_center) @ self.get_rotation_matrix()[2]
+            behind = depths.reshape(-1, 8) >= self.get_focal_distance()
+            # Points behind the eye are scaled by a constant, so only boxes across its plane are unbounded
+            outside &= ~(np.any(behind, axis=1) & ~np.all(behind, axis=1))
+
+        hidden = {candidates[i] for i in np.flatnonzero(outside).tolist()}
+        return [mobject for i, mobject in enumerate(mobjects) if i not in hidden]
+
+
+class FrustumCulledScene:
+    """Mixin rendering a ``ThreeDScene`` with ``CullingThreeDCamera``.
+
+    Put it before the manim scene class: ``class MyScene(FrustumCulledScene, ThreeDScene)``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("camera_class", CullingThreeDCamera)
+        super().__init__(*args, **kwargs)
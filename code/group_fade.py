@@ -0,0 +1,102 @@
+"""Fades of large groups as one animation over one color array.
+
+``LaggedStart(*[FadeIn(dot) for dot in dots])`` or ``*[FadeOut(straw) for
+straw in straws]`` builds one animation per member, and each one copies its
+member and interpolates every family member of the copies on every frame.
+``FadeInGroup`` and ``FadeOutGroup`` fade all the submobjects of a group in
+(or out) as a single animation:
+
+    self.play(FadeInGroup(dots, lag_ratio=0.01))      # LaggedStart of FadeIns
+    self.play(FadeOutGroup(straws))                    # FadeOut of each straw
+
+When it begins, the fill, stroke and background stroke colors of every
+family member are gathered into one array, and the members' color
+attributes are pointed at slices of it. Each frame then computes all the
+lagged alphas at once (``lagged_alphas``) and writes every opacity with a
+single array operation, whatever the size of the group. At the end, the
+members get their own color arrays back.
+
+Only opacities change: this is ``FadeIn``/``FadeOut`` without ``shift`` or
+``scale``. With ``lag_ratio``, the submobjects start one after another, as
+in a ``LaggedStart``. Give ``run_time=1 + lag_ratio * (n - 1)`` to keep each
+one's fade at one second.
+"""
+import numpy as np
+from manim import *
+
+from line_bundle import lagged_alphas
+
+_COLOR_ARRAYS = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
+
+
+class _FadeGroup(Animation):
+    def __init__(self, mobject, lag_ratio=0.0, **kwargs):
+        super().__init__(mobject, lag_ratio=lag_ratio, **kwargs)
+
+    def create_starting_mobject(self):
+        # Opacities come from the color array gathered in begin; no copy of the group needed
+        return self.mobject
+
+    def begin(self):
+        members = self.mobject.submobjects or [self.mobject]
+        self.count = len(members)
+        # (mobject, attribute, rows) of every color array, and the member each belongs to
+        self.slots = []
+        owners = []
+        seen = set()
+        for index, member in enumerate(members):
+            for mobject in member.get_family():
+                if id(mobject) in seen:
+                    continue
+                seen.add(id(mobject))
+                for name in _COLOR_ARRAYS:
+                    rgbas = vars(mobject).get(name)
+                    if isinstance(rgbas, np.ndarray) and len(rgbas):
+                        self.slots.append((mobject, name, len(rgbas)))
+                        owners.append(np.full(len(rgbas), index))
+        if self.slots:
+            self.targets = np.concatenate([getattr(mobject, name) for mobject, name, _ in self.slots])
+            self.owners = np.concatenate(owners)
+        else:
+            self.targets = np.zeros((0, 4))
+            self.owners = np.zeros(0, dtype=int)
+        self.rgbas = self.targets.copy()
+        offset = 0
+        for mobject, name, rows in self.slots:
+            setattr(mobject, name, self.rgbas[offset:offset + rows])
+            offset += rows
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        weights = lagged_alphas(alpha, self.count, self.lag_ratio, self.rate_func)
+        if not self.fading_in:
+            weights = 1 - weights
+        self.rgbas[:, 3] = self.targets[:, 3] * weights[self.owners]
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if not self.fading_in:
+            # Members may have been added to the scene on their own (Create(straws[i]))
+            scene.remove(*self.mobject.submobjects)
+            # Like FadeOut, leave the removed group as it was
+            self.interpolate(0)
+        for mobject, name, _ in self.slots:
+            setattr(mobject, name, getattr(mobject, name).copy())
+
+
+class FadeInGroup(_FadeGroup):
+    """Fade the submobjects of ``mobject`` in, one after another with ``lag_ratio`` (see module docs)."""
+
+    fading_in = True
+
+    def __init__(self, mobject, lag_ratio=0.0, **kwargs):
+        super().__init__(mobject, lag_ratio=lag_ratio, introducer=True, **kwargs)
+
+
+class FadeOutGroup(_FadeGroup):
+    """Fade the submobjects of ``mobject`` out, one after another with ``lag_ratio``, then remove it."""
+
+    fading_in = False
+
+    def __init__(self, mobject, lag_ratio=0.0, **kwargs):
+        super().__init__(mobject, lag_ratio=lag_ratio, remover=True, **kwargs)
@@ -0,0 +1,109 @@
+"""A plotted curve that grows from left to right at constant cost per frame.
+
+All (x, y) samples are mapped to screen space once, in one vectorized call, and
+stored as a preallocated buffer of Bezier points. Revealing the curve up to a
+given fraction just copies a prefix of that buffer (at most ``max_anchors``
+samples, whatever the length of the log), so updating it costs about the same
+whether the curve has 300 samples or 100k logged training steps.
+
+The buffer is in scene coordinates and stays attached to its axes: if the axes
+were moved, scaled or rotated since the last ``set_progress``, the buffer is
+rebuilt from them first. Move the axes (or a group holding both), not the
+curve alone: a transform of the curve only reaches the samples currently
+shown, and the next ``set_progress`` puts it back on its axes.
+
+    loss_curve = GrowingCurve(loss_axes, steps, loss_values, color=RED, stroke_width=4)
+    self.play(UpdateFromAlphaFunc(loss_curve, lambda m, a: m.set_progress(a)))
+"""
+import numpy as np
+from manim import *
+
+from segments import segments_to_points
+
+
+def axes_frame(axes, x0=0.0, y0=0.0):
+    """Scene point of data ``(x0, y0)`` and the scene steps of one data unit in x and y, as rows."""
+    origin = np.asarray(axes.coords_to_point(x0, y0), dtype=float)
+    unit_x = np.asarray(axes.coords_to_point(x0 + 1, y0), dtype=float) - origin
+    unit_y = np.asarray(axes.coords_to_point(x0, y0 + 1), dtype=float) - origin
+    return np.array([origin, unit_x, unit_y])
+
+
+def axes_to_points(axes, x_values, y_values, frame=None):
+    """Map data coordinates to scene points for linear (non-log) ``axes``."""
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    x0, y0 = x_values[0], y_values[0]
+    origin, unit_x, unit_y = axes_frame(axes, x0, y0) if frame is None else frame
+    return origin + (x_values - x0)[:, None] * unit_x + (y_values - y0)[:, None] * unit_y
+
+
+def decimate(x_values, y_values, max_samples):
+    """Keep the first and last samples and the min and max of evenly sized buckets, in x order.
+
+    More anchors than the curve has pixels only cost drawing time; keeping both
+    extremes of each bucket preserves the spikes a plain stride would drop, and
+    keeping the ends makes the curve still start and stop at the same steps.
+    """
+    n = len(x_values)
+    if n <= max_samples:
+        return x_values, y_values
+    # Room for the first and last samples besides the bucket extremes
+    buckets = max(1, (max_samples - 2) // 2)
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+    keep = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        chunk = y_values[start:stop]
+        low, high = start + np.argmin(chunk), start + np.argmax(chunk)
+        keep.extend(sorted({low, high}))
+    keep = np.unique(np.r_[0, keep, n - 1])
+    return x_values[keep], y_values[keep]
+
+
+class _AxesLink:
+    """The curve's axes, shared (not copied) with copies of the curve, like an updater."""
+
+    def __init__(self, axes):
+        self.axes = axes
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class GrowingCurve(VMobject):
+    """Polyline through ``(x_values, y_values)`` on ``axes``, revealed with ``set_progress`` (see module docs)."""
+
+    def __init__(self, axes, x_values, y_values, max_anchors=4000, progress=0.0, **kwargs):
+        super().__init__(**kwargs)
+        x_values, y_values = decimate(np.asarray(x_values, dtype=float), np.asarray(y_values, dtype=float), max_anchors)
+        self.x_values = x_values
+        self.y_values = y_values
+        self._axes = _AxesLink(axes)
+        self._frame = None
+        self.set_progress(progress)
+
+    def _follow_axes(self):
+        # Three coords_to_point calls per frame; the buffer is only rebuilt when the axes moved
+        frame = axes_frame(self._axes.axes, self.x_values[0], self.y_values[0])
+        if self._frame is None or not np.array_equal(frame, self._frame):
+            anchors = axes_to_points(self._axes.axes, self.x_values, self.y_values, frame)
+            self._buffer = segments_to_points(anchors[:-1], anchors[1:])
+            self._frame = frame
+
+    def get_num_anchors(self):
+        return len(self.x_values)
+
+    def set_progress(self, alpha):
+        """Show the curve up to the first ``alpha`` fraction of its samples."""
+        num_visible = int(np.clip(alpha, 0, 1) * self.get_num_anchors())
+        # Always keep one segment so the mobject never has empty points
+        num_visible = max(num_visible, 2)
+        self.visible_anchors = num_visible
+        self._follow_axes()
+        # A copy: in-place point operations (scale, rotate, ...) must not reach the hidden tail
+        self.points = self._buffer[: 4 * (num_visible - 1)].copy()
+        return self
+
+    def get_current_x(self):
+        """x value (e.g. training step) of the last visible sample."""
+        return self.x_values[self.visible_anchors - 1]
@@ -0,0 +1,126 @@
+"""Many straight lines, solid or dashed, drawn as one stroke.
+
+A LineBundle replaces a VGroup of ``Line``/``DashedLine`` objects (MLP edges,
+PCA projection lines, ...) with a single VMobject whose points are computed
+with NumPy. ``CreateLines`` animates it the way ``Create`` (or a
+``LaggedStart`` of Creates) animated the separate lines.
+
+    lines = LineBundle(starts, ends, dash_length=0.1, color=GRAY, stroke_opacity=0.6)
+    self.play(CreateLines(lines, lag_ratio=0.02))
+"""
+import numpy as np
+from manim import *
+
+from segments import segments_to_points
+
+
+def dash_segments(starts, ends, dash_length, dashed_ratio=0.5):
+    """(start, end) points of the dashes of many dashed lines at once.
+
+    Like ``DashedLine``, each line gets ``ceil(length / dash_length * dashed_ratio)``
+    dashes (at least 2), the first starting at its start and the last ending at
+    its end. Also returns the number of dashes per line.
+    """
+    lengths = np.linalg.norm(ends - starts, axis=1)
+    counts = np.maximum(2, np.ceil(lengths / dash_length * dashed_ratio)).astype(int)
+    line = np.repeat(np.arange(len(starts)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    period = 1 / (counts[line] - 1 + dashed_ratio)
+    t0 = k * period
+    t1 = t0 + dashed_ratio * period
+    direction = ends[line] - starts[line]
+    return starts[line] + t0[:, None] * direction, starts[line] + t1[:, None] * direction, counts
+
+
+def _smooth_array(t, inflection=10.0):
+    # rate_functions.smooth, on an array of t in [0, 1]
+    error = sigmoid(-inflection / 2)
+    return np.clip((sigmoid(inflection * (t - 0.5)) - error) / (1 - 2 * error), 0, 1)
+
+
+# Array forms of the common rate functions (manim's own are scalar)
+_ARRAY_RATE_FUNCS = {smooth: _smooth_array, linear: lambda t: t}
+
+
+def lagged_alphas(alpha, count, lag_ratio, rate_func=smooth):
+    """Per-item alphas of ``count`` equal animations run as ``LaggedStart(lag_ratio=...)``."""
+    total = 1 + lag_ratio * max(count - 1, 0)
+    alphas = np.clip(alpha * total - lag_ratio * np.arange(count), 0, 1)
+    # Only items mid-animation need the rate function, in one call if it has an array form
+    running = (alphas > 0) & (alphas < 1)
+    if running.any():
+        array_rate_func = _ARRAY_RATE_FUNCS.get(rate_func)
+        if array_rate_func is not None:
+            alphas[running] = array_rate_func(alphas[running])
+        else:
+            alphas[running] = [rate_func(a) for a in alphas[running]]
+    return alphas
+
+
+class LineBundle(VMobject):
+    """Straight lines from ``starts[i]`` to ``ends[i]`` as one multi-segment stroke.
+
+    With ``dash_length`` every line is dashed like a ``DashedLine``.
+    ``line_counts[i]`` is the number of segments (dashes) of line ``i``.
+    """
+
+    def __init__(self, starts, ends, dash_length=None, dashed_ratio=0.5, **kwargs):
+        super().__init__(**kwargs)
+        starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+        if dash_length is None:
+            self.line_counts = np.ones(len(starts), dtype=int)
+        else:
+            starts, ends, self.line_counts = dash_segments(starts, ends, dash_length, dashed_ratio)
+        # A fresh array: no need for set_points to copy it again
+        self.points = segments_to_points(starts, ends)
+
+    def get_num_lines(self):
+        return len(self.line_counts)
+
+    def split(self, **line_kwargs):
+        """A VGroup of separate Lines, one per segment, in this bundle's style.
+
+        For the few places that need per-line mobjects, such as transforming a
+        handful of connections into a matrix.
+        """
+        segments = self.points.reshape(-1, 4, 3)
+        style = {
+            "color": self.get_stroke_color(),
+            "stroke_width": self.get_stroke_width(),
+            "stroke_opacity": self.get_stroke_opacity(),
+        }
+        style.update(line_kwargs)
+        return VGroup(*[Line(s[0], s[3], **style) for s in segments])
+
+
+class CreateLines(Animation):
+    """Draw every line of a LineBundle from its start.
+
+    Each line grows like ``Create`` on a ``Line`` (or a ``DashedLine``, dash
+    after dash). With ``lag_ratio`` the lines start one after another, as in
+    ``LaggedStart(*[Create(line) for line in lines], lag_ratio=...)``, all in
+    one vectorized update.
+    """
+
+    def __init__(self, mobject, lag_ratio=0.0, **kwargs):
+        super().__init__(mobject, lag_ratio=lag_ratio, introducer=True, **kwargs)
+
+    def begin(self):
+        counts = self.mobject.line_counts
+        self.segment_line = np.repeat(np.arange(len(counts)), counts)
+        self.segment_index = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        segments = self.mobject.points.reshape(-1, 4, 3)
+        self.segment_starts = segments[:, 0].copy()
+        self.segment_vectors = segments[:, 3] - segments[:, 0]
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        counts = self.mobject.line_counts
+        line_alphas = lagged_alphas(alpha, len(counts), self.lag_ratio, self.rate_func)
+        # Dashes of a line are drawn in order, each taking an equal share of its time
+        line = self.segment_line
+        segment_alphas = np.clip(line_alphas[line] * counts[line] - self.segment_index, 0, 1)
+        self.mobject.points = segments_to_points(
+            self.segment_starts, self.segment_starts + segment_alphas[:, None] * self.segment_vectors
+        )
@@ -0,0 +1,208 @@
+"""Camera-distance level of detail for ``Cylinder`` and ``Arrow3D`` meshes.
+
+A ``Cylinder`` is a grid of faces, 24 x 24 by default (plus 32 x 32 for an
+``Arrow3D``'s cone), whether it fills the screen or covers a few pixels.
+``LODCylinder`` and ``LODArrow3D`` pick the resolution of each of their
+surfaces every frame from its on-screen size instead, so a vector seen from
+far away is a handful of faces and a close-up still looks round:
+
+    vectors = VGroup(*[LODArrow3D(ORIGIN, 2 * d, camera=self.camera, color=c) for d, c in zip(dirs, colors)])
+
+A surface ``R`` pixels in radius drawn with ``n`` sides strays from the true
+circle by about ``R * (pi / n)**2 / 2`` pixels; each surface gets the coarsest
+of the ``LOD_TIERS`` keeping that under ``tolerance``. It only drops to a
+coarser tier once the finer one is more than ``hysteresis`` beyond what it
+needs, so a surface sitting on a threshold doesn't flicker between two.
+
+Meshes are cached per tier: the unit meshes (as manim builds them) once per
+process, and each surface's faces once per tier it has been shown at. A
+switch maps the unit mesh through the surface's current placement, fitted
+from its points (so shifts, rotations and scalings carry over), and copies
+the style of the faces it replaces. Tiers don't switch while the mobject is
+being animated (manim suspends its updaters then), so a Transform sees the
+same faces from start to end.
+"""
+import functools
+
+import numpy as np
+from manim import *
+
+from checkpoints import Updater
+
+# (along the axis, around it) resolutions; the sides around the axis set how round it looks
+LOD_TIERS = [(1, 4), (2, 8), (4, 16), (8, 32)]
+# Local height range of the unit surfaces (the cone has its apex at the origin)
+_ENDS = {"cylinder": (-0.5, 0.5), "cone": (-1.0, 0.0)}
+_STYLE_ATTRIBUTES = [
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "sheen_direction",
+    "background_image",
+    "shade_in_3d",
+]
+
+
+def _faces(surface):
+    # The grid faces of a surface, not its end caps or (for an arrow) its cone
+    return [submobject for submobject in surface.submobjects if hasattr(submobject, "u_index")]
+
+
+@functools.lru_cache(maxsize=None)
+def unit_mesh(kind, resolution):
+    """(faces, 16, 3) points and (faces, 2) uv indices of a unit cylinder or cone at ``resolution``."""
+    if kind == "cone":
+        surface = Cone(base_radius=1, height=1, resolution=resolution)
+    else:
+        surface = Cylinder(radius=1, height=1, resolution=resolution, show_ends=False)
+    faces = _faces(surface)
+    points = np.array([face.points for face in faces])
+    indices = np.array([(face.u_index, face.v_index) for face in faces])
+    return points, indices
+
+
+def _fit_faces(resolution):
+    # A few faces around the first and last rings pin down the placement
+    along, around = resolution
+    ring = [0, around // 4, around // 2, 3 * around // 4]
+    return sorted({*ring, *((along - 1) * around + v for v in ring)})
+
+
+@functools.lru_cache(maxsize=None)
+def _placement_solver(kind, resolution):
+    # Least-squares fit of the affine map taking the unit mesh to a surface's points
+    local = unit_mesh(kind, resolution)[0][_fit_faces(resolution)].reshape(-1, 3)
+    return np.linalg.pinv(np.column_stack([local, np.ones(len(local))]))
+
+
+def pixel_radius(camera, placement, ends):
+    """On-screen radius in pixels, at its nearer end, of a surface placed by ``placement``.
+
+    ``placement`` rows are the images of the unit x, y and z axes and of the
+    origin; ``ends`` are the local heights of the two ends.
+    """
+    e1, e2, axis, origin = placement
+    centers = origin + np.outer(ends, axis)
+    points = np.concatenate([centers, centers + e1, centers + e2])
+    project = getattr(camera, "project_points", None)
+    if project is not None:
+        points = project(points)
+    centers, rim1, rim2 = points[:, :2].reshape(3, len(ends), 2)
+    # RMS of the two projected radii: the radius face-on, 1/sqrt(2) of it edge-on
+    squares = np.sum((rim1 - centers) ** 2, axis=1) + np.sum((rim2 - centers) ** 2, axis=1)
+    return np.sqrt(np.max(squares) / 2) * camera.pixel_width / camera.frame_width
+
+
+def choose_tier(pixels, current, tiers=LOD_TIERS, tolerance=0.5, hysteresis=0.25):
+    """Tier index for a surface ``pixels`` in radius, currently shown at tier ``current``."""
+    sides = np.pi * np.sqrt(pixels / (2 * tolerance))
+
+    def coarsest(needed):
+        return next((i for i, (_, around) in enumerate(tiers) if around >= needed), len(tiers) - 1)
+
+    finer = coarsest(sides)
+    if finer > current:
+        return finer
+    return min(current, coarsest(sides * (1 + hysteresis)))
+
+
+def _copy_style(face, source):
+    for name in _STYLE_ATTRIBUTES:
+        if hasattr(source, name):
+            value = getattr(source, name)
+            setattr(face, name, value.copy() if isinstance(value, np.ndarray) else value)
+
+
+class _TierCache(dict):
+    """Faces of the tiers a surface isn't showing, by tier index."""
+
+    def __deepcopy__(self, memo):
+        # Copies (animation targets, ...) rebuild their own faces if they ever switch
+        return _TierCache()
+
+
+def update_level_of_detail(mobject, camera):
+    mobject.update_level_of_detail(camera)
+
+
+class _LevelOfDetailMixin:
+    def _setup_level_of_detail(self, camera, tiers, tolerance, hysteresis):
+        self.lod_tiers = list(tiers)
+        self.lod_tolerance = tolerance
+        self.lod_hysteresis = hysteresis
+        for part, _ in self._lod_parts():
+            part.lod_tier = 0
+            part._lod_faces = _TierCache()
+        if camera is not None:
+            self.add_updater(Updater(update_level_of_detail, camera), call_updater=True)
+
+    def _lod_parts(self):
+        parts = [(self, "cylinder")]
+        if isinstance(getattr(self, "cone", None), Cone):
+            parts.append((self.cone, "cone"))
+        return parts
+
+    def update_level_of_detail(self, camera):
+        """Switch each surface to the tier its current on-screen size needs."""
+        for part, kind in self._lod_parts():
+            resolution = self.lod_tiers[part.lod_tier]
+            faces = _faces(part)
+            template = unit_mesh(kind, resolution)[0]
+            if len(faces) != len(template):
+                # Rebuilt by something else (become, align_data, ...): leave it alone
+                continue
+            fitted = [faces[i].points for i in _fit_faces(resolution)]
+            if any(points.shape != template.shape[1:] for points in fitted):
+                continue
+            fitted = np.concatenate(fitted)
+            placement = _placement_solver(kind, resolution) @ fitted
+            pixels = pixel_radius(camera, placement, _ENDS[kind])
+            tier = choose_tier(pixels, part.lod_tier, self.lod_tiers, self.lod_tolerance, self.lod_hysteresis)
+            if tier != part.lod_tier:
+                self._show_tier(part, kind, tier, faces, placement)
+        return self
+
+    def _show_tier(self, part, kind, tier, old_faces, placement):
+        old_resolution, resolution = self.lod_tiers[part.lod_tier], self.lod_tiers[tier]
+        points, indices = unit_mesh(kind, resolution)
+        faces = part._lod_faces.pop(tier, None)
+        if faces is None:
+            faces = [ThreeDVMobject() for _ in indices]
+            for face, (u_index, v_index) in zip(faces, indices.tolist()):
+                face.u_index, face.v_index = u_index, v_index
+
+        # Each new face is placed like the old ones and styled like the old face covering the same spot
+        world = points @ placement[:3] + placement[3]
+        sources = (indices[:, 0] * old_resolution[0] // resolution[0]) * old_resolution[1] + (
+            indices[:, 1] * old_resolution[1] // resolution[1]
+        )
+        for face, face_points, source in zip(faces, world, sources.tolist()):
+            face.points = face_points
+            _copy_style(face, old_faces[source])
+
+        part.submobjects = faces + [submobject for submobject in part.submobjects if not hasattr(submobject, "u_index")]
+        part._lod_faces[part.lod_tier] = old_faces
+        part.lod_tier = tier
+
+
+class LODCylinder(_LevelOfDetailMixin, Cylinder):
+    """``Cylinder`` whose resolution follows its on-screen size (see module docs).
+
+    ``camera`` is the scene's camera; without one the cylinder stays at the
+    coarsest tier until ``update_level_of_detail`` is called.
+    """
+
+    def __init__(self, *args, camera=None, tiers=LOD_TIERS, tolerance=0.5, hysteresis=0.25, **kwargs):
+        super().__init__(*args, resolution=tiers[0], **kwargs)
+        self._setup_level_of_detail(camera, tiers, tolerance, hysteresis)
+
+
+class LODArrow3D(_LevelOfDetailMixin, Arrow3D):
+    """``Arrow3D`` whose shaft and tip resolutions follow their on-screen sizes (see module docs)."""
+
+    def __init__(self, start=LEFT, end=RIGHT, camera=None, tiers=LOD_TIERS, tolerance=0.5, hysteresis=0.25, **kwargs):
+        super().__init__(start=start, end=end, resolution=tiers[0], **kwargs)
+        self._setup_level_of_detail(camera, tiers, tolerance, hysteresis)
@@ -0,0 +1,172 @@
+"""One vectorized builder for the MLP diagrams used across the network scenes.
+
+Node positions and edge endpoints are computed with NumPy, and every layer's
+edges (solid or dashed) become a single LineBundle stroke, instead of one
+``Line``/``DashedLine`` per connection built in nested Python loops. A
+784-512-512-10 network (with ``layer_heights`` so it fits the frame) is about
+670k edges: as separate Lines it cannot be built in any reasonable time, as
+three solid strokes it takes a few array operations. Dashed edges multiply the
+segment count by the dashes per edge, so keep them for the smaller layers.
+
+    diagram = MLPDiagram([3, 5, 3, 2], edge_styles=[DOTTED_EDGES, DOTTED_EDGES, SOLID_EDGES])
+    diagram.layers          # VGroup of layers, each a VGroup of node Circles (+ ellipsis dots)
+    diagram.connections     # VGroup with one LineBundle per pair of consecutive layers
+    diagram.edge_table      # EdgeTable: layer/source/target of every edge
+    self.play(CreateLines(diagram.connections[0]))
+"""
+import numpy as np
+from manim import *
+
+from edge_table import EdgeTable
+from line_bundle import LineBundle
+
+SOLID_EDGES = {"color": WHITE, "stroke_width": 2, "stroke_opacity": 0.8}
+DOTTED_EDGES = {"color": GRAY, "stroke_width": 1.5, "stroke_opacity": 0.6, "dash_length": 0.1}
+
+
+def _moved_copies(template, offsets):
+    """Copies of ``template`` (a mobject without submobjects) moved by each of ``offsets``.
+
+    ``Mobject.copy`` deep-copies every attribute of every copy, which dominates
+    building thousands of nodes. A shallow copy that takes its own copy of each
+    array, list and dict attribute is equivalent for a plain shape.
+    """
+    points = template.points[None] + np.asarray(offsets)[:, None]
+    state = vars(template)
+    mutable = [key for key, value in state.items() if isinstance(value, (np.ndarray, list, dict))]
+    copies = []
+    for node_points in points:
+        node = object.__new__(type(template))
+        node.__dict__.update(state)
+        for key in mutable:
+            node.__dict__[key] = state[key].copy()
+        node.points = node_points
+        copies.append(node)
+    return copies
+
+
+def layer_layout(size, max_visible=None, height=None, node_spacing=1.0, ellipsis_drop=0.0):
+    """Visible neuron indices, their y offsets (top first) and the ellipsis y.
+
+    Layers with more than ``max_visible`` neurons show the first
+    ``max_visible - 1``, an ellipsis, and the last one, which is pushed a further
+    ``ellipsis_drop`` node spacings down. The nodes span ``height`` (by default
+    ``node_spacing`` between neighbours). The ellipsis y is None without one.
+    """
+    show_ellipsis = max_visible is not None and size > max_visible
+    if show_ellipsis:
+        visible = np.r_[np.arange(max_visible - 1), size - 1]
+        # The last neuron skips the slot reserved for the ellipsis
+        slots = np.r_[np.arange(max_visible - 1), max_visible]
+        gaps = max_visible
+    else:
+        visible = slots = np.arange(size)
+        gaps = size - 1
+    if height is None:
+        height = gaps * node_spacing
+    spacing = height / gaps if gaps else 0.0
+    ys = height / 2 - slots * spacing
+    ellipsis_y = None
+    if show_ellipsis:
+        ys[-1] -= ellipsis_drop * spacing
+        ellipsis_y = height / 2 - (max_visible - 1 + 0.3) * spacing
+    return visible, ys, ellipsis_y
+
+
+class MLPDiagram(VGroup):
+    """Layered network diagram: node Circles per layer and one edge stroke per layer pair.
+
+    ``layer_heights``, ``ellipsis_drop`` and ``edge_styles`` may be given per
+    layer (per layer pair for ``edge_styles``) or as a single value. An edge
+    style is a dict of ``color``, ``stroke_width``, ``stroke_opacity`` and an
+    optional ``dash_length`` for dashed edges. Nodes are listed bottom first
+    unless ``first_node="top"``. Unpacks as ``layers, connections``.
+    """
+
+    def __init__(
+        self,
+        layer_sizes,
+        layer_spacing=2.0,
+        node_radius=0.2,
+        node_spacing=1.0,
+        layer_heights=None,
+        max_visible=None,
+        ellipsis_drop=0.0,
+        first_node="bottom",
+        color=BLUE,
+        node_fill_opacity=0.3,
+        node_stroke_width=2,
+        edge_styles=None,
+        **kwargs,
+    ):
+        num_layers = len(layer_sizes)
+        self.layer_sizes = list(layer_sizes)
+        layer_heights = self._per_layer(layer_heights, num_layers)
+        ellipsis_drop = self._per_layer(ellipsis_drop, num_layers)
+        if edge_styles is None:
+            edge_styles = {"color": color, "stroke_width": 0.7, "stroke_opacity": 0.4}
+        edge_styles = self._per_layer(edge_styles, num_layers - 1)
+        flip = -1.0 if first_node == "bottom" else 1.0
+
+        # Node positions, all layers at once
+        self.visible_indices = []
+        self.node_positions = []
+        ellipsis_ys = []
+        for i, size in enumerate(layer_sizes):
+            visible, ys, ellipsis_y = layer_layout(
+                size, max_visible, layer_heights[i], node_spacing, ellipsis_drop[i]
+            )
+            x = (i - (num_layers - 1) / 2) * layer_spacing
+            positions = np.zeros((len(visible), 3))
+            positions[:, 0] = x
+            positions[:, 1] = flip * ys
+            self.visible_indices.append(visible)
+            self.node_positions.append(positions)
+            ellipsis_ys.append(None if ellipsis_y is None else (x, flip * ellipsis_y))
+
+        # Nodes are copies of one template circle
+        template = Circle(radius=node_radius, color=color)
+        template.set_fill(color, opacity=node_fill_opacity)
+        template.set_stroke(color, width=node_stroke_width)
+        self.layers = VGroup()
+        for positions, ellipsis in zip(self.node_positions, ellipsis_ys):
+            # Added in one call: VGroup.add checks each new node against the ones already in
+            layer = VGroup(*_moved_copies(template, positions))
+            if ellipsis is not None:
+                x, y = ellipsis
+                layer.add(VGroup(*[
+                    Dot(point=[x, y - flip * k * 0.2, 0], radius=0.05, color=color)
+                    for k in range(3)
+                ]))
+            self.layers.add(layer)
+
+        # Edges between visible nodes, one stroke per layer pair
+        self.connections = VGroup()
+        table = {"layers": [], "sources": [], "targets": [], "segments": []}
+        for i, style in enumerate(edge_styles):
+            sources, targets = self.node_positions[i], self.node_positions[i + 1]
+            starts = np.repeat(sources, len(targets), axis=0)
+            ends = np.tile(targets, (len(sources), 1))
+            stroke = LineBundle(starts, ends, **style)
+            self.connections.add(stroke)
+
+            counts = stroke.line_counts
+            stops = np.cumsum(counts)
+            table["layers"].append(np.full(len(counts), i))
+            table["sources"].append(np.repeat(self.visible_indices[i], len(targets)))
+            table["targets"].append(np.tile(self.visible_indices[i + 1], len(sources)))
+            table["segments"].append(np.stack([stops - counts, stops], axis=1))
+        self.edge_table = EdgeTable(
+            self.layer_sizes,
+            *(np.concatenate(table[key]) for key in ("layers", "sources", "targets")),
+            segments=np.concatenate(table["segments"]),
+            strokes=self.connections,
+        )
+
+        super().__init__(self.layers, self.connections, **kwargs)
+
+    @staticmethod
+    def _per_layer(value, count):
+        if isinstance(value, (list, tuple)):
+            return list(value)
+        return [value] * count
@@ -1,9 +1,37 @@
 from manim import *
 
-class MLPZoomNetwork(Scene):
-    def construct(self):
+from line_bundle import CreateLines
+from mlp_diagram import DOTTED_EDGES, SOLID_EDGES, MLPDiagram
+from sections import SectionedScene
+from updater_graph import UpdaterGraph
+
+
+# Glued updaters are module-level functions so the section snapshots can pickle them
+def follow_number(arrow, number, gap):
+    """Point ``arrow`` left from just beside ``number``."""
+    arrow.put_start_and_end_on(
+        [number.get_left()[0] - 0.12, number.get_y(), 0],
+        [number.get_left()[0] - (0.12 + gap), number.get_y(), 0]
+    )
+
+
+def follow_arrow_end(label, arrow):
+    label.next_to(arrow.get_end(), LEFT, buff=0.2)
+
+
+def beside_neuron(label, neuron, gap, side):
+    """Keep ``label`` ``gap`` units beyond the ``side`` (LEFT or RIGHT) edge of ``neuron``."""
+    edge = neuron.get_critical_point(side)[0]
+    label.set_x(edge + side[0] * (gap + label.get_width()/2)).set_y(neuron.get_y())
+
+
+class MLPZoomNetwork(SectionedScene, Scene):
+    # Beats, renderable one at a time (see sections.py)
+    SECTIONS = ["build_network", "zoom_in", "to_matrix", "multiply", "result"]
+
+    def build_network(self):
         # Create network components
-        network, dotted_connections, solid_connections = self.create_mlp_model()
+        network, dotted_connections, solid_connections, edges = self.create_mlp_model()
         
         # Center the entire network
         full_network = VGroup(network, dotted_connections, solid_connections)
@@ -13,33 +41,14 @@ class MLPZoomNetwork(Scene):
         equation = MathTex(r"h = W \cdot x", font_size=48)
         equation.move_to(full_network.get_top() + UP * 0.8)
         
-        # Prepare layer connections for animation
-        layer_connections_list = []
-        for i, layer in enumerate(network):
-            if i < len(network) - 1:
-                layer_connections = []
-                for node1 in network[i]:
-                    for node2 in network[i + 1]:
-                        if i == len(network) - 2:  # Last layer connections (solid)
-                            for connection in solid_connections:
-                                if (connection.get_start() == node1.get_center()).all() and \
-                                   (connection.get_end() == node2.get_center()).all():
-                                    layer_connections.append(connection)
-                        else:  # Earlier layer connections (dotted)
-                            for connection in dotted_connections:
-                                if (connection.get_start() == node1.get_center()).all() and \
-                                   (connection.get_end() == node2.get_center()).all():
-                                    layer_connections.append(connection)
-                layer_connections_list.append(layer_connections)
-            else:
-                layer_connections_list.append([])
+        # Connections grouped by layer, straight from the edge table (one stroke per pair of layers)
+        layer_connections_list = [edges.stroke(i) for i in range(len(network) - 1)] + [None]
         
         # Prepare zoom elements
         last_two_layers = VGroup(network[-2], network[-1])  # Last 2 layers (3 -> 2)
         last_layer_connections = solid_connections          # Connections between last 2 layers
         focus_group = VGroup(last_two_layers, last_layer_connections)
         fade_group = VGroup(network[:-2], dotted_connections, equation)
-        scale_factor = 1.2
         
         # Prepare input vector elements
         left_layer = last_two_layers[0]  # 3 neurons (index order: bottom, mid, top)
@@ -59,6 +68,10 @@ class MLPZoomNetwork(Scene):
             t.set_y(left_layer[idx].get_y())
             side_nums.add(t)
         
+        # Labels glued to neurons, arrows glued to labels, ...: each glued updater
+        # only reruns when a mobject it reads moved (see updater_graph.py)
+        glue = UpdaterGraph()
+
         # Create arrows and labels for the input neurons
         arrow_gap = 0.8
         arrows = VGroup()
@@ -77,24 +90,17 @@ class MLPZoomNetwork(Scene):
             arrows.add(feature_arrow)
 
             # Keep arrows glued to the numbers during transforms
-            feature_arrow.add_updater(lambda m, n=num_label: m.put_start_and_end_on(
-                [n.get_left()[0] - 0.12, n.get_y(), 0],
-                [n.get_left()[0] - (0.12 + arrow_gap), n.get_y(), 0]
-            ))
+            glue.add(feature_arrow, follow_number, num_label, arrow_gap)
 
             # Feature label to the left of arrow end (and keep it following the arrow)
             label = Tex(feature_name, font_size=30, color=WHITE)
             label.next_to(feature_arrow.get_end(), LEFT, buff=0.2)
-            label.add_updater(lambda m, a=feature_arrow: m.next_to(a.get_end(), LEFT, buff=0.2))
+            glue.add(label, follow_arrow_end, feature_arrow)
             feature_labels.add(label)
 
         # Keep left-side numbers aligned to their neurons during initial movements
         for (txt, idx), label in zip(nums_spec, side_nums):
-            label.add_updater(
-                lambda m, i=idx: m.set_x(
-                    left_layer[i].get_left()[0] - label_gap - m.get_width()/2
-                ).set_y(left_layer[i].get_y())
-            )
+            glue.add(label, beside_neuron, left_layer[idx], label_gap, LEFT)
         
         # Prepare result numbers for the right layer (aligned to neurons)
         right_layer = last_two_layers[1]
@@ -112,11 +118,7 @@ class MLPZoomNetwork(Scene):
 
         # Keep right-side numbers aligned to their neurons during any subsequent transforms
         for (txt, idx), label in zip(right_nums_spec, right_side_nums):
-            label.add_updater(
-                lambda m, i=idx: m.set_x(
-                    right_layer[i].get_right()[0] + label_gap + m.get_width()/2
-                ).set_y(right_layer[i].get_y())
-            )
+            glue.add(label, beside_neuron, right_layer[idx], label_gap, RIGHT)
         
         # Helper function for brackets
         def bracket_for(mobj, side=LEFT, xpad=0.15, hpad=0.08):
@@ -161,17 +163,38 @@ class MLPZoomNetwork(Scene):
         equation_written = False
         for i, layer in enumerate(network):
             animations = [GrowFromCenter(node) for node in layer]
-            if layer_connections_list[i]:
-                animations += [Create(edge) for edge in layer_connections_list[i]]
+            if layer_connections_list[i] is not None:
+                animations.append(CreateLines(layer_connections_list[i]))
                 if not equation_written:
                     animations.append(Create(equation))
                     equation_written = True
             self.play(*animations, run_time=1.0)
         self.wait(0.3)
-        
+
+        # Shared with the later sections
+        self.solid_connections = solid_connections
+        self.last_two_layers = last_two_layers
+        self.focus_group = focus_group
+        self.fade_group = fade_group
+        self.side_nums = side_nums
+        self.arrows = arrows
+        self.feature_labels = feature_labels
+        self.right_side_nums = right_side_nums
+        self.right_nums_spec = right_nums_spec
+        self.label_gap = label_gap
+        self.matrix_group = matrix_group
+        self.input_vec_col = input_vec_col
+        self.equal_sign = equal_sign
+        self.result_vec = result_vec
+
+    def zoom_in(self):
+        focus_group = self.focus_group
+        side_nums, arrows, feature_labels = self.side_nums, self.arrows, self.feature_labels
+        scale_factor = 1.2
+
         # Zoom in on last 2 layers and fade the rest
         self.play(
-            FadeOut(fade_group, run_time=1.5),
+            FadeOut(self.fade_group, run_time=1.5),
             focus_group.animate.scale(scale_factor).move_to(ORIGIN),
             run_time=2.0
         )
@@ -189,15 +212,20 @@ class MLPZoomNetwork(Scene):
 
         # Move to upper area (the input vector follows because it's in focus_group)
         self.play(focus_group.animate.to_edge(UP, buff=0.5), run_time=1.0)
-        
+
+    def to_matrix(self):
+        last_two_layers = self.last_two_layers
+        side_nums, arrows, feature_labels = self.side_nums, self.arrows, self.feature_labels
+        W_label, matrix_W = self.matrix_group
+
         # Create and position arrow (after movements are complete)
         # Anchor relative to the last two layers + their connections only,
         # so side annotations don't affect placement.
-        anchor_group = VGroup(last_two_layers, last_layer_connections)
+        anchor_group = VGroup(last_two_layers, self.solid_connections)
         arrow_start = anchor_group.get_bottom() + DOWN * 0.3
         arrow_end = arrow_start + DOWN * 1.0
         arrow = Arrow(start=arrow_start, end=arrow_end, color=WHITE, stroke_width=2, buff=0)
-        matrix_group.move_to(arrow_end + DOWN * 1.0)
+        self.matrix_group.move_to(arrow_end + DOWN * 1.0)
         
         # Dim neurons, arrows, labels and grow arrow simultaneously
         self.play(
@@ -216,10 +244,10 @@ class MLPZoomNetwork(Scene):
             flabel.clear_updaters()
         
         # Remove arrows and labels from focus_group to prevent them from following transforms
-        focus_group.remove(arrows, feature_labels)
+        self.focus_group.remove(arrows, feature_labels)
         
         # Morph a copy of connections into the matrix for a nice reveal
-        connections_copy = solid_connections.copy()
+        connections_copy = self.solid_connections.split()
         connections_copy.set_color(WHITE).set_stroke(opacity=0.9, width=4)
         self.play(Write(W_label), ReplacementTransform(connections_copy, matrix_W), run_time=1.5)
         self.wait(0.2)
@@ -233,6 +261,12 @@ class MLPZoomNetwork(Scene):
             run_time=0.8
         )
 
+    def multiply(self):
+        left_layer = self.last_two_layers[0]
+        side_nums, arrows, feature_labels = self.side_nums, self.arrows, self.feature_labels
+        matrix_W = self.matrix_group[1]
+        input_vec_col, equal_sign, result_vec = self.input_vec_col, self.equal_sign, self.result_vec
+
         # Position elements for final equation
         input_vec_col.next_to(matrix_W, RIGHT, buff=0.35)
         equal_sign.next_to(input_vec_col, RIGHT, buff=0.35)
@@ -265,13 +299,17 @@ class MLPZoomNetwork(Scene):
         )
 
         # Quick flash of the connections to imply multiplication
-        self.play(Indicate(solid_connections, scale_factor=1.02), run_time=0.35)
+        self.play(Indicate(self.solid_connections, scale_factor=1.02), run_time=0.35)
 
         # Show '=' and the resulting vector [0.6, 1.0]
         self.play(FadeIn(equal_sign), FadeIn(result_vec), run_time=0.7)
-        
+
+    def result(self):
+        right_layer = self.last_two_layers[1]
+        right_side_nums, label_gap = self.right_side_nums, self.label_gap
+
         # Re-align right-side numbers to current neuron positions (after all moves)
-        for (txt, idx), label in zip(right_nums_spec, right_side_nums):
+        for (txt, idx), label in zip(self.right_nums_spec, right_side_nums):
             label.set_x(right_layer[idx].get_right()[0] + label_gap + label.get_width()/2)
             label.set_y(right_layer[idx].get_y())
 
@@ -292,47 +330,20 @@ class MLPZoomNetwork(Scene):
         self.wait(2)
 
     def create_mlp_model(self, color=BLUE):
-        network = VGroup()
-        layers = 4
-        nodes_per_layer = [3, 5, 3, 2]  # Updated last 2 layers to be 3 and 2 neurons
-        layer_spacing = 2.0
-
-        # Create nodes for each layer
-        for i in range(layers):
-            layer = VGroup()
-            for j in range(nodes_per_layer[i]):
-                node = Circle(radius=0.2, color=color)
-                node.set_fill(color, opacity=0.3)
-                node.set_stroke(color, width=2)
-                node.move_to([i * layer_spacing - (layers-1) * layer_spacing/2, 
-                             j - (nodes_per_layer[i] - 1) / 2, 0])
-                layer.add(node)
-            network.add(layer)
-
-        # Create connections with dotted lines for first layers, solid for last layer
-        dotted_connections = VGroup()
-        solid_connections = VGroup()
-        for i in range(layers - 1):
-            for node1 in network[i]:
-                for node2 in network[i + 1]:
-                    if i == layers - 2:  # Last layer connections (solid)
-                        connection = Line(
-                            node1.get_center(),
-                            node2.get_center(),
-                            stroke_opacity=0.9,
-                            stroke_width=4,
-                            color=WHITE
-                        )
-                        solid_connections.add(connection)
-                    else:  # Earlier layer connections (dotted)
-                        connection = DashedLine(
-                            node1.get_center(),
-                            node2.get_center(),
-                            dash_length=0.1,
-                            stroke_width=1.5,
-                            color=GRAY,
-                            stroke_opacity=0.6
-                        )
-                        dotted_connections.add(connection)
-        
-        return network, dotted_connections, solid_connections
\ No newline at end of file
+        # Dotted lines for first layers, solid for last layer
+        diagram = MLPDiagram(
+            [3, 5, 3, 2],  # Updated last 2 layers to be 3 and 2 neurons
+            layer_spacing=2.0,
+            node_radius=0.2,
+            color=color,
+            edge_styles=[
+                DOTTED_EDGES,
+                DOTTED_EDGES,
+                {**SOLID_EDGES, "stroke_width": 4, "stroke_opacity": 0.9},
+            ],
+        )
+        network, connections = diagram
+        dotted_connections = VGroup(*connections[:-1])
+        solid_connections = connections[-1]
+
+        return network, dotted_connections, solid_connections, diagram.edge_table
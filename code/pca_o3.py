@@ -1,7 +1,12 @@
 from manim import *
 import numpy as np
 
-class PCAIntro(ThreeDScene):
+from group_fade import FadeInGroup
+from line_bundle import CreateLines, LineBundle
+from point_cloud import FadeInPoints, PointCloud
+from seeding import SeededScene
+
+class PCAIntro(SeededScene, ThreeDScene):
     """A concise, intuitive animation that visually explains Principal Component Analysis (PCA).
 
     Updated to 3-D → 1-D:
@@ -10,6 +15,9 @@ class PCAIntro(ThreeDScene):
     3. Project every point onto PC-1, collapsing the 3-D cloud into a 1-D line.
     """
 
+    # Seed of the published render (see seeding.py)
+    SEED = 42
+
     # Tunables for easy experimentation
     N_POINTS = 70
     MEAN = np.array([0, 0, 0])
@@ -20,11 +28,15 @@ class PCAIntro(ThreeDScene):
         [0.8, 0.6, 1.0],
     ])
     DOT_RADIUS = 0.06
+    # Above this many samples, draw them as one PointCloud instead of Dot3D spheres
+    POINT_CLOUD_THRESHOLD = 500
+    # Stagger of the reveals, in units of one sample's own duration
+    # (the original 70 samples at lag_ratio=0.02); kept fixed for any N_POINTS
+    REVEAL_SPREAD = 1.38
 
     def construct(self):
         # 1) Generate and show the synthetic 3-D data cloud
-        rng = np.random.default_rng(42)
-        data = rng.multivariate_normal(self.MEAN, self.COV, self.N_POINTS)
+        data = self.rng.multivariate_normal(self.MEAN, self.COV, self.N_POINTS)
         # Set an initial 3-D camera orientation for better depth perception
         start_distance = 9.0
         self.set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES, distance=start_distance)
@@ -37,10 +49,15 @@ class PCAIntro(ThreeDScene):
             z_length=6,
             axis_config={"color": GRAY, "stroke_width": 2},
         )
-        dots = VGroup(*[
-            Dot3D(point=[x, y, z], radius=self.DOT_RADIUS, color=BLUE)
-            for x, y, z in data
-        ])
+        use_point_cloud = self.N_POINTS > self.POINT_CLOUD_THRESHOLD
+        reveal_lag = self.REVEAL_SPREAD / max(self.N_POINTS - 1, 1)
+        if use_point_cloud:
+            dots = PointCloud(data, radius=self.DOT_RADIUS, color=BLUE)
+        else:
+            dots = VGroup(*[
+                Dot3D(point=[x, y, z], radius=self.DOT_RADIUS, color=BLUE)
+                for x, y, z in data
+            ])
         self.wait(0.5)
         # 2) Compute principal components (eigenvectors of covariance)
         cov_mat = np.cov(data.T)
@@ -61,7 +78,10 @@ class PCAIntro(ThreeDScene):
 
         # Animation sequence - all self.play calls at the end
         self.play(Create(axes))
-        self.play(LaggedStart(*[FadeIn(dot) for dot in dots], lag_ratio=0.02))
+        if use_point_cloud:
+            self.play(FadeInPoints(dots, lag_ratio=reveal_lag, run_time=1 + self.REVEAL_SPREAD))
+        else:
+            self.play(FadeInGroup(dots, lag_ratio=reveal_lag, run_time=1 + self.REVEAL_SPREAD))
         def v(*xy):
             x, y = xy
             return np.array([x, y, 0])
@@ -79,25 +99,27 @@ class PCAIntro(ThreeDScene):
         self.wait(0.5)
 
         # 5) Project each dot onto PC‑1 and show its 1‑D representation
-        projections = VGroup()
-        projection_lines = VGroup()
-        for x, y, z in data:
-            proj_len = np.dot([x, y, z], pc1)  # scalar coordinate along PC-1
-            proj_point = proj_len * pc1  # 3-D coordinates on the PC-1 axis
-            proj_dot = Dot3D(point=proj_point, radius=self.DOT_RADIUS, color=RED)
-            projections.add(proj_dot)
-
-            # Connecting line from each point to its projection on PC-1 (dashed gray for clarity)
-            line = DashedLine(
-                start=[x, y, z],
-                end=proj_point,
-                dash_length=0.1,
-                stroke_opacity=0.6,
-                color=GRAY,
-            )
-            projection_lines.add(line)
-
-        self.play(LaggedStart(*[Create(line) for line in projection_lines], lag_ratio=0.02))
+        proj_lens = data @ pc1  # scalar coordinates along PC-1
+        proj_points = proj_lens[:, None] * pc1  # 3-D coordinates on the PC-1 axis
+        if use_point_cloud:
+            projections = PointCloud(proj_points, radius=self.DOT_RADIUS, color=RED)
+        else:
+            projections = VGroup(*[
+                Dot3D(point=point, radius=self.DOT_RADIUS, color=RED) for point in proj_points
+            ])
+
+        # Connecting line from each point to its projection on PC-1 (dashed gray for
+        # clarity), all drawn as one stroke. Large clouds use solid lines: dashing
+        # would multiply the segment count by ~25.
+        projection_lines = LineBundle(
+            data,
+            proj_points,
+            dash_length=None if use_point_cloud else 0.1,
+            stroke_opacity=0.6,
+            color=GRAY,
+        )
+
+        self.play(CreateLines(projection_lines, lag_ratio=reveal_lag, run_time=1 + self.REVEAL_SPREAD))
         self.play(Transform(dots.copy(), projections))
         self.wait(0.5)
 
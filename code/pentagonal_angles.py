@@ -1,7 +1,18 @@
 from manim import *
 import numpy as np
 
-class VectorAnimation(ThreeDScene):
+from aimable_arrows import AimArrows, AimableArrow3D
+from arrangement import solve_arrangement
+from seeding import SeededScene
+
+class VectorAnimation(SeededScene, ThreeDScene):
+    # Seed of the published render (see seeding.py)
+    SEED = 42
+
+    # Number of feature vectors and the objective they are arranged by (see arrangement.py)
+    N_FEATURES = 5
+    OBJECTIVE = "max_cos"
+
     def construct(self):
         # Set camera to perspective view with explicit distance for zoom control
         start_distance = 8.0
@@ -22,61 +33,38 @@ class VectorAnimation(ThreeDScene):
         self.add(axes)
         # Scale factor for vectors (80% of unit length in the scaled coordinate system)
         vector_scale = 2
-        # Generate 5 random initial directions (normalized)
-        np.random.seed(42)  # For reproducible results
+        # Generate random initial directions (normalized)
+        np.random.seed(self.seed)  # For reproducible results
         initial_directions = []
-        for _ in range(5):
+        for _ in range(self.N_FEATURES):
             # Generate random direction
             direction = np.random.randn(3)
             direction = direction / np.linalg.norm(direction)
             initial_directions.append(direction)
-        # Calculate target positions for equidistant angles
-        # Using 5 vertices of a regular dodecahedron for optimal 3D distribution
-        phi = (1 + np.sqrt(5)) / 2  # Golden ratio
-        # These are 5 well-distributed points on a sphere
-        target_directions = np.array([
-            [1, 1, 1],
-            [1, -1, -1],
-            [-1, 1, -1],
-            [-1, -1, 1],
-            [0, phi, 1/phi]
-        ])
-        # Normalize target directions
-        for i in range(5):
-            target_directions[i] = target_directions[i] / np.linalg.norm(target_directions[i])
+        # Target positions with equidistant angles, from the arrangement solver
+        target_directions = solve_arrangement(self.N_FEATURES, 3, objective=self.OBJECTIVE)
         # Create vectors with different colors
         colors = [RED, BLUE, GREEN, YELLOW, PURPLE]
         vectors = []
         # Create initial vectors
-        for i in range(5):
-            vector = Arrow3D(
+        for i in range(self.N_FEATURES):
+            vector = AimableArrow3D(
                 start=origin_pos,
                 end=origin_pos + initial_directions[i] * vector_scale,
-                color=colors[i],
+                color=colors[i % len(colors)],
                 thickness=0.02
             )
             vectors.append(vector)
             self.add(vector)
-        # Animation function for smooth interpolation
-        def update_vectors(mob, alpha):
-            for i, vector in enumerate(vectors):
-                # Linear interpolation between initial and target directions
-                current_direction = (1 - alpha) * initial_directions[i] + alpha * target_directions[i]
-                current_direction = current_direction / np.linalg.norm(current_direction)
-                
-                # Update vector end point
-                new_end = origin_pos + current_direction * vector_scale
-                vector.become(Arrow3D(
-                    start=origin_pos,
-                    end=new_end,
-                    color=colors[i],
-                    thickness=0.02
-                ))
-        
-        # Create the animation using UpdateFromAlphaFunc
-        animation = UpdateFromAlphaFunc(
+        # Swing all vectors towards their targets; the existing arrows are re-aimed
+        # in place (normalized linear interpolation of the directions) instead of
+        # being rebuilt every frame
+        animation = AimArrows(
             VGroup(*vectors),
-            update_vectors,
+            origin_pos,
+            initial_directions,
+            target_directions,
+            length=vector_scale,
             run_time=4,
             rate_func=smooth
         )
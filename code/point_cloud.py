@@ -0,0 +1,55 @@
+"""Array-backed point clouds for data-set scenes.
+
+A ``Dot3D`` is a sphere surface mesh, so a VGroup of them tops out at a few
+hundred samples. A PointCloud keeps every sample as one row of a single
+PMobject, which the camera draws in one vectorized pass, so 100k samples cost
+about as much as a handful of Dot3Ds.
+
+    cloud = PointCloud(data, radius=0.03, color=BLUE)
+    self.play(FadeInPoints(cloud, lag_ratio=1.4 / len(data)))
+"""
+import numpy as np
+from manim import *
+
+from line_bundle import lagged_alphas
+
+
+class PointCloud(PMobject):
+    """One square point per row of ``points``, about ``2 * radius`` scene units wide.
+
+    The camera copies point colors straight into the frame without blending, so
+    points are always fully opaque; fades are done by blending the color
+    towards the background instead (see FadeInPoints).
+    """
+
+    def __init__(self, points, radius=0.05, color=BLUE, **kwargs):
+        # The camera draws points as squares of stroke_width pixels
+        width = max(1.0, 2 * radius * config.pixel_width / config.frame_width)
+        super().__init__(stroke_width=width, **kwargs)
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        self.add_points(points, color=color)
+
+
+class FadeInPoints(Animation):
+    """Fade the points of a PointCloud in one after another.
+
+    Same timing as ``LaggedStart(*[FadeIn(dot) for dot in dots], lag_ratio=...)``,
+    done as one array update: points not started yet are left out, the others
+    are blended from the background color to their own.
+    """
+
+    def __init__(self, mobject, lag_ratio=0.0, **kwargs):
+        super().__init__(mobject, lag_ratio=lag_ratio, introducer=True, **kwargs)
+
+    def begin(self):
+        self.all_points = self.mobject.points.copy()
+        self.all_rgbas = self.mobject.rgbas.copy()
+        self.background = color_to_rgba(config.background_color)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alphas = lagged_alphas(alpha, len(self.all_points), self.lag_ratio, self.rate_func)
+        started = alphas > 0
+        weights = alphas[started, None]
+        self.mobject.points = self.all_points[started]
+        self.mobject.rgbas = self.background + weights * (self.all_rgbas[started] - self.background)
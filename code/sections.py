@@ -0,0 +1,164 @@
+"""Named sections for long scenes, renderable one at a time from saved snapshots.
+
+A sectioned scene splits ``construct`` into methods listed in ``SECTIONS``,
+which share their mobjects through attributes on ``self``:
+
+    class WhatIsAFeature(SectionedScene, ThreeDScene):
+        SECTIONS = ["intro", "red_vector", "outro"]
+
+        def intro(self):
+            self.vectors = VGroup(...)
+            self.play(FadeIn(self.vectors))
+
+        def red_vector(self):
+            self.move_camera(frame_center=self.vectors[0].get_end(), ...)
+
+``SCENE_SECTIONS`` (or ``render_all.py --sections``) picks what to render: one
+section (``red_vector``) or an inclusive range (``red_vector:outro``, with
+either side optional). By default every section is rendered.
+
+At the start of each section the scene state is checkpointed under the media
+dir (see checkpoints.py): the scene's mobjects, the attributes set by earlier
+sections and the camera (its value trackers, frame center and
+fixed-orientation/fixed-in-frame mobjects). Rendering from a later section
+restores its snapshot instead of replaying the sections before it, including
+the construction of its mobjects. Without a usable snapshot (first run, or a
+state that cannot be pickled, such as an updater defined as a lambda rather
+than a ``checkpoints.Updater``) the earlier sections run with animations
+skipped, and save their snapshots for the next run.
+
+Snapshots are keyed by the source of the modules defining the scene class
+and its bases (its constants, helper methods, module-level functions such as
+glued updaters, ...), leaving out the sections that run after the snapshot:
+editing a section only invalidates the snapshots after it, editing anything
+else in those modules invalidates them all. Set ``SCENE_SECTIONS_FRESH=1`` to
+ignore snapshots, e.g. after changing another helper module a section
+depends on.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+from pathlib import Path
+
+from manim import config, logger
+
+from checkpoints import dump_checkpoint, load_checkpoint
+
+SECTIONS_ENV = "SCENE_SECTIONS"
+FRESH_ENV = "SCENE_SECTIONS_FRESH"
+
+
+def parse_section_range(spec, sections):
+    """(first, last) section indices selected by ``"name"`` or ``"first:last"``."""
+    if not spec:
+        return 0, len(sections) - 1
+    first, sep, last = spec.partition(":")
+    if not sep:
+        last = first
+    for name in (first, last):
+        if name and name not in sections:
+            raise ValueError(f"Unknown section {name!r}; expected one of {sections}")
+    start = sections.index(first) if first else 0
+    stop = sections.index(last) if last else len(sections) - 1
+    if start > stop:
+        raise ValueError(f"Section {first!r} comes after {last!r}")
+    return start, stop
+
+
+def _scene_sources(scene_class, later_sections):
+    """Source of the modules defining ``scene_class`` and its (non-manim) bases, without ``later_sections``."""
+    later = [inspect.getsource(getattr(scene_class, name)) for name in later_sections]
+    sources = {}
+    for klass in scene_class.__mro__:
+        module = inspect.getmodule(klass)
+        if module is None or module.__name__ in sources or module.__name__.split(".")[0] in ("manim", "builtins"):
+            continue
+        source = inspect.getsource(module)
+        for section in later:
+            source = source.replace(section, "")
+        sources[module.__name__] = source
+    return list(sources.values())
+
+
+class SectionedScene:
+    """Mixin running ``SECTIONS`` in order, with per-section snapshots (see module docs).
+
+    Put it before the manim scene class: ``class MyScene(SectionedScene, ThreeDScene)``.
+    """
+
+    SECTIONS = []
+
+    def construct(self):
+        first, last = parse_section_range(os.environ.get(SECTIONS_ENV), self.SECTIONS)
+        self._manim_keys = set(vars(self))
+        start = 0
+        if first > 0 and not os.environ.get(FRESH_ENV) and self._restore_snapshot(first):
+            start = first
+        for index in range(start, last + 1):
+            name = self.SECTIONS[index]
+            self.next_section(name, skip_animations=index < first)
+            if index > start:
+                self._save_snapshot(index)
+            # Looked up on the class: a section may share its name with an attribute
+            getattr(type(self), name)(self)
+
+    # Snapshots
+
+    def _snapshot_path(self, index):
+        digest = hashlib.sha256(type(self).__qualname__.encode())
+        for source in _scene_sources(type(self), self.SECTIONS[index:]):
+            digest.update(source.encode())
+        key = digest.hexdigest()[:16]
+        return Path(config.media_dir) / "sections" / type(self).__name__ / f"{index:02d}_{self.SECTIONS[index]}_{key}.ckpt"
+
+    def _shared_objects(self):
+        # Referenced from the snapshot, never copied into it
+        camera = self.renderer.camera
+        trackers = camera.get_value_trackers() if hasattr(camera, "get_value_trackers") else []
+        return [self, self.renderer, camera, *trackers]
+
+    def _section_state(self):
+        camera = self.renderer.camera
+        trackers = camera.get_value_trackers() if hasattr(camera, "get_value_trackers") else []
+        return {
+            "attributes": {key: value for key, value in vars(self).items() if key not in self._manim_keys},
+            "mobjects": self.mobjects,
+            "foreground_mobjects": self.foreground_mobjects,
+            "camera_values": [tracker.get_value() for tracker in trackers],
+            "frame_center": getattr(camera, "frame_center", None),
+            "fixed_orientation": getattr(camera, "fixed_orientation_mobjects", None),
+            "fixed_in_frame": getattr(camera, "fixed_in_frame_mobjects", None),
+            "time": self.renderer.time,
+        }
+
+    def _save_snapshot(self, index):
+        path = self._snapshot_path(index)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            dump_checkpoint(self._section_state(), path, shared=self._shared_objects())
+        except (pickle.PicklingError, TypeError, AttributeError) as exc:
+            logger.info(f"No snapshot for section {self.SECTIONS[index]!r}: {exc}")
+
+    def _restore_snapshot(self, index):
+        try:
+            state = load_checkpoint(self._snapshot_path(index), shared=self._shared_objects())
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return False
+        vars(self).update(state["attributes"])
+        self.mobjects = state["mobjects"]
+        self.foreground_mobjects = state["foreground_mobjects"]
+        camera = self.renderer.camera
+        if hasattr(camera, "get_value_trackers"):
+            for tracker, value in zip(camera.get_value_trackers(), state["camera_values"]):
+                tracker.set_value(value)
+        if state["frame_center"] is not None:
+            camera.frame_center = state["frame_center"]
+        if state["fixed_orientation"] is not None:
+            camera.fixed_orientation_mobjects = state["fixed_orientation"]
+        if state["fixed_in_frame"] is not None:
+            camera.fixed_in_frame_mobjects = state["fixed_in_frame"]
+        self.renderer.time = state["time"]
+        return True
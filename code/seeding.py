@@ -0,0 +1,53 @@
+"""One reproducible random seed per scene.
+
+manim only reuses a partial movie when the animation's hash is unchanged, so a
+scene that draws unseeded random numbers (node positions, straw offsets, ...)
+re-renders every animation on every run. Scenes that mix in ``SeededScene``
+get a seed derived from their class name, so every run draws the same numbers
+and an unchanged scene re-renders from the cache:
+
+    class NeuralStrawPacking(SeededScene, Scene):
+        def construct(self):
+            offsets = self.rng.random(12)     # per-scene numpy Generator
+
+The seed is also passed to manim's ``random_seed``, which seeds ``random`` and
+``np.random`` when the scene is created, so legacy ``random.*`` /
+``np.random.*`` calls are covered too.
+
+A scene can pin its seed with the ``SEED`` class attribute (to keep the layout
+of an already published render). Setting the ``SCENE_SEED`` environment
+variable (or ``render_all.py --seed``) mixes an override into every scene's
+seed, pinned or not, to explore other random layouts.
+"""
+import hashlib
+import os
+
+import numpy as np
+
+SEED_ENV = "SCENE_SEED"
+
+
+def scene_seed(scene_name, pinned=None, override=None):
+    """Seed of ``scene_name``: ``pinned`` if given and no override is set, else a hash of name and override."""
+    if override is None:
+        override = os.environ.get(SEED_ENV)
+    if override is None and pinned is not None:
+        return pinned
+    digest = hashlib.sha256(f"{scene_name}:{override or 0}".encode()).digest()
+    # np.random.seed (used by manim's random_seed) takes 32-bit seeds
+    return int.from_bytes(digest[:4], "little")
+
+
+class SeededScene:
+    """Mixin giving a scene ``self.seed`` and ``self.rng`` and seeding ``random``/``np.random``.
+
+    Put it before the manim scene class: ``class MyScene(SeededScene, ThreeDScene)``.
+    """
+
+    SEED = None
+
+    def __init__(self, *args, **kwargs):
+        self.seed = scene_seed(type(self).__name__, self.SEED)
+        kwargs.setdefault("random_seed", self.seed)
+        super().__init__(*args, **kwargs)
+        self.rng = np.random.default_rng(self.seed)
@@ -0,0 +1,28 @@
+"""Straight line segments as the points of a single VMobject.
+
+Many separate ``Line`` mobjects (helper lines, MLP edges, straw outlines, a
+polyline's pieces) can be drawn as one multi-segment VMobject instead:
+
+    bundle = VMobject().set_points(segments_to_points(starts, ends))
+
+Only NumPy is needed to build the points.
+"""
+import numpy as np
+
+def segments_to_points(starts, ends):
+    """VMobject points drawing one straight segment per (start, end) pair.
+
+    Consecutive segments do not share endpoints, so each one becomes its own
+    subpath of a single VMobject.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    # Filled in place: a broadcast of the four control points would build
+    # several (N, 4, 3) temporaries, which add up for 100k+ segments
+    points = np.empty((len(starts), 4, 3))
+    third = (ends - starts) / 3
+    points[:, 0] = starts
+    np.add(starts, third, out=points[:, 1])
+    np.subtract(ends, third, out=points[:, 2])
+    points[:, 3] = ends
+    return points.reshape(-1, 3)
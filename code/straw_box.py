@@ -1,7 +1,16 @@
 from manim import *
 import numpy as np
 
-class StrawBoxWithCage(ThreeDScene):
+from depth_order import DepthOrderedScene
+from seeding import SeededScene
+from straw_field import StrawField
+from straw_packing import pack_straws, pile_directions
+
+
+class StrawBoxWithCage(DepthOrderedScene, SeededScene, ThreeDScene):
+    # Seed of the published render (see seeding.py)
+    SEED = 1
+
     def construct(self):
         # Set camera to face the more square side (yz face), from a top ~45° angle
         # Use an explicit starting distance so we can animate a smooth zoom-in later
@@ -16,23 +25,15 @@ class StrawBoxWithCage(ThreeDScene):
         gap = 0.01
         spacing_y = 2 * straw_radius + gap
         spacing_z = 2 * straw_radius + gap
-        # Boxed straws layout (flat, aligned, inside the cage)
-        straws = VGroup()
-        # Create array of vertical straws (cylinders)
-        for i in range(rows):
-            for j in range(cols):
-                y = i * spacing_y - (rows - 1) * spacing_y / 2
-                z = j * spacing_z - (cols - 1) * spacing_z / 2
-                x = 0  # Keep all straws centered in x
-                straw = Cylinder(
-                    radius=straw_radius,
-                    height=straw_height,
-                    direction=RIGHT,  # Lying flat toward foreground
-                    fill_opacity=0.4,
-                    fill_color=BLUE,
-                    stroke_opacity=0.1,
-                ).move_to([x, y, z])
-                straws.add(straw)
+        # Boxed straws layout (flat, aligned, inside the cage), lying flat toward foreground
+        straws = StrawField.grid(
+            rows,
+            cols,
+            radius=straw_radius,
+            height=straw_height,
+            gap=gap,
+            camera=self.camera,
+        )
         # Dimensions for the box (tight rectangular fit with small padding)
         padding_x, padding_y, padding_z = 0.1, 0.06, 0.06
         # Width along x (cylinders lie along x): total length + padding on both sides
@@ -56,38 +57,27 @@ class StrawBoxWithCage(ThreeDScene):
         scene_group = VGroup(box, straws)
         # Build scatter target layout with the same number of straws and ordering
         num_straws = rows * cols
-        rng = np.random.default_rng(1)
-        scatter_sigma_y = straw_height * 0.25
-        scatter_sigma_z = straw_height * 0.25
-        scatter_sigma_x = straw_height * 0.05
-        y_positions = rng.normal(0.0, scatter_sigma_y, size=num_straws)
-        z_positions = rng.normal(0.0, scatter_sigma_z, size=num_straws)
-        x_positions = rng.normal(0.0, scatter_sigma_x, size=num_straws)
-        angles_yz = rng.uniform(0, 2 * np.pi, size=num_straws)
-        x_tilts = rng.normal(0.0, 0.25, size=num_straws)
-        scatter_straws_right = VGroup()
-        k = 0
-        for i in range(rows):
-            for j in range(cols):
-                dir_vec = np.array([
-                    x_tilts[k],
-                    np.cos(angles_yz[k]),
-                    np.sin(angles_yz[k]),
-                ])
-                dir_vec = dir_vec / np.linalg.norm(dir_vec)
-                scatter_straw = (
-                    Cylinder(
-                        radius=straw_radius,
-                        height=straw_height,
-                        direction=dir_vec,
-                        fill_opacity=0.4,
-                        fill_color=BLUE,
-                        stroke_opacity=0.1,
-                    )
-                    .move_to([x_positions[k], y_positions[k], z_positions[k]])
-                )
-                scatter_straws_right.add(scatter_straw)
-                k += 1
+        rng = self.rng
+        # Loose pile of straws that don't pass through each other (as in straw_scatter.py)
+        pile = pack_straws(
+            num_straws,
+            size=[straw_height * 0.25, straw_height * 1.5, straw_height * 1.5],
+            length=straw_height,
+            radius=straw_radius,
+            gap=0.01,
+            directions=pile_directions,
+            rng=rng,
+            restarts=10,
+            complete=True,
+        )
+        # Same straw count and ordering as the boxed field, so Transform maps straw to straw
+        scatter_straws_right = StrawField(
+            pile.centers,
+            pile.directions,
+            radius=straw_radius,
+            height=straw_height,
+            camera=self.camera,
+        )
         
         # With the camera oriented to face the yz-plane (theta≈0), on-screen
         # left/right corresponds to the world ±y direction (same as big_straw_box.py)
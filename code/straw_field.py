@@ -0,0 +1,241 @@
+"""Instanced straw field: thousands of straws (capped cylinders) as one mobject.
+
+``Cylinder`` builds every straw from its own surface mesh (24 x 24 faces by
+default), so the 15x15 box is already slow and a 100x100 box is out of reach.
+A StrawField keeps the straws as arrays and draws all of them as a single
+VMobject: each straw is drawn as its camera-facing silhouette (both end caps
+plus the side band), rebuilt with a few vectorized NumPy operations whenever
+the camera or the straws move.
+
+    straws = StrawField.grid(rows=100, cols=100, radius=0.05, height=4.0, camera=self.camera)
+    self.play(FadeIn(straws))
+
+The straw endpoints live in an invisible ``skeleton`` submobject, so shift,
+scale, rotate and Transform between two fields of the same size all work as
+with any other mobject.
+
+A single mobject has one fill opacity, so the straws can't fade in one after
+another. ``ShowIncreasingStraws`` draws them one after another instead, which
+is what a ``FadeIn(..., lag_ratio)`` over many straw meshes amounts to once
+each straw's fade is shorter than a frame.
+"""
+import numpy as np
+from manim import *
+
+from checkpoints import Updater
+from segments import segments_to_points
+
+# Cubic Bezier handle length that makes four quarter arcs approximate a circle
+_KAPPA = 4 * (np.sqrt(2) - 1) / 3
+_QUARTER_STARTS = np.arange(4) * PI / 2
+
+
+def _unit_rows(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 1e-12, norms, 1.0)
+
+
+def _circle_points(centers, radii, e1, e2):
+    """(N, 16, 3) points of N circles in the (e1, e2) planes, as four quarter arcs each."""
+    def on_circle(angles):
+        cos, sin = np.cos(angles)[None, :, None], np.sin(angles)[None, :, None]
+        position = cos * e1[:, None] + sin * e2[:, None]
+        tangent = -sin * e1[:, None] + cos * e2[:, None]
+        return position, tangent
+
+    r = radii[:, None, None]
+    start, start_tangent = on_circle(_QUARTER_STARTS)
+    end, end_tangent = on_circle(_QUARTER_STARTS + PI / 2)
+    p0 = centers[:, None] + r * start
+    p3 = centers[:, None] + r * end
+    p1 = p0 + _KAPPA * r * start_tangent
+    p2 = p3 - _KAPPA * r * end_tangent
+    return np.stack([p0, p1, p2, p3], axis=2).reshape(len(centers), 16, 3)
+
+
+def straw_outline_points(bottoms, tops, radii, eye=None, view=OUT):
+    """Silhouette points (48 per straw) of straws seen from ``eye`` (or along ``view``)."""
+    axis = _unit_rows(tops - bottoms)
+    centers = (bottoms + tops) / 2
+    if eye is not None:
+        eye = np.asarray(eye, dtype=float)
+        to_eye = _unit_rows(eye - centers)
+    else:
+        to_eye = np.broadcast_to(np.asarray(view, dtype=float), centers.shape)
+
+    # The side band spans the axis and the direction perpendicular to both the
+    # axis and the line of sight. Straws seen end-on have no band, so any
+    # perpendicular will do there.
+    side = np.cross(axis, to_eye)
+    end_on = np.linalg.norm(side, axis=1) < 1e-6
+    if end_on.any():
+        helper = np.where(np.abs(axis[end_on, :1]) < 0.9, RIGHT, UP)
+        side[end_on] = np.cross(axis[end_on], helper)
+    side = _unit_rows(side)
+    up = np.cross(axis, side)
+
+    # Orient every cap counter-clockwise as seen from the camera (the band
+    # already is, by the choice of ``side``), so overlapping straws add up under
+    # cairo's nonzero fill rule instead of cancelling each other out. Under
+    # perspective the two caps can face opposite ways, so each gets its own sign.
+    def facing(cap_centers):
+        if eye is None:
+            return np.where(axis @ np.asarray(view, dtype=float) < 0, -1.0, 1.0)[:, None]
+        return np.where(np.sum(axis * (eye - cap_centers), axis=1) < 0, -1.0, 1.0)[:, None]
+
+    top_cap = _circle_points(tops, radii, side, up * facing(tops))
+    bottom_cap = _circle_points(bottoms, radii, side, up * facing(bottoms))
+    offset = radii[:, None] * side
+    corners = np.stack([tops + offset, tops - offset, bottoms - offset, bottoms + offset], axis=1)
+    band = segments_to_points(
+        corners.reshape(-1, 3), np.roll(corners, -1, axis=1).reshape(-1, 3)
+    ).reshape(len(centers), 16, 3)
+    return np.concatenate([top_cap, band, bottom_cap], axis=1).reshape(-1, 3)
+
+
+def camera_eye(camera):
+    """World-space position of a ThreeDCamera's eye."""
+    rotation = camera.generate_rotation_matrix()
+    return camera.frame_center + camera.get_focal_distance() * rotation[2]
+
+
+def face_camera(field, camera):
+    field.update_outline(camera_eye(camera))
+
+
+class _StrawSkeleton(VMobject):
+    """Invisible carrier for straw endpoints and radii.
+
+    Each straw is one collinear (zero-area) curve: bottom, bottom, top, and a
+    point ``radius`` beyond the top along the axis.
+    """
+
+    def set_stroke(self, color=None, width=None, opacity=None, background=False, family=True):
+        # Never drawn, whatever style the parent field is given
+        return super().set_stroke(color, 0, opacity, background, family)
+
+
+class StrawField(VMobject):
+    """Many straws drawn as one batched mobject.
+
+    ``centers`` and ``directions`` are (N, 3) arrays; ``radius`` and ``height``
+    are scalars or length-N arrays. Pass the scene's ``camera`` (a ThreeDCamera)
+    to keep the silhouettes facing it while it moves.
+    """
+
+    def __init__(
+        self,
+        centers,
+        directions,
+        radius=0.05,
+        height=4.0,
+        camera=None,
+        fill_color=BLUE,
+        fill_opacity=0.4,
+        stroke_color=LIGHT_GREY,
+        stroke_width=0.5,
+        stroke_opacity=0.1,
+        **kwargs,
+    ):
+        super().__init__(
+            fill_color=fill_color,
+            fill_opacity=fill_opacity,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            stroke_opacity=stroke_opacity,
+            **kwargs,
+        )
+        self.skeleton = _StrawSkeleton(stroke_width=0, fill_opacity=0)
+        self.add(self.skeleton)
+        self._outline_key = None
+        self.shown = None
+        self.set_straws(centers, directions, radius, height)
+        if camera is not None:
+            # Copies of the field share the updater (and camera) rather than deep-copying it
+            self.add_updater(Updater(face_camera, camera))
+
+    @classmethod
+    def grid(cls, rows, cols, radius=0.05, height=4.0, gap=0.01, **kwargs):
+        """Straws lying along x, stacked rows x cols in the yz plane, ``gap`` apart."""
+        spacing = 2 * radius + gap
+        i, j = np.meshgrid(np.arange(rows), np.arange(cols), indexing="ij")
+        centers = np.zeros((rows * cols, 3))
+        centers[:, 1] = i.ravel() * spacing - (rows - 1) * spacing / 2
+        centers[:, 2] = j.ravel() * spacing - (cols - 1) * spacing / 2
+        directions = np.tile(RIGHT, (rows * cols, 1))
+        return cls(centers, directions, radius=radius, height=height, **kwargs)
+
+    def set_straws(self, centers, directions, radius=None, height=None):
+        centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        directions = _unit_rows(np.asarray(directions, dtype=float).reshape(-1, 3))
+        radius = self.get_radii() if radius is None else radius
+        height = self.get_heights() if height is None else height
+        radii = np.broadcast_to(np.asarray(radius, dtype=float), len(centers))
+        half = np.broadcast_to(np.asarray(height, dtype=float), len(centers))[:, None] / 2
+        bottoms = centers - half * directions
+        tops = centers + half * directions
+        markers = tops + radii[:, None] * directions
+        self.skeleton.set_points(np.stack([bottoms, bottoms, tops, markers], axis=1).reshape(-1, 3))
+        self.update_outline()
+        return self
+
+    def _skeleton_parts(self):
+        parts = self.skeleton.points.reshape(-1, 4, 3)
+        return parts[:, 0], parts[:, 2], parts[:, 3]
+
+    def get_centers(self):
+        bottoms, tops, _ = self._skeleton_parts()
+        return (bottoms + tops) / 2
+
+    def get_directions(self):
+        bottoms, tops, _ = self._skeleton_parts()
+        return _unit_rows(tops - bottoms)
+
+    def get_heights(self):
+        bottoms, tops, _ = self._skeleton_parts()
+        return np.linalg.norm(tops - bottoms, axis=1)
+
+    def get_radii(self):
+        _, tops, markers = self._skeleton_parts()
+        return np.linalg.norm(markers - tops, axis=1)
+
+    def update_outline(self, eye=None):
+        """Rebuild the silhouettes, skipping the work when nothing has moved."""
+        eye = None if eye is None else np.asarray(eye, dtype=float)
+        if self._outline_key is not None:
+            last_eye, last_skeleton, last_shown = self._outline_key
+            same_eye = (eye is None and last_eye is None) or (
+                eye is not None and last_eye is not None and np.allclose(eye, last_eye)
+            )
+            if same_eye and last_shown == self.shown and np.array_equal(self.skeleton.points, last_skeleton):
+                return self
+        self._outline_key = (eye, self.skeleton.points.copy(), self.shown)
+        bottoms, tops, _ = self._skeleton_parts()
+        shown = slice(self.shown)
+        self.set_points(straw_outline_points(bottoms[shown], tops[shown], self.get_radii()[shown], eye=eye))
+        return self
+
+    def show_first(self, count=None):
+        """Draw only the first ``count`` straws (all of them for None)."""
+        self.shown = count
+        eye = None if self._outline_key is None else self._outline_key[0]
+        return self.update_outline(eye)
+
+
+class ShowIncreasingStraws(Animation):
+    """Draw a StrawField's straws one after another, in order, like ``ShowIncreasingSubsets``."""
+
+    def __init__(self, field, rate_func=linear, **kwargs):
+        super().__init__(field, rate_func=rate_func, **kwargs)
+
+    def create_starting_mobject(self):
+        # Only the number of straws drawn changes; no copy of the field needed
+        return self.mobject
+
+    def interpolate_mobject(self, alpha):
+        count = len(self.mobject.skeleton.points) // 4
+        self.mobject.show_first(int(np.ceil(self.rate_func(alpha) * count)))
+
+    def finish(self):
+        super().finish()
+        self.mobject.show_first(None)
@@ -0,0 +1,273 @@
+"""Collision-free packing of straws (line segments or capsules) in a box.
+
+The straw scenes used to scatter straws at random and let them interpenetrate.
+``pack_straws`` places them by random sequential addition instead: candidate
+straws are drawn in batches, and each is kept only if it stays inside the box
+and clears every straw already placed (and every earlier candidate of its
+batch) by ``2 * radius + gap``:
+
+    packing = pack_straws(50_000, size=[40, 40, 40], length=1.0, radius=0.02)
+    packing.centers, packing.directions       # (k, 3) arrays, k <= 50_000
+    packing.density                           # fraction of the box filled
+
+Works in 2-D (``size`` of length 2) or 3-D. Directions are uniformly random by
+default, or given per straw (``directions=(count, d)`` array, only positions
+are drawn) or drawn by a function ``directions(rng, k) -> (k, d)``.
+
+Overlap candidates come from a uniform-grid spatial hash of points sampled
+along the placed straws, kept as a sorted array of cell keys: a candidate is
+only tested against the straws with a sample in a cell next to one of its own,
+and the exact segment-segment distances are computed for all of those pairs
+at once.
+"""
+import numpy as np
+
+
+def segment_distances(p1, q1, p2, q2):
+    """Closest distances between segments p1-q1 and p2-q2 (broadcast over leading axes)."""
+    d1, d2, r = q1 - p1, q2 - p2, p1 - p2
+    a = np.einsum("...i,...i", d1, d1)
+    e = np.einsum("...i,...i", d2, d2)
+    b = np.einsum("...i,...i", d1, d2)
+    c = np.einsum("...i,...i", d1, r)
+    f = np.einsum("...i,...i", d2, r)
+    # Closest points of the two infinite lines, clamped to the segments (any
+    # point will do for parallel segments)
+    denom = a * e - b * b
+    safe = np.where(denom > 1e-12 * a * e, denom, 1.0)
+    s = np.where(denom > 1e-12 * a * e, np.clip((b * f - c * e) / safe, 0.0, 1.0), 0.0)
+    t = (b * s + f) / e
+    s = np.where(t < 0, np.clip(-c / a, 0.0, 1.0), np.where(t > 1, np.clip((b - c) / a, 0.0, 1.0), s))
+    t = np.clip(t, 0.0, 1.0)
+    gap = p1 + d1 * s[..., None] - (p2 + d2 * t[..., None])
+    return np.sqrt(np.einsum("...i,...i", gap, gap))
+
+
+def _random_directions(rng, count, dim):
+    directions = rng.normal(size=(count, dim))
+    return directions / np.linalg.norm(directions, axis=1, keepdims=True)
+
+
+def pile_directions(rng, count, tilt=0.25):
+    """Directions of a loose pile on the yz plane: uniform in-plane angles, tilted out of it by N(0, tilt)."""
+    angles = rng.uniform(0, 2 * np.pi, size=count)
+    tilts = rng.normal(0.0, tilt, size=count)
+    return np.stack([tilts, np.cos(angles), np.sin(angles)], axis=1)
+
+
+class _SegmentIndex:
+    """Uniform-grid spatial hash of sample points along the placed straws.
+
+    With ``cell >= clearance + spacing`` (the spacing of the samples along a
+    straw), two straws closer than ``clearance`` have samples in neighbouring
+    cells. Entries are (cell key, straw id) pairs, sorted by key.
+    """
+
+    def __init__(self, lower, size, cell, capacity):
+        dim = len(size)
+        # One cell of padding on each side keeps every neighbour index in range
+        self.lower = lower - cell
+        self.cell = cell
+        self.shape = tuple(np.ceil(size / cell).astype(int) + 3)
+        self.capacity = capacity
+        offsets = np.stack(np.meshgrid(*[[-1, 0, 1]] * dim, indexing="ij"), axis=-1).reshape(-1, dim)
+        self.neighbours = np.ravel_multi_index(offsets.T + 1, self.shape) - np.ravel_multi_index([1] * dim, self.shape)
+        self.keys = np.empty(0, dtype=np.int64)
+        self.ids = np.empty(0, dtype=np.int64)
+
+    def cell_keys(self, points):
+        cells = np.floor((points - self.lower) / self.cell).astype(np.int64)
+        cells = np.clip(cells, 1, np.array(self.shape) - 2)
+        return np.ravel_multi_index(np.moveaxis(cells, -1, 0), self.shape)
+
+    def insert(self, ids, samples):
+        """Add the straws ``ids`` with their (k, P, d) ``samples``, once per cell."""
+        keys = self.cell_keys(samples)
+        entries = np.unique(keys * self.capacity + ids[:, None])
+        keys, ids = np.divmod(entries, self.capacity)
+        positions = np.searchsorted(self.keys, keys)
+        self.keys = np.insert(self.keys, positions, keys)
+        self.ids = np.insert(self.ids, positions, ids)
+
+    def pairs(self, samples):
+        """Unique (candidate, straw id) pairs with samples in neighbouring cells."""
+        query = (self.cell_keys(samples)[..., None] + self.neighbours).reshape(len(samples), -1)
+        starts = np.searchsorted(self.keys, query, side="left").ravel()
+        counts = np.searchsorted(self.keys, query, side="right").ravel() - starts
+        total = counts.sum()
+        if total == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        candidates = np.repeat(np.arange(query.size) // query.shape[1], counts)
+        # Every matched entry is its range's start plus its rank inside the range
+        ranks = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        ids = self.ids[np.repeat(starts, counts) + ranks]
+        return np.divmod(np.unique(candidates * self.capacity + ids), self.capacity)
+
+
+class Packing:
+    """Straws placed by ``pack_straws``.
+
+    ``centers`` and ``directions`` are (k, d) arrays. With directions given
+    per straw, ``indices`` says which of the requested straws they are (all of
+    them unless the packing ran out of attempts first); with drawn directions
+    the straws are interchangeable and ``indices`` is just ``0 .. k - 1``.
+    """
+
+    def __init__(self, centers, directions, indices, length, radius, size, attempts):
+        self.centers = centers
+        self.directions = directions
+        self.indices = indices
+        self.length = length
+        self.radius = radius
+        self.size = size
+        self.attempts = attempts
+
+    def __len__(self):
+        return len(self.centers)
+
+    @property
+    def starts(self):
+        return self.centers - self.directions * self.length / 2
+
+    @property
+    def ends(self):
+        return self.centers + self.directions * self.length / 2
+
+    @property
+    def density(self):
+        """Fraction of the box area (2-D) or volume (3-D) covered by the straws."""
+        r, length = self.radius, self.length
+        if len(self.size) == 2:
+            straw = 2 * r * length + np.pi * r**2
+        else:
+            straw = np.pi * r**2 * length + 4 / 3 * np.pi * r**3
+        return len(self) * straw / np.prod(self.size)
+
+
+def pack_straws(
+    count,
+    size,
+    length,
+    radius=0.0,
+    gap=0.0,
+    directions=None,
+    center=None,
+    rng=None,
+    max_attempts=None,
+    restarts=0,
+    batch_size=512,
+    complete=False,
+):
+    """Place up to ``count`` non-overlapping straws in a box of ``size`` (see module docs).
+
+    Straws are segments of ``length`` thickened by ``radius`` (0 for plain
+    lines) and stay ``gap`` apart. Gives up after ``max_attempts`` candidates
+    (default ``10 * count``), returning the straws placed so far. Early straws
+    can leave no room for the last few, so up to ``restarts`` more packings
+    are tried until one places all of them; the fullest one is returned, or,
+    with ``complete=True``, a ValueError is raised if none placed them all.
+    """
+    size = np.asarray(size, dtype=float)
+    dim = len(size)
+    if dim not in (2, 3):
+        raise ValueError(f"Straws are packed in 2-D or 3-D, not {dim}-D")
+    center = np.zeros(dim) if center is None else np.asarray(center, dtype=float)
+    lower = center - size / 2
+    rng = np.random.default_rng(rng)
+    max_attempts = 10 * count if max_attempts is None else max_attempts
+    if directions is not None and not callable(directions):
+        directions = np.asarray(directions, dtype=float).reshape(count, dim)
+        directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+    best = None
+    for _ in range(restarts + 1):
+        packing = _pack(count, size, lower, length, radius, gap, directions, rng, max_attempts, batch_size)
+        if best is None or len(packing) > len(best):
+            best = packing
+        if len(best) == count:
+            break
+    if complete and len(best) < count:
+        raise ValueError(
+            f"Only {len(best)} of {count} straws fit (best of {restarts + 1} tries, {max_attempts} "
+            "attempts each); raise max_attempts or restarts, or make the box bigger"
+        )
+    return best
+
+
+def _pack(count, size, lower, length, radius, gap, directions, rng, max_attempts, batch_size):
+    dim = len(size)
+    fixed = directions if isinstance(directions, np.ndarray) else None
+
+    # Overlapping means closer than the clearance; lines (radius 0, no gap)
+    # only overlap when they cross
+    clearance = max(2 * radius + gap, 1e-9)
+    cell = max(2 * clearance, length / 4)
+    offsets = np.linspace(-length / 2, length / 2, int(np.ceil(length / (cell - clearance))) + 1)
+    index = _SegmentIndex(lower, size, cell, count)
+
+    centers = np.empty((count, dim))
+    axes = np.empty((count, dim))
+    indices = np.empty(count, dtype=np.int64)
+    placed = 0
+    pending = np.arange(count)
+    attempts = 0
+    while placed < count and attempts < max_attempts:
+        # Full batches to the end: the last few straws get many candidates each
+        k = min(batch_size, max_attempts - attempts)
+        attempts += k
+        if fixed is not None:
+            # Each straw still to place gets every len(pending)-th candidate
+            slots = pending[np.arange(k) % len(pending)]
+            axis = fixed[slots]
+        else:
+            axis = _random_directions(rng, k, dim) if directions is None else np.asarray(directions(rng, k), dtype=float)
+            axis = axis / np.linalg.norm(axis, axis=1, keepdims=True)
+
+        # Draw centers where both ends (and their radius) stay inside the box
+        reach = np.abs(axis) * length / 2 + radius
+        room = size - 2 * reach
+        ok = np.all(room >= 0, axis=1)
+        if fixed is not None and not ok.all():
+            raise ValueError(f"Straw {slots[~ok][0]} does not fit in the box at its direction")
+        middle = lower + reach + rng.random((k, dim)) * np.maximum(room, 0)
+        samples = middle[:, None] + offsets[:, None] * axis[:, None]
+        first, last = samples[:, 0], samples[:, -1]
+
+        # Clear of the placed straws
+        candidate, other = index.pairs(samples)
+        if len(candidate):
+            start, end = centers[other] - axes[other] * length / 2, centers[other] + axes[other] * length / 2
+            hit = segment_distances(first[candidate], last[candidate], start, end) < clearance
+            ok[candidate[hit]] = False
+
+        survivors = np.flatnonzero(ok)
+        if fixed is not None:
+            # One candidate per straw: the first that cleared the placed straws
+            _, first_of_slot = np.unique(slots[survivors], return_index=True)
+            survivors = survivors[np.sort(first_of_slot)]
+
+        # Clear of the earlier candidates of this batch (greedily, in order)
+        mid = middle[survivors]
+        near = np.sum((mid[:, None] - mid[None]) ** 2, axis=-1) < (length + clearance) ** 2
+        i, j = np.nonzero(np.triu(near, 1))
+        hit = segment_distances(first[survivors[i]], last[survivors[i]], first[survivors[j]], last[survivors[j]]) < clearance
+        keep = np.ones(len(survivors), dtype=bool)
+        # Pairs come sorted by i, so keep[i] is final when its pairs are reached
+        for a, b in zip(i[hit].tolist(), j[hit].tolist()):
+            if keep[a]:
+                keep[b] = False
+        accepted = survivors[keep][: count - placed]
+
+        new = slice(placed, placed + len(accepted))
+        centers[new] = middle[accepted]
+        axes[new] = axis[accepted]
+        # Drawn directions make the straws interchangeable: number them as placed
+        indices[new] = slots[accepted] if fixed is not None else np.arange(new.start, new.stop)
+        index.insert(np.arange(placed, placed + len(accepted)), samples[accepted])
+        placed += len(accepted)
+        if fixed is not None:
+            # Straws that didn't fit are retried first
+            tried = min(k, len(pending))
+            rejected = pending[:tried][~np.isin(pending[:tried], slots[accepted])]
+            pending = np.concatenate([rejected, pending[tried:]])
+
+    return Packing(centers[:placed], axes[:placed], indices[:placed], length, radius, size, attempts)
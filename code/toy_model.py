@@ -0,0 +1,166 @@
+"""The ReLU toy model of superposition, trained in NumPy on the CPU.
+
+The model squeezes ``n_features`` sparse features through ``n_hidden``
+dimensions and back: ``x' = ReLU(W^T W x + b)`` with ``W`` of shape
+(n_hidden, n_features). Inputs are synthetic: each feature is zero with
+probability ``sparsity`` and uniform in [0, 1] otherwise. The loss is the
+importance-weighted squared error, with importance ``importance_decay ** i``
+for feature ``i``. Gradients are written out by hand and fed to Adam, one
+mini-batch per step, so 10k steps of a 20-feature, 5-dimensional model take a
+couple of seconds.
+
+    run = train_toy_model(n_features=5, n_hidden=2, steps=5000)
+    run.losses          # (steps,) loss of every step
+    run.weights         # Trajectory of W (n_hidden, n_features) every snapshot_every steps
+    run.weights.sample(alpha, interpolation="slerp")
+
+W and b snapshots are streamed to disk as trajectories (see trajectory.py)
+while training, so neither training nor playback holds the whole history in
+memory. Runs are stored under the media dir, keyed by the training parameters,
+and reused by later renders.
+"""
+import os
+import shutil
+
+import numpy as np
+
+from disk_cache import cache_path
+from trajectory import Trajectory, TrajectoryWriter
+
+
+class TrainingRun:
+    """A trained toy-model run stored in directory ``path``."""
+
+    def __init__(self, path):
+        self.path = path
+        self.losses = np.load(path / "losses.npy", mmap_mode="r")
+        self.steps = np.arange(1, len(self.losses) + 1)
+        self.importance = np.load(path / "importance.npy")
+        self.weights = Trajectory(path / "weights")
+        self.biases = Trajectory(path / "biases")
+        self.snapshot_steps = self.weights.steps
+
+    def __len__(self):
+        return len(self.weights)
+
+
+def sample_features(rng, batch_size, n_features, sparsity):
+    """Sparse inputs: each feature is 0 with probability ``sparsity``, else uniform in [0, 1]."""
+    # One uniform draw per entry: below ``sparsity`` the feature is off, above it
+    # the draw is rescaled to [0, 1]
+    draws = rng.random((batch_size, n_features), dtype=np.float32)
+    return np.maximum(draws - sparsity, 0) / (1 - sparsity)
+
+
+def _loss_and_gradients(weights, bias, x, importance):
+    hidden = x @ weights.T
+    pre = hidden @ weights + bias
+    error = np.maximum(pre, 0) - x
+    loss = np.mean(np.sum(importance * error ** 2, axis=1))
+    grad_pre = (2 / len(x)) * importance * error * (pre > 0)
+    # W appears twice, as the encoder (hidden = x W^T) and the decoder (hidden W)
+    grad_weights = hidden.T @ grad_pre + (grad_pre @ weights.T).T @ x
+    return loss, grad_weights, grad_pre.sum(axis=0)
+
+
+def _train(
+    path,
+    n_features,
+    n_hidden,
+    steps,
+    batch_size,
+    sparsity,
+    importance_decay,
+    learning_rate,
+    snapshot_every,
+    seed,
+):
+    rng = np.random.default_rng(seed)
+    # Everything in float32: half the memory traffic of float64, and ample for Adam
+    importance = (importance_decay ** np.arange(n_features)).astype(np.float32)
+    # Xavier-normal initialization, zero bias
+    weights = rng.standard_normal((n_hidden, n_features), dtype=np.float32)
+    weights *= np.sqrt(2 / (n_features + n_hidden))
+    bias = np.zeros(n_features, dtype=np.float32)
+
+    params = [weights, bias]
+    first = [np.zeros_like(p) for p in params]
+    second = [np.zeros_like(p) for p in params]
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+
+    losses = np.empty(steps, dtype=np.float32)
+    weight_log = TrajectoryWriter(path / "weights", weights.shape)
+    bias_log = TrajectoryWriter(path / "biases", bias.shape)
+    weight_log.append(0, weights)
+    bias_log.append(0, bias)
+
+    for step in range(1, steps + 1):
+        x = sample_features(rng, batch_size, n_features, sparsity)
+        losses[step - 1], *grads = _loss_and_gradients(weights, bias, x, importance)
+        # Adam, updating the parameter arrays in place
+        correction1 = 1 - beta1 ** step
+        correction2 = 1 - beta2 ** step
+        for p, g, m, v in zip(params, grads, first, second):
+            m *= beta1
+            m += (1 - beta1) * g
+            v *= beta2
+            v += (1 - beta2) * g * g
+            p -= learning_rate * (m / correction1) / (np.sqrt(v / correction2) + eps)
+        if step % snapshot_every == 0 or step == steps:
+            weight_log.append(step, weights)
+            bias_log.append(step, bias)
+
+    weight_log.close()
+    bias_log.close()
+    np.save(path / "importance.npy", importance)
+    np.save(path / "losses.npy", losses)
+
+
+def train_toy_model(
+    n_features=20,
+    n_hidden=5,
+    steps=10000,
+    batch_size=1024,
+    sparsity=0.9,
+    importance_decay=0.9,
+    learning_rate=1e-3,
+    snapshot_every=100,
+    seed=0,
+    cache=True,
+):
+    """Train the toy model and return its TrainingRun (loss every step, W and b every ``snapshot_every``).
+
+    With ``cache=False`` the model is retrained even if a stored run exists.
+    """
+    if not 0 <= sparsity < 1:
+        raise ValueError(f"sparsity must be in [0, 1), got {sparsity}")
+    params = {
+        "n_features": n_features,
+        "n_hidden": n_hidden,
+        "steps": steps,
+        "batch_size": batch_size,
+        "sparsity": sparsity,
+        "importance_decay": importance_decay,
+        "learning_rate": learning_rate,
+        "snapshot_every": snapshot_every,
+        "seed": seed,
+    }
+    path = cache_path("toy_model", params).with_suffix("")
+    if cache:
+        try:
+            return TrainingRun(path)
+        except (OSError, ValueError, KeyError):
+            pass
+    # Train into a private directory, then rename it into place so parallel
+    # renders never read a half-written run
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    _train(tmp_path, **params)
+    if not cache:
+        shutil.rmtree(path, ignore_errors=True)
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        # Another render stored the same run first
+        shutil.rmtree(tmp_path, ignore_errors=True)
+    return TrainingRun(path)
@@ -0,0 +1,175 @@
+"""On-disk trajectories of logged arrays (weight matrices per training step, ...).
+
+A run of a 512-feature, 64-dimensional model logged for 100k steps is ~13 GB of
+W snapshots, far more than a scene can hold in memory. A trajectory directory
+stores the snapshots in fixed-size chunk files plus a small index:
+
+    run/weights/index.json        shape, dtype, chunk size, snapshot count, chunk files
+    run/weights/steps.npy         training step of every snapshot
+    run/weights/chunk_00000.npy   (chunk_size, *shape) snapshots, one file per chunk
+
+``TrajectoryWriter`` appends snapshots while only buffering the current chunk,
+and ``Trajectory`` opens the chunks with ``np.load(mmap_mode="r")`` (a
+``np.memmap``), so a frame only reads the two snapshots around its step:
+
+    with TrajectoryWriter("run/weights", shape=(m, n)) as writer:
+        for step in ...:
+            writer.append(step, weights)
+
+    weights = Trajectory("run/weights")
+    w = weights.sample(alpha, interpolation="slerp")   # W at animation alpha
+"""
+import json
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+INTERPOLATIONS = ("linear", "slerp")
+
+
+def slerp(a, b, t, axis=0):
+    """Spherical interpolation of the vectors along ``axis`` of ``a`` and ``b``.
+
+    Directions rotate at a constant rate along the great circle between them
+    and lengths are interpolated linearly, so a feature vector swings instead
+    of cutting across (and shrinking through) the circle as in a plain lerp.
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    norm_a = np.linalg.norm(a, axis=axis, keepdims=True)
+    norm_b = np.linalg.norm(b, axis=axis, keepdims=True)
+    unit_a = a / np.where(norm_a > 1e-12, norm_a, 1.0)
+    unit_b = b / np.where(norm_b > 1e-12, norm_b, 1.0)
+    cos = np.clip(np.sum(unit_a * unit_b, axis=axis, keepdims=True), -1, 1)
+    angle = np.arccos(cos)
+    sin = np.sin(angle)
+    # Nearly parallel (or zero) vectors fall back to a linear blend of directions
+    safe = sin > 1e-6
+    sin = np.where(safe, sin, 1.0)
+    weight_a = np.where(safe, np.sin((1 - t) * angle) / sin, 1 - t)
+    weight_b = np.where(safe, np.sin(t * angle) / sin, t)
+    direction = weight_a * unit_a + weight_b * unit_b
+    result = direction * ((1 - t) * norm_a + t * norm_b)
+    # A zero vector has no direction to rotate from or to
+    zero = (norm_a <= 1e-12) | (norm_b <= 1e-12)
+    return np.where(zero, a + t * (b - a), result)
+
+
+class TrajectoryWriter:
+    """Append equally shaped snapshots to a trajectory directory, one chunk at a time."""
+
+    def __init__(self, path, shape, chunk_size=1024, dtype=np.float32):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.chunk_size = chunk_size
+        self.steps = []
+        self.chunk_files = []
+        self._buffer = np.empty((chunk_size, *self.shape), dtype=self.dtype)
+        self._filled = 0
+
+    def append(self, step, snapshot):
+        self._buffer[self._filled] = snapshot
+        self._filled += 1
+        self.steps.append(step)
+        if self._filled == self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._filled:
+            return
+        name = f"chunk_{len(self.chunk_files):05d}.npy"
+        np.save(self.path / name, self._buffer[: self._filled])
+        self.chunk_files.append(name)
+        self._filled = 0
+
+    def close(self):
+        self._flush()
+        np.save(self.path / "steps.npy", np.asarray(self.steps, dtype=np.int64))
+        index = {
+            "shape": list(self.shape),
+            "dtype": self.dtype.str,
+            "chunk_size": self.chunk_size,
+            "length": len(self.steps),
+            "chunks": self.chunk_files,
+        }
+        # The index is written last: a directory without one is an unfinished run
+        (self.path / "index.json").write_text(json.dumps(index))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is None:
+            self.close()
+
+
+class Trajectory:
+    """Read-only view of a trajectory directory written by TrajectoryWriter.
+
+    Snapshots are read through memory maps of at most ``max_open_chunks``
+    chunk files at a time, so memory use does not depend on the run length.
+    """
+
+    def __init__(self, path, max_open_chunks=2):
+        self.path = Path(path)
+        index = json.loads((self.path / "index.json").read_text())
+        self.shape = tuple(index["shape"])
+        self.dtype = np.dtype(index["dtype"])
+        self.chunk_size = index["chunk_size"]
+        self.chunk_files = index["chunks"]
+        self.steps = np.load(self.path / "steps.npy", mmap_mode="r")
+        self.max_open_chunks = max_open_chunks
+        self._open_chunks = OrderedDict()
+        if len(self.steps) != index["length"]:
+            raise ValueError(f"{self.path} has {len(self.steps)} steps but its index lists {index['length']}")
+
+    def __len__(self):
+        return len(self.steps)
+
+    def _chunk(self, number):
+        chunk = self._open_chunks.pop(number, None)
+        if chunk is None:
+            chunk = np.load(self.path / self.chunk_files[number], mmap_mode="r")
+            if len(self._open_chunks) >= self.max_open_chunks:
+                self._open_chunks.popitem(last=False)
+        self._open_chunks[number] = chunk
+        return chunk
+
+    def __getitem__(self, k):
+        """Snapshot ``k`` as an in-memory array."""
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(f"snapshot {k} out of range for {len(self)} snapshots")
+        return np.array(self._chunk(k // self.chunk_size)[k % self.chunk_size])
+
+    def chunks(self):
+        """Iterate over the snapshots chunk by chunk, as (count, *shape) memory maps."""
+        for number in range(len(self.chunk_files)):
+            yield self._chunk(number)
+
+    def at_step(self, step, interpolation="linear", axis=0):
+        """Snapshot at ``step``, interpolated between the two logged snapshots around it.
+
+        With ``interpolation="slerp"`` the vectors along ``axis`` (the columns
+        of a W matrix for ``axis=0``) are interpolated with ``slerp``.
+        """
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unknown interpolation {interpolation!r}; expected one of {INTERPOLATIONS}")
+        if len(self) == 1:
+            return self[0]
+        k = int(np.clip(np.searchsorted(self.steps, step, side="right") - 1, 0, len(self) - 2))
+        step0, step1 = self.steps[k], self.steps[k + 1]
+        t = float(np.clip((step - step0) / (step1 - step0), 0, 1))
+        a, b = self[k], self[k + 1]
+        if interpolation == "slerp":
+            return slerp(a, b, t, axis=axis)
+        return a + t * (b - a)
+
+    def sample(self, alpha, interpolation="linear", axis=0):
+        """Snapshot at animation ``alpha`` in [0, 1], from the first logged step to the last."""
+        step = self.steps[0] + alpha * (self.steps[-1] - self.steps[0])
+        return self.at_step(step, interpolation, axis)
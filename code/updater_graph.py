@@ -0,0 +1,142 @@
+"""Glued updaters with declared dependencies, rerun only when something they read moved.
+
+Labels glued to neurons, arrows glued to labels, ... are usually chained
+``add_updater`` lambdas, and every one of them runs on every frame even when
+nothing upstream moved. An ``UpdaterGraph`` keeps such chains as nodes that
+declare the mobjects they read:
+
+    glue = UpdaterGraph()
+    glue.add(number, beside_neuron, neuron, 0.25, LEFT)   # beside_neuron(number, neuron, 0.25, LEFT)
+    glue.add(arrow, follow_number, number, 0.8)
+    glue.add(label, follow_arrow_end, arrow)
+
+``add`` attaches a regular updater to the mobject, so manim still treats it as
+moving while it is glued and ``clear_updaters`` still detaches it. When called,
+that updater first brings the nodes it depends on up to date (so a frame runs
+them in topological order, whatever order manim visits the mobjects in), then
+reruns its function only if one of the mobjects it reads, or its own mobject,
+changed shape or position since it last ran. Style changes (color, opacity)
+do not count: glued updaters place mobjects, they don't restyle them.
+
+A change is detected from a stamp of each family member's points: the array
+itself, its size and a sample of about ten of its points (as depth_order.py
+does), which every shift, rotation, scaling and Transform changes. Checking a
+glued mobject that did not move costs a few microseconds per family member,
+whatever the size of its glyph outlines.
+
+Functions must be module-level (not lambdas) for the section checkpoints to
+pickle them, like ``checkpoints.Updater``.
+"""
+from manim import Mobject
+
+
+def _stamp(points):
+    # Cheap stand-in for the points: which array it is, its size, and a sample of it
+    if not len(points):
+        return id(points), 0
+    return id(points), len(points), points[:: max(1, len(points) // 8)].tobytes(), points[-1].tobytes()
+
+
+def _geometry(mobject):
+    # Walks the submobjects directly: get_family() costs more than the stamps
+    stamps = []
+    stack = [mobject]
+    while stack:
+        member = stack.pop()
+        stamps.append(_stamp(member.points))
+        stack.extend(member.submobjects)
+    return stamps
+
+
+class _GluedUpdater:
+    """Updater of one node: ``func(mobject, *args)``, reading the ``reads`` mobjects."""
+
+    def __init__(self, graph, mobject, func, args, reads):
+        self.graph = graph
+        self.mobject = mobject
+        self.func = func
+        self.args = args
+        self.reads = reads
+        self.upstream = []
+        # Geometry stamps of reads and mobject right after the last run
+        self.state = None
+
+    def __call__(self, mobject):
+        if mobject is not self.mobject:
+            # A copy of the glued mobject: update it like a plain updater would
+            self.func(mobject, *self.args)
+            return
+        self.graph.refresh(self)
+
+    def __deepcopy__(self, memo):
+        # Shared between a mobject and its copies, like a lambda
+        return self
+
+    def __repr__(self):
+        return f"glued {getattr(self.func, '__qualname__', self.func)}"
+
+    def attached(self):
+        # The profiler wraps updaters, keeping the original as __wrapped__
+        return any(getattr(updater, "__wrapped__", updater) is self for updater in self.mobject.updaters)
+
+
+class UpdaterGraph:
+    """Dependency graph of glued updaters (see module docs)."""
+
+    def __init__(self):
+        self.nodes = []
+        # Updater calls that ran the function / found nothing to do
+        self.runs = 0
+        self.skips = 0
+
+    def add(self, mobject, func, *args, reads=None):
+        """Glue ``mobject`` with ``func(mobject, *args)``; ``reads`` defaults to the mobjects in ``args``."""
+        if reads is None:
+            reads = [arg for arg in args if isinstance(arg, Mobject)]
+        node = _GluedUpdater(self, mobject, func, args, list(reads))
+        self.nodes.append(node)
+        try:
+            self._link()
+        except ValueError:
+            self.nodes.pop()
+            self._link()
+            raise
+        mobject.add_updater(node)
+        return node
+
+    def _link(self):
+        """Find each node's upstream nodes (those placing a mobject it reads) and reject cycles."""
+        for node in self.nodes:
+            read_family = {id(m) for read in node.reads for m in read.get_family()}
+            node.upstream = [other for other in self.nodes if other is not node and id(other.mobject) in read_family]
+        done, visiting = set(), set()
+
+        def visit(node):
+            if id(node) in done:
+                return
+            if id(node) in visiting:
+                raise ValueError(f"Glued updaters form a cycle through {node!r}")
+            visiting.add(id(node))
+            for upstream in node.upstream:
+                visit(upstream)
+            visiting.discard(id(node))
+            done.add(id(node))
+
+        for node in self.nodes:
+            visit(node)
+
+    def refresh(self, node):
+        """Bring ``node``'s upstream nodes, then ``node``, up to date."""
+        if node.mobject.updating_suspended:
+            return
+        for upstream in node.upstream:
+            if upstream.attached():
+                self.refresh(upstream)
+        watched = node.reads + [node.mobject]
+        if node.state is not None and all(before == _geometry(m) for before, m in zip(node.state, watched)):
+            self.skips += 1
+            return
+        state = [_geometry(m) for m in node.reads]
+        node.func(node.mobject, *node.args)
+        node.state = state + [_geometry(node.mobject)]
+        self.runs += 1
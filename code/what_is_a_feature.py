@@ -1,131 +1,59 @@
 from manim import *
 import numpy as np
 
+from arrangement import solve_arrangement
+from backdrop import FeatureSpaceBackdrop
+from frustum import FrustumCulledScene
+from mesh_lod import LODArrow3D
+from sections import SectionedScene
 
-class WhatIsAFeature(ThreeDScene):
-    """Visualize five equally spaced 3-D vectors on a grid."""
-
-    def construct(self):
-        # Create a 2-D grid lying on the xy-plane (z = 0)
-        start_distance = 8.0
-        grid = NumberPlane(
-            x_range=(-5, 5, 1),
-            y_range=(-5, 5, 1),
-            background_line_style={
-                "stroke_color": BLUE_E,
-                "stroke_width": 1,
-                "stroke_opacity": 0.5,
-            },
-            axis_config={"include_numbers": False},
-        )
-        # Golden ratio for well-distributed target directions
-        phi = (1 + np.sqrt(5)) / 2
-        target_directions = np.array([
-            [1, 1, 1],
-            [1, -1, -1],
-            [-1, 1, -1],
-            [-1, -1, 1],
-            [0, phi, 1/phi],
-        ])
-        colors = [RED, BLUE, GREEN, YELLOW, PURPLE]
-        # Add vertical helper lines for depth perception
-        vertical_lines = VGroup(
-            *[
-                Line(
-                    start=grid.c2p(x, y, 0),
-                    end=grid.c2p(x, y, 5),
-                    color=BLUE_E,
-                    stroke_width=1,
-                    stroke_opacity=0.5,
-                )
-                for x in range(-5, 6)
-                for y in range(-5, 6)
-            ]
-        )
-        # 3-D axes
-        axes = ThreeDAxes(
-            x_range=(-5, 5, 1),
-            y_range=(-5, 5, 1),
-            z_range=(0, 5, 1),
-            x_length=10,
-            y_length=10,
-            z_length=5,
-            axis_config={"color": WHITE, "include_tip": False, "include_numbers": False},
-        )
 
-        vectors = VGroup()
-        vector_length = 2.0
-        # Normalize target directions to unit length
-        normalized_dirs = target_directions / np.linalg.norm(target_directions, axis=1, keepdims=True)
-        for i, direction in enumerate(normalized_dirs):
-            end_point = (direction * vector_length)
-            vectors.add(Arrow3D(start=ORIGIN, end=end_point, color=colors[i % len(colors)]))
+class WhatIsAFeature(FrustumCulledScene, SectionedScene, ThreeDScene):
+    """Visualize five equally spaced 3-D vectors on a grid."""
 
-        start_distance = 8.0
+    # Number of feature vectors and the objective they are arranged by (see arrangement.py)
+    N_FEATURES = 5
+    OBJECTIVE = "max_cos"
+    # Camera beats, renderable one at a time (see sections.py)
+    SECTIONS = [
+        "intro",
+        "ambient_rotation",
+        "red_vector",
+        "yellow_vector",
+        "green_vector",
+        "zoom_out",
+        "purple_vector",
+        "outro",
+    ]
+    START_DISTANCE = 8.0
+
+    def intro(self):
+        start_distance = self.START_DISTANCE
         self.set_camera_orientation(phi=75 * DEGREES, theta=30 * DEGREES, distance=start_distance)
 
-        # Create a 2-D grid lying on the xy-plane (z = 0)
-        grid = NumberPlane(
-            x_range=(-5, 5, 1),
-            y_range=(-5, 5, 1),
-            background_line_style={
-                "stroke_color": BLUE_E,
-                "stroke_width": 1,
-                "stroke_opacity": 0.5,
-            },
-            axis_config={"include_numbers": False},
-        )
+        # 2-D grid on the xy-plane (z = 0), vertical helper lines for depth perception, 3-D axes
+        grid, vertical_lines, axes = FeatureSpaceBackdrop()
 
-        # Golden ratio for well-distributed target directions
-        phi = (1 + np.sqrt(5)) / 2
-        target_directions = np.array([
-            [1, 1, 1],
-            [1, -1, -1],
-            [-1, 1, -1],
-            [-1, -1, 1],
-            [0, phi, 1/phi],
-        ])
+        # Low-interference feature directions from the arrangement solver
+        target_directions = solve_arrangement(self.N_FEATURES, 3, objective=self.OBJECTIVE)
         colors = [RED, BLUE, GREEN, YELLOW, PURPLE]
 
-        # Add vertical helper lines for depth perception
-        vertical_lines = VGroup(
-            *[
-                Line(
-                    start=grid.c2p(x, y, 0),
-                    end=grid.c2p(x, y, 5),
-                    color=BLUE_E,
-                    stroke_width=1,
-                    stroke_opacity=0.5,
-                )
-                for x in range(-5, 6)
-                for y in range(-5, 6)
-            ]
-        )
-
-        # 3-D axes
-        axes = ThreeDAxes(
-            x_range=(-5, 5, 1),
-            y_range=(-5, 5, 1),
-            z_range=(0, 5, 1),
-            x_length=10,
-            y_length=10,
-            z_length=5,
-            axis_config={"color": WHITE, "include_tip": False, "include_numbers": False},
-        )
-
         vectors = VGroup()
         vector_length = 2.0
-        # Normalize target directions to unit length
-        normalized_dirs = target_directions / np.linalg.norm(target_directions, axis=1, keepdims=True)
-        for i, direction in enumerate(normalized_dirs):
+        for i, direction in enumerate(target_directions):
             end_point = (direction * vector_length)
-            vectors.add(Arrow3D(start=ORIGIN, end=end_point, color=colors[i % len(colors)]))
+            # Mesh resolution follows the camera, from the far zoom-out to the 0.5 close-ups (see mesh_lod.py)
+            vectors.add(LODArrow3D(start=ORIGIN, end=end_point, camera=self.camera, color=colors[i % len(colors)]))
+        self.vectors = vectors
+        self.background_elements = VGroup(grid, vertical_lines, axes)
 
         # Add the static elements to the scene
         self.add(grid, vertical_lines, axes)
         self.move_camera(phi=75 * DEGREES, theta=30 * DEGREES, distance=start_distance / 1.5, zoom=2.0, run_time=2)
         self.play(*[FadeIn(v) for v in vectors])   
         self.wait(1.5)
+
+    def ambient_rotation(self):
         self.begin_ambient_camera_rotation(rate=0.15)
         self.wait(3.5)
         feature_vectors = Tex(r'feature vectors', font_size=45, color=WHITE).move_to(LEFT + 1.3+ UP + 0.8)
@@ -136,8 +64,11 @@ class WhatIsAFeature(ThreeDScene):
         self.wait(4.5)
         # Stop ambient camera rotation before zooming in on vectorsn
         self.stop_ambient_camera_rotation()
+
+    def red_vector(self):
+        vectors = self.vectors
         # Dim all background elements and non-target vectors once
-        background_elements = VGroup(grid, vertical_lines, axes)
+        background_elements = self.background_elements
         other_vectors = VGroup(*[v for i, v in enumerate(vectors) if i != 0])  # All except red
         self.play(background_elements.animate.set_opacity(0.1), other_vectors.animate.set_opacity(0.1), run_time=0.5)
         
@@ -152,7 +83,9 @@ class WhatIsAFeature(ThreeDScene):
 
         # Dim red vector, brighten yellow vector
         self.play(vectors[0].animate.set_opacity(0.1))
-        
+
+    def yellow_vector(self):
+        vectors = self.vectors
         # then the camera faces and zooms in on the yellow, and show the tex(r'warm color')
         yellow_vector_pos = vectors[3].get_end()
         warm_color = Tex(r'warm color', font_size=40, color=YELLOW)
@@ -168,7 +101,9 @@ class WhatIsAFeature(ThreeDScene):
 
         # Dim yellow vector, brighten green vector
         self.play(vectors[3].animate.set_opacity(0.1))
-        
+
+    def green_vector(self):
+        vectors = self.vectors
         # then the camera faces and zooms in on the green, and show the tex(r'has fur')
         green_vector_pos = vectors[2].get_end()
         self.move_camera(frame_center=green_vector_pos, distance=0.5, run_time=1)
@@ -182,6 +117,9 @@ class WhatIsAFeature(ThreeDScene):
         self.wait(0.5)
         self.play(FadeOut(has_fur), run_time=0.5)
 
+    def zoom_out(self):
+        vectors = self.vectors
+        background_elements = self.background_elements
         # Restore background elements and all vectors to full opacity
         self.play(
             background_elements.animate.set_opacity(1.0),
@@ -190,10 +128,13 @@ class WhatIsAFeature(ThreeDScene):
         )
 
         # Zoom out way farther than the initial view
-        final_distance = start_distance * 4.5  # Much farther than initial distance
+        final_distance = self.START_DISTANCE * 4.5  # Much farther than initial distance
         self.move_camera(frame_center=ORIGIN, distance=final_distance, run_time=2.5)
         self.wait(1.5)
 
+    def purple_vector(self):
+        vectors = self.vectors
+        background_elements = self.background_elements
         # then the camera faces and zooms in on the blue, and show the tex(r'furry animal')
         purple_vector_pos = vectors[4].get_end()
         self.move_camera(frame_center=purple_vector_pos, distance=0.5, run_time=1)
@@ -209,7 +150,10 @@ class WhatIsAFeature(ThreeDScene):
             run_time=0.3)
         self.wait(0.5)
         self.play(FadeOut(furry_animal), run_time=0.5)
-        
+
+    def outro(self):
+        vectors = self.vectors
+        background_elements = self.background_elements
         # Restore all elements to full opacity before final zoom out
         all_elements = VGroup(background_elements, *vectors)
         self.play(all_elements.animate.set_opacity(1.0), run_time=1)
@@ -217,5 +161,5 @@ class WhatIsAFeature(ThreeDScene):
         self.play(FadeOut(all_elements), run_time=1)
 
         # # Zoom out to show full scene
-        self.move_camera(frame_center=ORIGIN, distance=start_distance, run_time=2)
+        self.move_camera(frame_center=ORIGIN, distance=self.START_DISTANCE, run_time=2)
         self.wait(2)
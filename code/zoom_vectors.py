@@ -1,92 +1,38 @@
 from manim import *
-try:
-    from manim.utils.color import Color  # Manim Community v0.19
-except Exception:
-    Color = None
 import numpy as np
 
+from arrangement import solve_arrangement
+from backdrop import FeatureSpaceBackdrop
+from color_compat import *
+from frustum import FrustumCulledScene
+from mesh_lod import LODArrow3D
+from sections import SectionedScene
 
-# Ensure commonly used color constants exist even if not provided by Manim version
-def _color(value: str):
-    return Color(value) if Color is not None else value
 
-if 'CYAN' not in globals():
-    CYAN = _color("#00FFFF")
-if 'MAGENTA' not in globals():
-    MAGENTA = _color("#FF00FF")
-if 'ORANGE' not in globals():
-    ORANGE = _color("#FFA500")
-if 'TEAL' not in globals():
-    TEAL = _color("#008080")
-if 'LAVENDER' not in globals():
-    LAVENDER = _color("#E6E6FA")
-if 'GREY' not in globals():
-    GREY = _color("#808080")
-if 'WHITE' not in globals():
-    WHITE = _color("#FFFFFF")
-if 'BLUE_E' not in globals():
-    BLUE_E = _color("#1C75E9")
-
-class ZoomVectors(ThreeDScene):
+class ZoomVectors(FrustumCulledScene, SectionedScene, ThreeDScene):
     """Zoom animation focusing on vectors 1 (CYAN) and 5 (LAVENDER)."""
 
-    def construct(self):
-        # Create a 2-D grid lying on the xy-plane (z = 0)
-        grid = NumberPlane(
-            x_range=(-5, 5, 1),
-            y_range=(-5, 5, 1),
-            background_line_style={
-                "stroke_color": BLUE_E,
-                "stroke_width": 1,
-                "stroke_opacity": 0.5,
-            },
-            axis_config={"include_numbers": False},
-        )
-
-        # Add vertical helper lines for depth perception
-        vertical_lines = VGroup(
-            *[
-                Line(
-                    start=grid.c2p(x, y, 0),
-                    end=grid.c2p(x, y, 5),
-                    color=BLUE_E,
-                    stroke_width=1,
-                    stroke_opacity=0.5,
-                )
-                for x in range(-5, 6)
-                for y in range(-5, 6)
-            ]
-        )
+    # Number of feature vectors and the objective they are arranged by (see arrangement.py)
+    N_FEATURES = 5
+    OBJECTIVE = "max_cos"
+    # Beats, renderable one at a time (see sections.py)
+    SECTIONS = ["intro", "light_up", "focus", "compare"]
+    VECTOR_LENGTH = 2.0
 
-        # 3-D axes
-        axes = ThreeDAxes(
-            x_range=(-5, 5, 1),
-            y_range=(-5, 5, 1),
-            z_range=(0, 5, 1),
-            x_length=10,
-            y_length=10,
-            z_length=5,
-            axis_config={"color": WHITE, "include_tip": False, "include_numbers": False},
-        )
+    def intro(self):
+        # 2-D grid on the xy-plane (z = 0), vertical helper lines for depth perception, 3-D axes
+        grid, vertical_lines, axes = FeatureSpaceBackdrop()
 
-        # Golden ratio for well-distributed target directions
-        phi = (1 + np.sqrt(5)) / 2
-        target_directions = np.array([
-            [1, 1, 1],
-            [1, -1, -1],
-            [-1, 1, -1],
-            [-1, -1, 1],
-            [0, phi, 1/phi],
-        ])
+        # Low-interference feature directions from the arrangement solver
+        target_directions = solve_arrangement(self.N_FEATURES, 3, objective=self.OBJECTIVE)
         colors = [RED, BLUE, GREEN, YELLOW, PURPLE]
 
         vectors = VGroup()
-        vector_length = 2.0
-        # Normalize target directions to unit length
-        normalized_dirs = target_directions / np.linalg.norm(target_directions, axis=1, keepdims=True)
-        for i, direction in enumerate(normalized_dirs):
+        vector_length = self.VECTOR_LENGTH
+        for i, direction in enumerate(target_directions):
             end_point = (direction * vector_length)
-            vectors.add(Arrow3D(start=ORIGIN, end=end_point, color=colors[i % len(colors)]))
+            # Coarse at the opening distance of 20, smooth in the close-up (see mesh_lod.py)
+            vectors.add(LODArrow3D(start=ORIGIN, end=end_point, camera=self.camera, color=colors[i % len(colors)]))
 
         self.set_camera_orientation(phi=85 * DEGREES, theta=15 * DEGREES, distance=20.0)
         self.begin_ambient_camera_rotation(rate=0.2)
@@ -99,7 +45,11 @@ class ZoomVectors(ThreeDScene):
         
         self.add(background_elements, vectors)
         self.wait(5)
-        
+        self.directions = target_directions
+        self.vectors = vectors
+
+    def light_up(self):
+        vectors = self.vectors
         # Light up vectors one at a time (1 second each)
         original_colors = [RED, BLUE, GREEN, YELLOW, PURPLE]
         
@@ -115,15 +65,17 @@ class ZoomVectors(ThreeDScene):
         
         # Keep the last vector lit for a short duration
         self.wait(1)
-        
+
+    def focus(self):
+        vectors = self.vectors
         # Zoom camera close to focus on vectors 1 (RED) and 5 (PURPLE)
         # Vector 1 is at index 0, Vector 5 is at index 4
         vector_1 = vectors[0]  # RED
         vector_5 = vectors[4]  # PURPLE
         
         # Calculate midpoint between the two vectors for camera focus
-        vec1_end = normalized_dirs[0] * vector_length
-        vec5_end = normalized_dirs[4] * vector_length
+        vec1_end = self.directions[0] * self.VECTOR_LENGTH
+        vec5_end = self.directions[4] * self.VECTOR_LENGTH
         focus_point = (vec1_end + vec5_end) / 2
 
         # Highlight only vectors 1 and 5
@@ -152,7 +104,12 @@ class ZoomVectors(ThreeDScene):
         self.add_fixed_orientation_mobjects(quantum_text, cooking_text)
         self.play(Write(quantum_text), Write(cooking_text))
         self.wait(2)
-        
+        self.quantum_text = quantum_text
+        self.cooking_text = cooking_text
+
+    def compare(self):
+        vector_1, vector_5 = self.vectors[0], self.vectors[4]
+        quantum_text, cooking_text = self.quantum_text, self.cooking_text
         # Focus on quantum physics vector and dim/gray-out cooking recipes
         self.play(
             vector_5.animate.set_color(GREY).set_opacity(0.3),
@@ -0,0 +1,226 @@
+"""Compile every LaTeX expression the scenes need, in parallel, before rendering.
+
+A cold render spends most of its time in ``latex`` and ``dvisvgm``, called
+one expression at a time from inside ``construct``. This pre-pass finds the
+expressions up front and compiles them concurrently into manim's tex cache
+(``<media_dir>/Tex``), so the renders that follow only read SVGs.
+
+Expressions are collected per scene file, in worker processes:
+
+1. Static extraction: ``Tex(...)`` / ``MathTex(...)`` calls whose arguments
+   are string literals are found in the source and built directly.
+2. Dry run: every scene in the file runs ``construct`` with animations skipped
+   and nothing written (manim's ``--dry_run``), which also reaches generated
+   strings such as axis numbers and ``DecimalNumber`` digits.
+
+While collecting, ``tex_to_svg_file`` only records expressions that are not
+cached yet and hands back a placeholder SVG. Code that indexes into a
+placeholder can fail; everything recorded up to that point is kept, and the
+files are collected again once those expressions are compiled, until nothing
+new turns up. ``Text`` objects are typeset for real during the dry run, which
+warms their (Pango) cache as a side effect.
+
+Usage:
+    python precompile_tex.py                  # every scene, one worker per core
+    python precompile_tex.py -j 8 MatrixW "code/mlp*"
+    python render_all.py --precompile-tex     # the same pass, then render
+"""
+
+import argparse
+import ast
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_all import ROOT, discover_scenes, load_scene_module, select_scenes
+
+TEX_CLASSES = {"Tex", "MathTex", "SingleStringMathTex"}
+# Keyword arguments that change the compiled expression; the rest only style it
+TEX_KWARGS = {"tex_environment", "arg_separator", "substrings_to_isolate", "tex_to_color_map"}
+MAX_ROUNDS = 4
+PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10" viewBox="0 0 10 10">'
+    '<path d="M0 0 L10 0 L10 10 L0 10 Z"/></svg>'
+)
+
+
+def _literal(node):
+    """Python value of a literal AST node; dicts keep literal keys even when the values are not."""
+    if isinstance(node, ast.Dict) and all(key is not None for key in node.keys):
+        return {ast.literal_eval(key): None for key in node.keys}
+    return ast.literal_eval(node)
+
+
+def static_tex_calls(path):
+    """(class name, args, kwargs) of every Tex/MathTex call in ``path`` with literal strings."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    calls = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+            continue
+        if node.func.id not in TEX_CLASSES or not node.args:
+            continue
+        try:
+            args = [_literal(arg) for arg in node.args]
+            kwargs = {kw.arg: _literal(kw.value) for kw in node.keywords if kw.arg in TEX_KWARGS}
+        except (ValueError, TypeError, SyntaxError):
+            continue
+        if all(isinstance(arg, str) for arg in args):
+            calls.append((node.func.id, args, kwargs))
+    return calls
+
+
+def _configure(options):
+    from manim import config
+
+    config.media_dir = options["media_dir"]
+    config.verbosity = "ERROR"
+    config.progress_bar = "none"
+    # Cleanup deletes every non-SVG file in the tex dir, including the
+    # .tex/.dvi files other workers are compiling; run it once at the end
+    config.no_latex_cleanup = True
+    return config
+
+
+class _Recorder:
+    """Stand-in for ``tex_to_svg_file`` that records uncached expressions."""
+
+    def __init__(self, placeholder):
+        self.placeholder = placeholder
+        self.missing = {}
+
+    def __call__(self, expression, environment=None, tex_template=None):
+        from manim import config
+        from manim.utils.tex_file_writing import generate_tex_file
+
+        if tex_template is None:
+            tex_template = config["tex_template"]
+        svg_file = generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+        if svg_file.exists():
+            return svg_file
+        self.missing[svg_file.name] = (expression, environment, tex_template)
+        return self.placeholder
+
+
+def collect_file(path, scene_names, options):
+    """Uncached expressions of one scene file, keyed by their SVG file name."""
+    import manim
+    import manim.mobject.text.tex_mobject as tex_mobject
+
+    config = _configure(options)
+    placeholder = Path(tempfile.mkdtemp()) / "placeholder.svg"
+    placeholder.write_text(PLACEHOLDER_SVG)
+    recorder = _Recorder(placeholder)
+    tex_mobject.tex_to_svg_file = recorder
+
+    errors = []
+    module = load_scene_module(path)
+    for class_name, args, kwargs in static_tex_calls(path):
+        try:
+            getattr(manim, class_name)(*args, **kwargs)
+        except Exception:
+            # Anything after the compile step (coloring, indexing) may trip on
+            # the placeholder; the expression is already recorded
+            pass
+
+    config.input_file = str(path)
+    config.dry_run = True
+    for name in scene_names:
+        try:
+            getattr(module, name)(skip_animations=True).render()
+        except Exception as exc:
+            errors.append(f"{name}: {type(exc).__name__}: {exc}")
+    return recorder.missing, errors
+
+
+def compile_expression(expression, environment, tex_template, options):
+    """Compile one expression into the tex cache; returns an error message or None."""
+    _configure(options)
+    from manim.utils.tex_file_writing import tex_to_svg_file
+
+    try:
+        tex_to_svg_file(expression, environment=environment, tex_template=tex_template)
+    except Exception as exc:
+        return f"{expression!r}: {type(exc).__name__}: {exc}"
+    return None
+
+
+def _group_by_file(scenes):
+    files = {}
+    for path, name in scenes:
+        files.setdefault(Path(path), []).append(name)
+    return files
+
+
+def precompile(scenes, workers=None, media_dir=str(ROOT / "media")):
+    """Fill the tex cache for ``scenes`` ((path, scene_name) pairs); returns a summary dict."""
+    start = time.perf_counter()
+    options = {"media_dir": media_dir}
+    pending = _group_by_file(scenes)
+    compiled, failed, seen = 0, [], set()
+    for round_number in range(1, MAX_ROUNDS + 1):
+        # Collection runs module-level config (Text.set_default, ...), so every
+        # file gets a fresh process, as in render_all.py
+        with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+            futures = {path: pool.submit(collect_file, path, names, options) for path, names in pending.items()}
+            results = {path: future.result() for path, future in futures.items()}
+
+        missing = {}
+        for path, (file_missing, errors) in results.items():
+            missing.update(file_missing)
+            for error in errors:
+                print(f"  dry run {path.relative_to(ROOT)}: {error}", flush=True)
+        missing = {key: value for key, value in missing.items() if key not in seen}
+        print(f"Round {round_number}: {len(pending)} files, {len(missing)} new expressions", flush=True)
+        if not missing:
+            break
+        seen.update(missing)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            errors = pool.map(compile_expression, *zip(*missing.values()), [options] * len(missing))
+            for error in errors:
+                if error:
+                    failed.append(error)
+                    print(f"  latex {error}", flush=True)
+        compiled += len(missing)
+        # Only files that hit uncached expressions can have stopped short
+        pending = {path: pending[path] for path, (file_missing, _) in results.items() if file_missing}
+
+    _configure(options)
+    from manim.utils.tex_file_writing import delete_nonsvg_files
+
+    delete_nonsvg_files()
+    return {
+        "compiled": compiled - len(failed),
+        "failed": failed,
+        "wall_time": round(time.perf_counter() - start, 3),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("patterns", nargs="*", help="SceneName or path:SceneName globs (default: all scenes)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--media-dir", default=str(ROOT / "media"), help="manim media directory")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scenes = select_scenes(discover_scenes(), args.patterns)
+    if not scenes:
+        print("No scenes matched.", file=sys.stderr)
+        return 1
+    summary = precompile(scenes, args.workers, args.media_dir)
+    print(
+        f"Compiled {summary['compiled']} expressions in {summary['wall_time']:.1f}s "
+        f"with {args.workers} workers ({len(summary['failed'])} failed)"
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
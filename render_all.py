@@ -0,0 +1,351 @@
+"""Render every scene in the repository across a pool of worker processes.
+
+Scenes are discovered statically (no manim import needed), so the driver finds
+every Scene / ThreeDScene / MovingCameraScene subclass in code/ and in the
+top-level scripts. Each scene is rendered in its own worker process, and a
+per-scene report (wall time, frames written, peak RSS) is written as JSON.
+Rendering only some scenes updates their entries and keeps the others.
+
+Usage:
+    python render_all.py                      # everything, one worker per core
+    python render_all.py -j 4 -q m            # 4 workers, medium quality
+    python render_all.py BigStrawBox "code/mlp*.py:*"
+    python render_all.py --list
+    python render_all.py --precompile-tex     # fill the LaTeX cache in parallel first
+    python render_all.py --profile MLPZoomNetwork   # + media/profiles/MLPZoomNetwork.speedscope.json
+
+Fork-server mode imports manim (and code/color_compat.py) once in a warm
+server process and forks a fresh child from it for every scene, so no render
+pays the cold import. With --interactive the server stays up and scene
+patterns are read from stdin, which makes re-rendering a short scene after an
+edit start almost instantly:
+
+    python render_all.py --fork-server -i
+    render> QuestionText
+    render> StrawRule
+"""
+
+import argparse
+import ast
+import fnmatch
+import importlib.util
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+SCENE_DIRS = [ROOT, ROOT / "code"]
+SCENE_BASES = {"Scene", "ThreeDScene", "MovingCameraScene", "ZoomedScene"}
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+DEFAULT_REPORT = ROOT / "media" / "render_report.json"
+# Imported once by the fork server; every scene child inherits them already loaded
+FORK_SERVER_PRELOAD = ["manim", "color_compat"]
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def discover_scenes(dirs=SCENE_DIRS):
+    """Return (path, scene_name) pairs for every scene class found in ``dirs``."""
+    scenes = []
+    for directory in dirs:
+        for path in sorted(directory.glob("*.py")):
+            try:
+                tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+            except SyntaxError:
+                continue
+            # Follow subclasses defined in the same file (class B(A) where A is a scene)
+            scene_classes = set(SCENE_BASES)
+            for node in tree.body:
+                if not isinstance(node, ast.ClassDef):
+                    continue
+                if any(_base_name(base) in scene_classes for base in node.bases):
+                    scene_classes.add(node.name)
+                    scenes.append((path, node.name))
+    return scenes
+
+
+def scene_id(path, scene_name):
+    return f"{Path(path).resolve().relative_to(ROOT).as_posix()}:{scene_name}"
+
+
+def select_scenes(scenes, patterns):
+    """Filter scenes by ``SceneName`` or ``path:SceneName`` glob patterns."""
+    if not patterns:
+        return list(scenes)
+    selected = []
+    for path, name in scenes:
+        key = scene_id(path, name)
+        if any(fnmatch.fnmatch(name, p) or fnmatch.fnmatch(key, p) for p in patterns):
+            selected.append((path, name))
+    return selected
+
+
+def load_scene_module(path):
+    """Import a scene file the same way ``manim file.py`` does."""
+    path = Path(path).resolve()
+    module_name = ".".join(path.relative_to(ROOT).with_suffix("").parts)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    # manim puts the scene's folder on sys.path so sibling helper modules import
+    sys.path.insert(0, str(path.parent))
+    spec.loader.exec_module(module)
+    return module
+
+
+def configure_manim(path, options):
+    from manim import config
+
+    config.quality = QUALITIES[options["quality"]]
+    config.input_file = str(path)
+    config.media_dir = options["media_dir"]
+    config.write_to_movie = True
+    config.preview = False
+    config.progress_bar = "none"
+    config.verbosity = "WARNING"
+    config.disable_caching = options["disable_caching"]
+    return config
+
+
+def render_scene(path, scene_name, options):
+    """Render one scene in the current process and return its report entry."""
+    start = time.perf_counter()
+    frames = 0
+    error = None
+    profiler = profile = None
+    try:
+        module = load_scene_module(path)
+        configure_manim(path, options)
+        if options.get("profile"):
+            from scene_profiler import SceneProfiler
+
+            profiler = SceneProfiler().install()
+        # Count the frames that reach the file writer: the renderer's clock also
+        # advances over cached and skipped plays, and section snapshots restore it
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        write_frame = SceneFileWriter.write_frame
+        written = [0]
+
+        def counted_write_frame(writer, *args, **kwargs):
+            written[0] += 1
+            return write_frame(writer, *args, **kwargs)
+
+        SceneFileWriter.write_frame = counted_write_frame
+        scene = getattr(module, scene_name)()
+        try:
+            scene.render()
+        finally:
+            SceneFileWriter.write_frame = write_frame
+            frames = written[0]
+            if profiler is not None:
+                profiler.uninstall()
+                profile_path = Path(options["media_dir"]) / "profiles" / f"{scene_name}.speedscope.json"
+                profile = {"trace": str(profiler.write(profile_path, scene_name)), "hot_spots": profiler.summary()}
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return {
+        "scene": scene_id(path, scene_name),
+        "status": "failed" if error else "ok",
+        "wall_time": round(time.perf_counter() - start, 3),
+        "frames": frames,
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "pid": os.getpid(),
+        "error": error,
+        "profile": profile,
+    }
+
+
+def load_report(report_path):
+    try:
+        report = json.loads(Path(report_path).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(report, dict) or "scenes" not in report:
+        return None
+    return report
+
+
+def previous_wall_times(report_path):
+    report = load_report(report_path)
+    if report is None:
+        return {}
+    return {entry["scene"]: entry["wall_time"] for entry in report["scenes"]}
+
+
+def write_report(report_path, report):
+    """Write ``report``, keeping the entries of scenes it didn't render from the existing report.
+
+    A batch of a few scenes (an interactive ``render>`` command, or a pattern
+    on the command line) updates their entries instead of replacing the whole
+    report. Entries rendered at another quality are dropped.
+    """
+    report_path = Path(report_path)
+    previous = load_report(report_path)
+    entries = {}
+    if previous is not None and previous.get("quality") == report["quality"]:
+        entries = {entry["scene"]: entry for entry in previous["scenes"]}
+    entries.update((entry["scene"], entry) for entry in report["scenes"])
+    merged = dict(report, scenes=[entries[scene] for scene in sorted(entries)])
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(merged, indent=2))
+
+
+def make_executor(workers, fork_server=False):
+    # One fresh process per scene: Text.set_default() and friends at module
+    # level must not leak from one scene file into the next.
+    if not fork_server:
+        return ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1)
+    # The scene modules themselves are not preloaded: they run module-level
+    # config (Text.set_default) and must be re-read after every edit.
+    sys.path.insert(0, str(ROOT / "code"))
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(FORK_SERVER_PRELOAD)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, max_tasks_per_child=1)
+
+
+def render_batch(executor, workers, scenes, options, report_path):
+    # Longest scenes first (from the last report) keeps the pool busy until the end
+    last = previous_wall_times(report_path)
+    scenes = sorted(scenes, key=lambda s: last.get(scene_id(*s), float("inf")), reverse=True)
+
+    results = []
+    batch_start = time.perf_counter()
+    futures = {executor.submit(render_scene, path, name, options): (path, name) for path, name in scenes}
+    for future in as_completed(futures):
+        entry = future.result()
+        results.append(entry)
+        status = "ok  " if entry["status"] == "ok" else "FAIL"
+        print(
+            f"[{status}] {entry['scene']:<60} {entry['wall_time']:8.2f}s "
+            f"{entry['frames']:6d} frames {entry['peak_rss_mb']:8.1f} MB",
+            flush=True,
+        )
+        if entry["error"]:
+            print(f"       {entry['error']}", flush=True)
+        if entry["profile"]:
+            for spot in entry["profile"]["hot_spots"][:3]:
+                print(f"       {spot['self']:8.2f}s self {spot['calls']:7d} calls  {spot['name']}", flush=True)
+
+    results.sort(key=lambda e: e["scene"])
+    report = {
+        "quality": QUALITIES[options["quality"]],
+        "workers": workers,
+        "total_wall_time": round(time.perf_counter() - batch_start, 3),
+        "scenes": results,
+    }
+    write_report(report_path, report)
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("patterns", nargs="*", help="SceneName or path:SceneName globs (default: all scenes)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l", help="render quality (like manim -q)")
+    parser.add_argument("--media-dir", default=str(ROOT / "media"), help="manim media directory")
+    parser.add_argument("--report", default=str(DEFAULT_REPORT), help="where to write the JSON report")
+    parser.add_argument("--disable-caching", action="store_true", help="ignore manim's partial movie cache")
+    parser.add_argument("--list", action="store_true", help="list the matching scenes and exit")
+    parser.add_argument("--fork-server", action="store_true", help="fork every render from a warm manim process")
+    parser.add_argument("--seed", help="mix this override into every scene's random seed (see code/seeding.py)")
+    parser.add_argument(
+        "--sections", help="render only this section or first:last range of sectioned scenes (see code/sections.py)"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="write a speedscope timing trace per scene to <media-dir>/profiles"
+    )
+    parser.add_argument(
+        "--precompile-tex", action="store_true", help="compile the scenes' LaTeX in parallel before rendering"
+    )
+    parser.add_argument(
+        "-i", "--interactive", action="store_true", help="keep the fork server up and read scene patterns from stdin"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scenes = select_scenes(discover_scenes(), args.patterns)
+    if args.list:
+        for path, name in scenes:
+            print(scene_id(path, name))
+        return 0
+    if not scenes:
+        print("No scenes matched.", file=sys.stderr)
+        return 1
+
+    options = {
+        "quality": args.quality,
+        "media_dir": args.media_dir,
+        "disable_caching": args.disable_caching,
+        "profile": args.profile,
+    }
+    if args.seed is not None:
+        # Workers inherit the environment; code/seeding.py reads it
+        os.environ["SCENE_SEED"] = args.seed
+    if args.sections is not None:
+        os.environ["SCENE_SECTIONS"] = args.sections
+    if args.precompile_tex:
+        from precompile_tex import precompile
+
+        summary = precompile(scenes, args.workers, args.media_dir)
+        print(f"Precompiled {summary['compiled']} LaTeX expressions in {summary['wall_time']:.1f}s")
+    fork_server = args.fork_server or args.interactive
+    with make_executor(args.workers, fork_server) as executor:
+        status = 0
+        # In interactive mode an initial batch is only rendered when asked for
+        if args.patterns or not args.interactive:
+            status = summarize(render_batch(executor, args.workers, scenes, options, args.report), args.report)
+        if args.interactive:
+            status = interactive(executor, args.workers, options, args.report)
+    return status
+
+
+def summarize(report, report_path):
+    failed = [e for e in report["scenes"] if e["status"] != "ok"]
+    print(
+        f"Rendered {len(report['scenes']) - len(failed)}/{len(report['scenes'])} scenes "
+        f"in {report['total_wall_time']:.1f}s with {report['workers']} workers -> {report_path}"
+    )
+    return 1 if failed else 0
+
+
+def interactive(executor, workers, options, report_path):
+    while True:
+        try:
+            line = input("render> ").strip()
+        except EOFError:
+            return 0
+        if line in ("q", "quit", "exit"):
+            return 0
+        if not line:
+            continue
+        # Rediscover so newly added scenes are picked up without a restart
+        scenes = select_scenes(discover_scenes(), line.split())
+        if not scenes:
+            print("No scenes matched.")
+            continue
+        summarize(render_batch(executor, workers, scenes, options, report_path), report_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""Opt-in timing instrumentation for scene renders, written as speedscope traces.
+
+``SceneProfiler.install()`` wraps the manim entry points that dominate a
+render, so a slow scene shows which ``play`` call or updater is responsible:
+
+* ``Scene.render`` and the scene's ``construct``
+* ``Scene.play``, ``Scene.wait`` and ``ThreeDScene.move_camera``, labelled with
+  the scene file and line they were called from (and the animation types)
+* every updater registered with ``Mobject.add_updater``, labelled with the
+  updater's own name and definition line, plus ``Scene.update_mobjects``
+* the per-frame animation step (``Scene.update_to_time``), camera capture
+  (``Camera.capture_mobjects``) and encoding (``SceneFileWriter.write_frame``)
+
+Spans nest as the calls do. The result is an evented profile in the
+speedscope format (https://www.speedscope.app), which is also plain JSON:
+
+    profiler = SceneProfiler().install()
+    scene.render()
+    profiler.uninstall()
+    profiler.write("media/profiles/MLPZoomNetwork.speedscope.json", "MLPZoomNetwork")
+
+``python render_all.py --profile`` does this for every rendered scene.
+"""
+
+import functools
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+def _code_location(func):
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return ""
+    return f" ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _caller_location():
+    """``file:line`` of the innermost caller outside manim and this module."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith("manim") and module != __name__:
+            return f"{Path(frame.f_code.co_filename).name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?"
+
+
+class SceneProfiler:
+    """Records nested wall-time spans of one render."""
+
+    def __init__(self):
+        self.frame_names = []
+        self.frame_index = {}
+        self.events = []
+        self.start = time.perf_counter()
+        self._patched = []
+
+    def _frame(self, name):
+        index = self.frame_index.get(name)
+        if index is None:
+            index = self.frame_index[name] = len(self.frame_names)
+            self.frame_names.append(name)
+        return index
+
+    @contextmanager
+    def span(self, name):
+        frame = self._frame(name)
+        self.events.append(("O", frame, time.perf_counter() - self.start))
+        try:
+            yield
+        finally:
+            self.events.append(("C", frame, time.perf_counter() - self.start))
+
+    def _patch(self, owner, attribute, make_wrapper):
+        original = getattr(owner, attribute)
+        self._patched.append((owner, attribute, original))
+        setattr(owner, attribute, functools.wraps(original)(make_wrapper(original)))
+
+    def _timed(self, name):
+        """Wrapper factory timing every call under a fixed ``name``."""
+
+        def make_wrapper(original):
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return original(*args, **kwargs)
+
+            return wrapper
+
+        return make_wrapper
+
+    def _timed_call_site(self, label, describe=None):
+        """Wrapper factory naming each call by its caller's location (and ``describe(args)``)."""
+
+        def make_wrapper(original):
+            def wrapper(scene, *args, **kwargs):
+                name = f"{label} ({_caller_location()})"
+                if describe is not None:
+                    name += describe(args)
+                with self.span(name):
+                    return original(scene, *args, **kwargs)
+
+            return wrapper
+
+        return make_wrapper
+
+    def wrap_updater(self, updater):
+        """Timed version of an updater, keeping its signature (``dt`` detection) intact."""
+        if getattr(updater, "_profiled", False):
+            return updater
+        name = f"updater {getattr(updater, '__qualname__', repr(updater))}{_code_location(updater)}"
+
+        @functools.wraps(updater)
+        def timed_updater(*args, **kwargs):
+            with self.span(name):
+                return updater(*args, **kwargs)
+
+        timed_updater._profiled = True
+        return timed_updater
+
+    def install(self):
+        from manim import Camera, Mobject, Scene, SceneFileWriter, ThreeDScene
+
+        profiler = self
+
+        def describe_animations(args):
+            names = [type(a).__name__ for a in args if hasattr(a, "interpolate")]
+            return f" {', '.join(names)}" if names else ""
+
+        def render_wrapper(original):
+            def render(scene, *args, **kwargs):
+                # Time construct on this instance only
+                construct = scene.construct
+                scene.construct = lambda: profiler._run_span("construct", construct)
+                with profiler.span(f"render {type(scene).__name__}"):
+                    return original(scene, *args, **kwargs)
+
+            return render
+
+        def add_updater_wrapper(original):
+            def add_updater(mobject, update_function, *args, **kwargs):
+                return original(mobject, profiler.wrap_updater(update_function), *args, **kwargs)
+
+            return add_updater
+
+        def remove_updater_wrapper(original):
+            def remove_updater(mobject, update_function):
+                for updater in list(mobject.updaters):
+                    if getattr(updater, "__wrapped__", None) is update_function:
+                        original(mobject, updater)
+                return original(mobject, update_function)
+
+            return remove_updater
+
+        self._patch(Scene, "render", render_wrapper)
+        self._patch(Scene, "play", self._timed_call_site("play", describe_animations))
+        self._patch(Scene, "wait", self._timed_call_site("wait"))
+        self._patch(ThreeDScene, "move_camera", self._timed_call_site("move_camera"))
+        self._patch(Scene, "update_to_time", self._timed("animation frame"))
+        self._patch(Scene, "update_mobjects", self._timed("update_mobjects"))
+        self._patch(Camera, "capture_mobjects", self._timed("capture"))
+        self._patch(SceneFileWriter, "write_frame", self._timed("encode"))
+        self._patch(Mobject, "add_updater", add_updater_wrapper)
+        self._patch(Mobject, "remove_updater", remove_updater_wrapper)
+        return self
+
+    def _run_span(self, name, func):
+        with self.span(name):
+            return func()
+
+    def uninstall(self):
+        for owner, attribute, original in reversed(self._patched):
+            setattr(owner, attribute, original)
+        self._patched = []
+
+    def summary(self, top=10):
+        """The ``top`` spans by self time (excluding nested spans), with call counts and totals.
+
+        Totals count recursive calls of the same span once.
+        """
+        calls, self_times, totals, depth = {}, {}, {}, {}
+        stack = []
+        for kind, frame, at in self.events:
+            if kind == "O":
+                stack.append([frame, at, 0.0])
+                calls[frame] = calls.get(frame, 0) + 1
+                depth[frame] = depth.get(frame, 0) + 1
+                continue
+            frame, opened, children = stack.pop()
+            duration = at - opened
+            self_times[frame] = self_times.get(frame, 0.0) + duration - children
+            depth[frame] -= 1
+            if depth[frame] == 0:
+                totals[frame] = totals.get(frame, 0.0) + duration
+            if stack:
+                stack[-1][2] += duration
+        ranked = sorted(self_times, key=self_times.get, reverse=True)[:top]
+        return [
+            {
+                "name": self.frame_names[f],
+                "calls": calls[f],
+                "self": round(self_times[f], 4),
+                "total": round(totals[f], 4),
+            }
+            for f in ranked
+        ]
+
+    def speedscope(self, name):
+        end = self.events[-1][2] if self.events else 0.0
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "scene_profiler.py",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": frame} for frame in self.frame_names]},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0.0,
+                    "endValue": end,
+                    "events": [{"type": kind, "frame": frame, "at": at} for kind, frame, at in self.events],
+                }
+            ],
+        }
+
+    def write(self, path, name):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.speedscope(name)))
+        return path